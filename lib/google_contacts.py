@@ -7,6 +7,12 @@ from lib.google_auth import get_access_token
 from lib.utils import retry_with_backoff
 from lib.circuit_breaker import get_google_contacts_breaker
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 GOOGLE_PEOPLE_API_BASE = "https://people.googleapis.com/v1"
 
 # Configure timeout and retry settings
@@ -21,6 +27,13 @@ logger = logging.getLogger(__name__)
 _contacts_breaker = get_google_contacts_breaker()
 
 
+def _response_json(response: httpx.Response) -> Any:
+    """Parse a People API response body, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def format_exception(e: Exception) -> str:
     """Format exception with type name when str(e) is empty (e.g., timeouts)."""
     msg = str(e)
@@ -89,7 +102,7 @@ async def get_contact_groups(access_token: str) -> Dict[str, str]:
             params={"pageSize": 1000}
         )
         response.raise_for_status()
-        data = response.json()
+        data = _response_json(response)
 
         for group in data.get("contactGroups", []):
             resource_name = group.get("resourceName")
@@ -123,7 +136,7 @@ async def get_contact(access_token: str, resource_name: str) -> Dict[str, Any]:
             params={"personFields": fields}
         )
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
 
 async def get_all_contacts(access_token: str) -> List[Dict[str, Any]]:
     """
@@ -153,7 +166,7 @@ async def get_all_contacts(access_token: str) -> List[Dict[str, Any]]:
                     params=params
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = _response_json(response)
 
             connections = data.get("connections", [])
             contacts.extend(connections)
@@ -355,7 +368,7 @@ async def create_contact_group(access_token: str, name: str) -> Dict[str, Any]:
             json=body
         )
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
 
 def calculate_memberships(
     target_location: Optional[str], 
@@ -460,7 +473,7 @@ async def create_contact(
             json=body
         )
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
 
 @retry_with_backoff(
     max_retries=3,
@@ -507,7 +520,7 @@ async def update_contact(
             json=body
         )
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
 
 @retry_with_backoff(
     max_retries=3,
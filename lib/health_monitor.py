@@ -721,6 +721,8 @@ if __name__ == "__main__":
     import sys
     
     async def main():
+        from lib.telegram_client import close_client
+
         quick = "--quick" in sys.argv
         telegram = "--telegram" in sys.argv
         
@@ -731,7 +733,10 @@ if __name__ == "__main__":
             print(f"Database: {db.status.value} - {db.message}")
         else:
             print("Running full health check...")
-            report = await run_health_check(send_telegram=telegram)
+            try:
+                report = await run_health_check(send_telegram=telegram)
+            finally:
+                await close_client()
             
             monitor = SystemHealthMonitor()
             print(monitor.format_report_markdown(report))
@@ -1,10 +1,53 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
+from typing import List, Optional
 from lib.supabase_client import supabase
 import logging
 import json
 
 logger = logging.getLogger(__name__)
 
+# Rows per insert while events are buffered by batched_sync_events()
+LOG_FLUSH_SIZE = 200
+
+# Buffer of pending sync_logs rows for the current task, None when not batching
+_log_buffer: ContextVar[Optional[List[dict]]] = ContextVar("sync_log_buffer", default=None)
+
+
+def _log_to_console(event_type: str, status: str, message: str):
+    log_msg = f"[{event_type.upper()}] {message}"
+    if status.lower() in ["error", "fatal"]:
+        logger.error(log_msg)
+    elif status.lower() == "warning":
+        logger.warning(log_msg)
+    else:
+        logger.info(log_msg)
+
+
+def _sync_log_row(event_type: str, status: str, message: str, details: dict = None) -> dict:
+    # Stamped at log time: buffered rows are inserted together, so the
+    # column default would give a whole batch the same created_at
+    payload = {
+        "event_type": event_type,
+        "status": status,
+        "message": message,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+    
+    if details:
+         payload["message"] += f" | Details: {json.dumps(details)}"
+    return payload
+
+
+def _insert_sync_logs(rows):
+    """Insert a batch of sync_logs rows, logging (not raising) on failure."""
+    try:
+        supabase.table("sync_logs").insert(rows).execute()
+    except Exception as e:
+        logger.error(f"Failed to write to sync_logs: {e}")
+
 
 def log_sync_event_sync(event_type: str, status: str, message: str, contact_id: str = None, details: dict = None):
     """
@@ -19,26 +62,11 @@ def log_sync_event_sync(event_type: str, status: str, message: str, contact_id:
         details: Optional dictionary with additional details
     """
     # 1. Print to console/file logs
-    log_msg = f"[{event_type.upper()}] {message}"
-    if status.lower() in ["error", "fatal"]:
-        logger.error(log_msg)
-    elif status.lower() == "warning":
-        logger.warning(log_msg)
-    else:
-        logger.info(log_msg)
+    _log_to_console(event_type, status, message)
 
     # 2. Write to Supabase
     try:
-        payload = {
-            "event_type": event_type,
-            "status": status,
-            "message": message,
-        }
-        
-        if details:
-             payload["message"] += f" | Details: {json.dumps(details)}"
-
-        supabase.table("sync_logs").insert(payload).execute()
+        supabase.table("sync_logs").insert(_sync_log_row(event_type, status, message, details)).execute()
         
     except Exception as e:
         logger.error(f"Failed to write to sync_logs: {e}")
@@ -47,6 +75,44 @@ def log_sync_event_sync(event_type: str, status: str, message: str, contact_id:
 async def log_sync_event(event_type: str, status: str, message: str, contact_id: str = None, details: dict = None):
     """
     Async version of log_sync_event (for backwards compatibility).
-    Internally calls the sync version since Supabase client is sync anyway.
+    Runs the sync version in a worker thread, since the Supabase client is
+    sync and would otherwise block the event loop during the insert.
+    
+    Inside batched_sync_events() the row is buffered instead and written
+    with the next LOG_FLUSH_SIZE rows; console logging is still immediate.
+    """
+    buffer = _log_buffer.get()
+    if buffer is None:
+        await asyncio.to_thread(log_sync_event_sync, event_type, status, message, contact_id, details)
+        return
+
+    _log_to_console(event_type, status, message)
+    try:
+        buffer.append(_sync_log_row(event_type, status, message, details))
+    except Exception as e:
+        logger.error(f"Failed to write to sync_logs: {e}")
+    if len(buffer) >= LOG_FLUSH_SIZE:
+        await _flush(buffer)
+
+
+async def _flush(buffer: List[dict]):
+    rows = buffer[:]
+    buffer.clear()
+    if rows:
+        await asyncio.to_thread(_insert_sync_logs, rows)
+
+
+@asynccontextmanager
+async def batched_sync_events():
     """
-    log_sync_event_sync(event_type, status, message, contact_id, details)
+    Buffer log_sync_event rows logged in this task (and tasks it starts)
+    and insert them in batches, flushing whatever is left on exit --
+    including when the block raises.
+    """
+    buffer: List[dict] = []
+    token = _log_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _log_buffer.reset(token)
+        await _flush(buffer)
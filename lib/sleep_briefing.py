@@ -71,18 +71,13 @@ def run_sleep_briefing_if_needed(supabase_client: Any) -> dict[str, Any] | None:
     for attempt in range(MAX_RETRIES + 1):
         try:
             from lib.health_insights import generate_daily_briefing, format_daily_telegram
-            from lib.telegram_client import send_telegram_message
-            import asyncio
+            from lib.telegram_client import run_blocking, send_telegram_message
 
             logger.info(f"Generating reactive daily health briefing (attempt {attempt + 1})")
             result = generate_daily_briefing(supabase_client)
 
             msg = format_daily_telegram(result)
-            loop = asyncio.new_event_loop()
-            try:
-                loop.run_until_complete(send_telegram_message(msg))
-            finally:
-                loop.close()
+            run_blocking(send_telegram_message(msg))
 
             logger.info(f"Daily health briefing delivered: {len(result.get('briefing_text', ''))} chars")
 
@@ -98,13 +93,7 @@ def run_sleep_briefing_if_needed(supabase_client: Any) -> dict[str, Any] | None:
 
                 if custom_resp.data:
                     chart_bytes = generate_multi_night_trends(custom_resp.data, 14)
-                    loop2 = asyncio.new_event_loop()
-                    try:
-                        loop2.run_until_complete(
-                            send_telegram_photo(chart_bytes, caption="Sleep trends (14 nights)")
-                        )
-                    finally:
-                        loop2.close()
+                    run_blocking(send_telegram_photo(chart_bytes, caption="Sleep trends (14 nights)"))
                     logger.info("Trends chart sent with daily briefing")
             except Exception as chart_err:
                 logger.warning(f"Failed to send trends chart (non-fatal): {chart_err}")
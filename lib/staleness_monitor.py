@@ -8,7 +8,6 @@ Withings compresses raw HR/HRV data after ~24h, so syncing promptly
 preserves the detailed epoch data needed for custom sleep staging.
 """
 
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -27,7 +26,7 @@ def check_withings_freshness(supabase_client: Any) -> dict[str, Any]:
     Returns:
         Status dict with action taken.
     """
-    from lib.telegram_client import send_telegram_message
+    from lib.telegram_client import run_blocking, send_telegram_message
 
     now_sgt = datetime.now(timezone.utc) + SGT
     today = now_sgt.strftime("%Y-%m-%d")
@@ -60,10 +59,6 @@ def check_withings_freshness(supabase_client: Any) -> dict[str, Any]:
     )
 
     logger.info(f"No sleep data for {today}, sending reminder")
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(send_telegram_message(msg, force=True))
-    finally:
-        loop.close()
+    run_blocking(send_telegram_message(msg, force=True))
 
     return {"status": "reminder_sent", "date": today}
@@ -29,16 +29,35 @@ v2 Changes:
 """
 
 import os
+import asyncio
+import atexit
+import hashlib
+import importlib.util
+import json
 import logging
 import argparse
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional, Tuple, Generic, TypeVar
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from datetime import date, datetime, timezone, timedelta
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Generic, TypeVar
 from dataclasses import dataclass, field
 from enum import Enum
 import httpx
 from functools import wraps
+from itertools import islice
+from operator import itemgetter
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # ============================================================================
 # CONFIGURATION
@@ -51,10 +70,17 @@ SUPABASE_KEY = os.environ.get('SUPABASE_KEY')
 # Safety valve threshold - abort if source has <10% of destination
 # Configurable via environment variables for operational flexibility
 SAFETY_VALVE_THRESHOLD = float(os.environ.get('SAFETY_VALVE_THRESHOLD', '0.1'))
+# The threshold in basis points, so the ratio check can stay in integers
+SAFETY_VALVE_THRESHOLD_BP = round(SAFETY_VALVE_THRESHOLD * 10_000)
 SAFETY_VALVE_MIN_RECORDS = int(os.environ.get('SAFETY_VALVE_MIN_RECORDS', '10'))
 # Mode: "abort" (default) = stop sync, "warn" = log warning but continue
 SAFETY_VALVE_MODE = os.environ.get('SAFETY_VALVE_MODE', 'abort').lower()
 
+# Supabase (PostgREST) rows per paginated GET. Must not exceed the project's
+# max_rows setting (1000 on Supabase by default): a page shorter than this is
+# taken as the last one. Raise both together to cut round-trips on big tables.
+SUPABASE_PAGE_SIZE = int(os.environ.get('SUPABASE_PAGE_SIZE', '1000'))
+
 # Notion API limits
 MAX_BLOCKS_PER_REQUEST = 100  # Notion allows max 100 blocks per append request
 
@@ -64,9 +90,15 @@ MAX_BLOCKS_PER_REQUEST = 100  # Notion allows max 100 blocks per append request
 # ============================================================================
 
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
-    """Create a consistently formatted logger."""
+    """Create a consistently formatted logger.
+
+    Safe to call repeatedly: the handler is attached once, and the level is
+    only set when it differs, since setLevel flushes the level cache of
+    every logger in the process.
+    """
     logger = logging.getLogger(name)
-    logger.setLevel(level)
+    if logger.level != level:
+        logger.setLevel(level)
 
     if not logger.handlers:
         handler = logging.StreamHandler()
@@ -113,13 +145,66 @@ def _extract_retry_after(response: httpx.Response) -> Optional[float]:
     return None
 
 
+# HTTP statuses worth retrying: request timeout, rate limit and transient
+# gateway/server failures. Anything else (validation, auth, 501...) fails fast.
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+# Metrics of the sync running in this context. Retry decorators report into
+# it so SyncMetrics.retries / rate_limit_events reflect client-level retries.
+_current_metrics: ContextVar[Optional['SyncMetrics']] = ContextVar('current_sync_metrics', default=None)
+
+
+def _retry_delay(error: Exception, attempt: int, base_delay: float) -> float:
+    """Seconds to wait before retrying after error; re-raises it if not retryable.
+
+    - Only HTTP 408/429/500/502/503/504 are retried; other statuses raise
+    - 429 uses the Retry-After header when available (capped at 60s), else a
+      longer exponential backoff
+    - Backoff gets up to base_delay of random jitter so parallel sync
+      workers do not retry in lockstep
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status not in _RETRYABLE_STATUS_CODES:
+            # Non-retryable error (400, 401, 403, 404, 501, etc.)
+            raise error
+        if status == 429:
+            retry_after = _extract_retry_after(error.response)
+            if retry_after and retry_after > 0:
+                return min(retry_after, MAX_RETRY_AFTER_SECONDS)
+            return base_delay * (2 ** (attempt + 1)) + random.uniform(0, base_delay)
+    return base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+
+
+def _announce_retry(logger: logging.Logger, func_name: str, error: Exception,
+                    attempt: int, max_retries: int, delay: float):
+    """Log an upcoming retry and count it on the current sync's metrics."""
+    rate_limited = isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429
+    if rate_limited:
+        logger.warning(
+            f"Rate limited (429) in {func_name}, attempt {attempt + 1}/{max_retries}. "
+            f"Waiting {delay:.1f}s before retry."
+        )
+    else:
+        logger.warning(
+            f"Transient error in {func_name}, attempt {attempt + 1}/{max_retries}: "
+            f"{type(error).__name__}. Retrying in {delay:.1f}s."
+        )
+
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.retries += 1
+        if rate_limited:
+            metrics.rate_limit_events += 1
+
+
 def retry_on_error(max_retries: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,)):
     """Decorator for automatic retry with exponential backoff.
 
-    Includes specific handling for HTTP 429 (rate limit) responses:
-    - Uses the Retry-After header value when available
-    - Applies longer exponential backoff for rate-limited requests
-    - Does not retry non-retryable 4xx errors (except 429)
+    See _retry_delay for which errors are retried and how long it waits.
+    Retries are counted on the SyncMetrics of the sync currently running.
     """
     def decorator(func):
         @wraps(func)
@@ -131,35 +216,9 @@ def retry_on_error(max_retries: int = 3, base_delay: float = 1.0, exceptions: tu
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-
-                    # For HTTP errors, only retry 429 and 5xx
-                    if isinstance(e, httpx.HTTPStatusError):
-                        status = e.response.status_code
-                        if status == 429:
-                            # Rate limited - use Retry-After header if available
-                            retry_after = _extract_retry_after(e.response)
-                            if retry_after and retry_after > 0:
-                                delay = retry_after
-                            else:
-                                # Exponential backoff with longer base for rate limits
-                                delay = base_delay * (2 ** (attempt + 1))
-                            if attempt < max_retries - 1:
-                                logger.warning(
-                                    f"Rate limited (429) in {func.__name__}, attempt {attempt + 1}/{max_retries}. "
-                                    f"Waiting {delay:.1f}s before retry."
-                                )
-                                time.sleep(delay)
-                                continue
-                        elif status < 500:
-                            # Non-retryable client error (400, 401, 403, 404, etc.)
-                            raise
-
+                    delay = _retry_delay(e, attempt, base_delay)
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(
-                            f"Transient error in {func.__name__}, attempt {attempt + 1}/{max_retries}: "
-                            f"{type(e).__name__}. Retrying in {delay:.1f}s."
-                        )
+                        _announce_retry(logger, func.__name__, e, attempt, max_retries, delay)
                         time.sleep(delay)
             raise last_exception
         return wrapper
@@ -169,9 +228,8 @@ def retry_on_error(max_retries: int = 3, base_delay: float = 1.0, exceptions: tu
 def retry_on_error_async(max_retries: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,)):
     """Async decorator for automatic retry with exponential backoff.
 
-    Includes specific handling for HTTP 429 (rate limit) responses.
+    Same retry policy as retry_on_error.
     """
-    import asyncio
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -182,32 +240,9 @@ def retry_on_error_async(max_retries: int = 3, base_delay: float = 1.0, exceptio
                     return await func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-
-                    # For HTTP errors, only retry 429 and 5xx
-                    if isinstance(e, httpx.HTTPStatusError):
-                        status = e.response.status_code
-                        if status == 429:
-                            retry_after = _extract_retry_after(e.response)
-                            if retry_after and retry_after > 0:
-                                delay = retry_after
-                            else:
-                                delay = base_delay * (2 ** (attempt + 1))
-                            if attempt < max_retries - 1:
-                                logger.warning(
-                                    f"Rate limited (429) in {func.__name__}, attempt {attempt + 1}/{max_retries}. "
-                                    f"Waiting {delay:.1f}s before retry."
-                                )
-                                await asyncio.sleep(delay)
-                                continue
-                        elif status < 500:
-                            raise
-
+                    delay = _retry_delay(e, attempt, base_delay)
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(
-                            f"Transient error in {func.__name__}, attempt {attempt + 1}/{max_retries}: "
-                            f"{type(e).__name__}. Retrying in {delay:.1f}s."
-                        )
+                        _announce_retry(logger, func.__name__, e, attempt, max_retries, delay)
                         await asyncio.sleep(delay)
             raise last_exception
         return wrapper
@@ -224,9 +259,13 @@ class SyncDirection(Enum):
     MULTI_SOURCE = "multi_source"
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncStats:
-    """Statistics from a sync operation."""
+    """Statistics from a sync operation.
+
+    Slotted: one of these is created per sync and its counters are bumped
+    once per record, so attribute access stays off the instance dict.
+    """
     created: int = 0
     updated: int = 0
     deleted: int = 0
@@ -248,7 +287,7 @@ class SyncStats:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncMetrics:
     """
     Enhanced observability metrics for sync operations.
@@ -285,9 +324,14 @@ class SyncMetrics:
     orphaned_records: int = 0
     duplicate_records: int = 0
     conflict_resolutions: int = 0
+
+    # Fixed by finish() so later reads skip the datetime arithmetic
+    _finished_duration: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def total_duration_seconds(self) -> float:
+        if self._finished_duration is not None:
+            return self._finished_duration
         if self.end_time:
             return (self.end_time - self.start_time).total_seconds()
         return (datetime.now(timezone.utc) - self.start_time).total_seconds()
@@ -302,11 +346,15 @@ class SyncMetrics:
     def finish(self):
         """Mark the sync as complete."""
         self.end_time = datetime.now(timezone.utc)
+        self._finished_duration = (self.end_time - self.start_time).total_seconds()
     
     def to_dict(self) -> Dict:
+        # Read the clock once so total_seconds and records_per_second agree
+        total_seconds = self.total_duration_seconds
+        records_per_second = self.records_read / total_seconds if total_seconds > 0 else 0.0
         return {
             'timing': {
-                'total_seconds': round(self.total_duration_seconds, 2),
+                'total_seconds': round(total_seconds, 2),
                 'notion_deletions_seconds': round(self.notion_deletions_duration, 2),
                 'supabase_deletions_seconds': round(self.supabase_deletions_duration, 2),
                 'notion_to_supabase_seconds': round(self.notion_to_supabase_duration, 2),
@@ -335,12 +383,12 @@ class SyncMetrics:
                 'conflict_resolutions': self.conflict_resolutions,
             },
             'throughput': {
-                'records_per_second': round(self.records_per_second, 2),
+                'records_per_second': round(records_per_second, 2),
             }
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of a complete sync operation."""
     success: bool
@@ -365,36 +413,210 @@ class SyncResult:
         }
 
 
+@dataclass(slots=True)
+class NotionPage:
+    """Slotted view of a Notion page for per-record sync loops.
+    
+    The fields syncs read for every record are plain attributes; the API
+    object stays in raw. get() and [] read raw, so convert_from_source
+    implementations written against page dicts work unchanged.
+    """
+    id: str
+    last_edited_time: Optional[str]
+    properties: Dict[str, Any]
+    raw: Dict[str, Any] = field(repr=False)
+    
+    @classmethod
+    def from_api(cls, page: Dict) -> 'NotionPage':
+        return cls(page['id'], page.get('last_edited_time'), page.get('properties', {}), page)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+
+# ============================================================================
+# JSON (DE)SERIALIZATION
+# ============================================================================
+
+def _json_default(obj: Any) -> Any:
+    """Encode values JSON has no type for, so callers need not pre-convert them."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request body, using orjson when it is installed.
+
+    Datetimes and dates become ISO 8601 strings, and non-string dict keys
+    are stringified, with either backend.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse a response body, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _content_hash(obj: Any) -> str:
+    """Short stable fingerprint of a JSON-like value, as 16 hex characters.
+
+    Keys are sorted and both JSON backends emit the same compact form, so
+    equal values hash equally wherever they were computed.
+    """
+    if HAS_ORJSON:
+        payload = orjson.dumps(obj, default=_json_default, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(
+            obj, default=_json_default, sort_keys=True, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+# ============================================================================
+# SHARED HTTP CONNECTION POOLS
+# ============================================================================
+
+# Advertise brotli only when httpx can decode it (brotli/brotlicffi installed);
+# otherwise a br-encoded body would reach the JSON decoder undecoded.
+_ACCEPT_ENCODING = (
+    'gzip, br'
+    if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi')
+    else 'gzip'
+)
+
+_HTTP_LIMITS = httpx.Limits(max_connections=40, max_keepalive_connections=20, keepalive_expiry=60)
+_shared_transports: Dict[str, httpx.HTTPTransport] = {}
+_shared_transports_lock = threading.Lock()
+
+
+def _shared_transport(base_url: str) -> httpx.HTTPTransport:
+    """Return the process-wide HTTP/2 connection pool for a host.
+
+    Every NotionClient / SupabaseClient talking to the same base URL sends
+    its requests through this transport, so per-table clients multiplex over
+    one TLS connection instead of each doing their own handshake. Clients
+    keep their own default headers; only the pool is shared. The pool lives
+    for the whole process and is closed at interpreter exit.
+    """
+    with _shared_transports_lock:
+        transport = _shared_transports.get(base_url)
+        if transport is None:
+            transport = httpx.HTTPTransport(http2=True, limits=_HTTP_LIMITS)
+            atexit.register(transport.close)
+            _shared_transports[base_url] = transport
+        return transport
+
+
+class _PooledTransport(httpx.BaseTransport):
+    """Per-client handle on a shared pool whose close() leaves the pool open.
+
+    Lets each API client be closed (e.g. via its context manager) without
+    tearing down connections other clients are still using.
+    """
+
+    def __init__(self, pool: httpx.HTTPTransport):
+        self._pool = pool
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._pool.handle_request(request)
+
+    def close(self):
+        pass  # The shared pool is closed at interpreter exit
+
+
 # ============================================================================
 # UNIFIED NOTION CLIENT
 # ============================================================================
 
+# Block types whose text lives in block[type]['rich_text']
+_TEXT_BLOCK_TYPES = frozenset({
+    'paragraph', 'heading_1', 'heading_2', 'heading_3',
+    'bulleted_list_item', 'numbered_list_item', 'to_do',
+    'toggle', 'quote', 'callout'
+})
+
+# Display prefix per block type when flattening pages to text
+_BLOCK_PREFIXES = {
+    'heading_1': '# ',
+    'heading_2': '## ',
+    'heading_3': '### ',
+    'bulleted_list_item': '• ',
+    'numbered_list_item': '- ',
+    'to_do': '☐ ',
+    'quote': '> ',
+    'callout': '💡 ',
+    'toggle': '▶ ',
+}
+
+_get_plain_text = itemgetter('plain_text')
+# Every block the API returns carries 'type' and 'id'; only has_children is
+# read with .get() in the traversal below
+_get_block_type = itemgetter('type')
+_get_block_id = itemgetter('id')
+
+
+def _plain_text(rich_text: List[Dict]) -> str:
+    """Concatenate plain_text across a rich text array.
+
+    Notion always includes plain_text, so the fast path indexes directly;
+    hand-built or partial arrays fall back to .get().
+    """
+    try:
+        return ''.join(map(_get_plain_text, rich_text))
+    except KeyError:
+        return ''.join([t.get('plain_text', '') for t in rich_text])
+
+
 class NotionClient:
     """
     Unified Notion API client with retry logic.
     
     Usage:
+        with NotionClient(NOTION_API_TOKEN) as notion:
+            pages = notion.query_database(database_id)
+
         notion = NotionClient(NOTION_API_TOKEN)
         pages = notion.query_database(database_id)
         page = notion.get_page(page_id)
         notion.create_page(database_id, properties)
         notion.update_page(page_id, properties)
     """
+
+    SCHEMA_CACHE_TTL = 300  # seconds
+    _schema_cache: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
     
     def __init__(self, token: str):
         self.headers = {
             'Authorization': f'Bearer {token}',
             'Notion-Version': '2022-06-28',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Accept-Encoding': _ACCEPT_ENCODING
         }
-        self.client = httpx.Client(headers=self.headers, timeout=30.0)
+        self.client = httpx.Client(
+            headers=self.headers,
+            timeout=30.0,
+            transport=_PooledTransport(_shared_transport('https://api.notion.com')),
+        )
         self.logger = setup_logger('NotionClient')
+
+    def close(self):
+        self.client.close()
+
+    def __enter__(self) -> 'NotionClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
     
-    def __del__(self):
-        if hasattr(self, 'client'):
-            self.client.close()
-    
-    @retry_on_error(max_retries=3, base_delay=1.0)
     def query_database(
         self, 
         database_id: str, 
@@ -403,7 +625,48 @@ class NotionClient:
         page_size: int = 100
     ) -> List[Dict]:
         """Query all pages from a Notion database with automatic pagination."""
-        results = []
+        return list(self.iter_database(database_id, filter=filter, sorts=sorts, page_size=page_size))
+
+    def query_pages(
+        self,
+        database_id: str,
+        filter: Optional[Dict] = None,
+        sorts: Optional[List[Dict]] = None
+    ) -> List[NotionPage]:
+        """query_database, with each page wrapped in a NotionPage."""
+        return [NotionPage.from_api(page) for page in self.iter_database(database_id, filter=filter, sorts=sorts)]
+
+    def iter_page_ids(self, database_id: str, filter: Optional[Dict] = None) -> Iterator[str]:
+        """Yield the ID of every page in a database, one response in memory at a time."""
+        return (page['id'] for page in self.iter_database(database_id, filter=filter))
+
+    def count_pages(self, database_id: str, filter: Optional[Dict] = None, limit: Optional[int] = None) -> int:
+        """Count pages in a Notion database.
+
+        Notion has no count endpoint, so this still pages through results,
+        but with a limit it stops as soon as that many pages were seen and
+        returns limit. Callers that only need to know whether a count
+        crosses some bound should pass it.
+        """
+        if limit is not None and limit <= 0:
+            return 0
+        page_size = min(limit, 100) if limit else 100
+        pages = self.iter_database(database_id, filter=filter, page_size=page_size)
+        return sum(1 for _ in islice(pages, limit))
+
+    def iter_database(
+        self,
+        database_id: str,
+        filter: Optional[Dict] = None,
+        sorts: Optional[List[Dict]] = None,
+        page_size: int = 100
+    ) -> Iterator[Dict]:
+        """Yield pages from a Notion database as each response arrives.
+
+        Only one response is held in memory at a time, and callers can start
+        processing before pagination finishes. Each page request is retried
+        on its own, so a transient error does not restart the query.
+        """
         start_cursor = None
         
         while True:
@@ -415,27 +678,29 @@ class NotionClient:
             if start_cursor:
                 body["start_cursor"] = start_cursor
             
-            response = self.client.post(
-                f'https://api.notion.com/v1/databases/{database_id}/query',
-                json=body
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            results.extend(data.get('results', []))
+            data = self._post_query(database_id, body)
+            yield from data.get('results', [])
             
             if not data.get('has_more'):
                 break
             start_cursor = data.get('next_cursor')
-        
-        return results
+
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def _post_query(self, database_id: str, body: Dict) -> Dict:
+        """Fetch one page of database query results."""
+        response = self.client.post(
+            f'https://api.notion.com/v1/databases/{database_id}/query',
+            content=_json_dumps(body)
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
     
     @retry_on_error(max_retries=3, base_delay=1.0)
     def get_page(self, page_id: str) -> Dict:
         """Get a single Notion page by ID."""
         response = self.client.get(f'https://api.notion.com/v1/pages/{page_id}')
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     @retry_on_error(max_retries=3, base_delay=1.0)
     def create_page(self, database_id: str, properties: Dict, children: Optional[List] = None) -> Dict:
@@ -449,49 +714,54 @@ class NotionClient:
 
         response = self.client.post(
             'https://api.notion.com/v1/pages',
-            json=body
+            content=_json_dumps(body)
         )
 
         # Log full error response for debugging
         if not response.is_success:
             try:
-                error_data = response.json()
+                error_data = _json_loads(response.content)
                 self.logger.error(f"Notion API error creating page: {error_data}")
             except:
                 self.logger.error(f"Notion API error creating page (no JSON): {response.text}")
 
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     @retry_on_error(max_retries=3, base_delay=1.0)
     def update_page(self, page_id: str, properties: Dict) -> Dict:
         """Update an existing Notion page."""
         response = self.client.patch(
             f'https://api.notion.com/v1/pages/{page_id}',
-            json={"properties": properties}
+            content=_json_dumps({"properties": properties})
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     @retry_on_error(max_retries=3, base_delay=1.0)
     def archive_page(self, page_id: str) -> Dict:
-        """Archive (soft-delete) a Notion page. Safe to call if already archived."""
-        # First check if already archived
-        try:
-            get_resp = self.client.get(f'https://api.notion.com/v1/pages/{page_id}')
-            if get_resp.status_code == 200:
-                page_data = get_resp.json()
-                if page_data.get('archived') or page_data.get('in_trash'):
-                    return page_data  # Already archived, no action needed
-        except Exception:
-            pass  # Continue to try archiving
-        
+        """Archive (soft-delete) a Notion page. Safe to call if already archived.
+
+        Archiving is idempotent in Notion, so this is a single PATCH with no
+        precheck. Pages Notion refuses to edit because they are already
+        archived or in the trash come back as a 400 validation_error saying
+        so, which is treated as success. Any other 400 is raised.
+        """
         response = self.client.patch(
             f'https://api.notion.com/v1/pages/{page_id}',
-            json={"archived": True}
+            content=_json_dumps({"archived": True})
         )
+        if response.status_code == 400:
+            try:
+                error = _json_loads(response.content)
+            except ValueError:
+                error = {}
+            message = str(error.get('message', '')).lower()
+            if error.get('code') == 'validation_error' and ('archived' in message or 'trash' in message):
+                self.logger.info(f"Page {page_id} already archived")
+                return {"id": page_id, "archived": True, "already_archived": True}
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     @retry_on_error(max_retries=3, base_delay=1.0)
     def get_page_content(self, page_id: str, max_blocks: int = 100) -> List[Dict]:
@@ -501,31 +771,41 @@ class NotionClient:
             params={'page_size': max_blocks}
         )
         response.raise_for_status()
-        return response.json().get('results', [])
+        return _json_loads(response.content).get('results', [])
     
-    @retry_on_error(max_retries=3, base_delay=1.0)
     def get_all_blocks(self, page_id: str) -> List[Dict]:
         """Get ALL blocks from a page with pagination."""
-        blocks = []
+        return list(self.iter_blocks(page_id))
+
+    def iter_blocks(self, page_id: str) -> Iterator[Dict]:
+        """Yield a page's top-level blocks as each response arrives.
+
+        Notion returns at most 100 blocks per request, so only one such
+        response is held in memory at a time however long the page is.
+        """
         start_cursor = None
         
         while True:
-            url = f'https://api.notion.com/v1/blocks/{page_id}/children'
             params = {'page_size': 100}
             if start_cursor:
                 params['start_cursor'] = start_cursor
             
-            response = self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            blocks.extend(data.get('results', []))
+            data = self._get_children_page(page_id, params)
+            yield from data.get('results', [])
             
             if not data.get('has_more'):
                 break
             start_cursor = data.get('next_cursor')
-        
-        return blocks
+
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def _get_children_page(self, block_id: str, params: Dict) -> Dict:
+        """Fetch one page of a block's children."""
+        response = self.client.get(
+            f'https://api.notion.com/v1/blocks/{block_id}/children',
+            params=params
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
     
     def get_block_children(self, block_id: str) -> List[Dict]:
         """Get children of a specific block (for nested content)."""
@@ -538,24 +818,44 @@ class NotionClient:
             if response.status_code in [400, 404]:
                 return []
             response.raise_for_status()
-            return response.json().get('results', [])
+            return _json_loads(response.content).get('results', [])
         except Exception:
             return []
     
-    @retry_on_error(max_retries=3, base_delay=1.0)
-    def append_blocks(self, page_id: str, blocks: List[Dict], after: Optional[str] = None) -> List[Dict]:
-        """Append content blocks to a page, optionally after a specific block."""
-        if not blocks:
+    def append_blocks(self, page_id: str, blocks: Iterable[Dict], after: Optional[str] = None) -> List[Dict]:
+        """Append content blocks to a page, optionally after a specific block.
+
+        Lists longer than Notion's 100-block limit are sent in consecutive
+        chunks; when after is given, each chunk is placed after the last
+        block of the previous one so the original order is kept. blocks may
+        be a generator (e.g. from_structured_content_iter), in which case
+        only one chunk is built at a time.
+        """
+        blocks = iter(blocks)
+        chunk = list(islice(blocks, MAX_BLOCKS_PER_REQUEST))
+        if not chunk:
             return []
+        results: List[Dict] = []
+        while chunk:
+            chunk_results = self._append_chunk(page_id, chunk, after)
+            results.extend(chunk_results)
+            if after and chunk_results:
+                after = chunk_results[-1]['id']
+            chunk = list(islice(blocks, MAX_BLOCKS_PER_REQUEST))
+        return results
+
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def _append_chunk(self, page_id: str, blocks: List[Dict], after: Optional[str] = None) -> List[Dict]:
+        """Append up to MAX_BLOCKS_PER_REQUEST blocks in one request."""
         body: Dict[str, Any] = {"children": blocks}
         if after:
             body["after"] = after
         response = self.client.patch(
             f'https://api.notion.com/v1/blocks/{page_id}/children',
-            json=body
+            content=_json_dumps(body)
         )
         response.raise_for_status()
-        return response.json().get('results', [])
+        return _json_loads(response.content).get('results', [])
     
     @retry_on_error(max_retries=3, base_delay=1.0)
     def delete_block(self, block_id: str) -> bool:
@@ -575,47 +875,78 @@ class NotionClient:
         Returns:
             Tuple of (content_text, has_unsupported_blocks)
         """
-        blocks = self.get_all_blocks(page_id)
-        return self._extract_blocks_text(blocks, max_depth=max_depth)
+        return self._extract_blocks_text(self.iter_blocks(page_id), max_depth=max_depth)
     
-    def _extract_blocks_text(self, blocks: List[Dict], depth: int = 0, max_depth: int = 3) -> Tuple[str, bool]:
-        """Recursively extract text from blocks."""
+    def _extract_blocks_text(
+        self,
+        blocks: Iterable[Dict],
+        depth: int = 0,
+        max_depth: int = 3,
+    ) -> Tuple[str, bool]:
+        """Extract text from blocks and their nested children.
+
+        Children are prefetched one depth level at a time (see
+        _prefetch_children). The tree is then walked with an explicit
+        stack in page order.
+
+        has_unsupported reports unsupported blocks that are not themselves
+        nested inside another unsupported block.
+        """
+        blocks = list(blocks)
+        children = self._prefetch_children(blocks, depth, max_depth)
+
         text_parts = []
         has_unsupported = False
-        indent = "  " * depth
-        
-        for block in blocks:
-            block_type = block.get('type')
-            block_id = block.get('id')
-            has_children = block.get('has_children', False)
-            
-            # Handle unsupported blocks (AI meeting notes, etc.)
+        # Frames are (block, depth, inside_unsupported); pushed reversed so
+        # they pop in page order
+        stack = deque((block, depth, False) for block in reversed(blocks))
+
+        while stack:
+            block, level, inside_unsupported = stack.pop()
+            block_type = _get_block_type(block)
+
+            # Handle unsupported blocks (AI meeting notes, etc.) - no text of
+            # their own, but their children may still be readable
             if block_type == 'unsupported':
-                has_unsupported = True
-                # Try to get children anyway
-                if has_children and depth < max_depth:
-                    children = self.get_block_children(block_id)
-                    child_text, _ = self._extract_blocks_text(children, depth + 1, max_depth)
-                    if child_text:
-                        text_parts.append(child_text)
-                continue
-            
-            # Extract text based on block type
-            text = self._get_block_text(block)
-            if text:
-                prefix = self._get_block_prefix(block_type)
-                text_parts.append(f"{indent}{prefix}{text}")
-            
-            # Recursively get children (for toggles, etc.)
-            if has_children and depth < max_depth:
-                children = self.get_block_children(block_id)
-                child_text, child_unsupported = self._extract_blocks_text(children, depth + 1, max_depth)
-                if child_text:
-                    text_parts.append(child_text)
-                if child_unsupported:
+                if not inside_unsupported:
                     has_unsupported = True
-        
-        return '\n'.join(filter(None, text_parts)), has_unsupported
+                inside_unsupported = True
+            else:
+                text = self._get_block_text(block)
+                if text:
+                    text_parts.append(f"{'  ' * level}{self._get_block_prefix(block_type)}{text}")
+
+            # Nested children (toggles, etc.)
+            if block.get('has_children', False) and level < max_depth:
+                stack.extend(
+                    (child, level + 1, inside_unsupported)
+                    for child in reversed(children.get(_get_block_id(block), []))
+                )
+
+        return '\n'.join(text_parts), has_unsupported
+
+    def _prefetch_children(self, blocks: List[Dict], depth: int, max_depth: int) -> Dict[str, List[Dict]]:
+        """Fetch children for every nested block down to max_depth.
+
+        All blocks at one depth are fetched together on a small thread pool
+        (3 workers, matching Notion's request budget), so a wide toggle tree
+        costs one round-trip per level rather than one per block.
+        """
+        children: Dict[str, List[Dict]] = {}
+        parent_ids = [_get_block_id(b) for b in blocks if b.get('has_children', False)]
+        if not parent_ids or depth >= max_depth:
+            return children
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            while parent_ids and depth < max_depth:
+                fetched = list(pool.map(self.get_block_children, parent_ids))
+                children.update(zip(parent_ids, fetched))
+                parent_ids = [
+                    _get_block_id(child) for batch in fetched for child in batch
+                    if child.get('has_children', False)
+                ]
+                depth += 1
+        return children
     
     def _get_block_text(self, block: Dict, preserve_formatting: bool = True) -> Optional[str]:
         """
@@ -631,35 +962,18 @@ class NotionClient:
         """
         block_type = block.get('type')
 
-        text_block_types = [
-            'paragraph', 'heading_1', 'heading_2', 'heading_3',
-            'bulleted_list_item', 'numbered_list_item', 'to_do',
-            'toggle', 'quote', 'callout'
-        ]
-
-        if block_type in text_block_types:
+        if block_type in _TEXT_BLOCK_TYPES:
             rich_text = block.get(block_type, {}).get('rich_text', [])
             if preserve_formatting:
                 return rich_text_to_markdown(rich_text)
             else:
-                return ''.join([t.get('plain_text', '') for t in rich_text])
+                return _plain_text(rich_text)
 
         return None
     
     def _get_block_prefix(self, block_type: str) -> str:
         """Get display prefix for block type."""
-        prefixes = {
-            'heading_1': '# ',
-            'heading_2': '## ',
-            'heading_3': '### ',
-            'bulleted_list_item': '• ',
-            'numbered_list_item': '- ',
-            'to_do': '☐ ',
-            'quote': '> ',
-            'callout': '💡 ',
-            'toggle': '▶ ',
-        }
-        return prefixes.get(block_type, '')
+        return _BLOCK_PREFIXES.get(block_type, '')
 
     def extract_page_sections(self, page_id: str) -> List[Dict[str, str]]:
         """
@@ -673,12 +987,11 @@ class NotionClient:
             List of dicts with 'heading' and 'content' keys
             Example: [{'heading': 'Overview', 'content': 'This is the overview text...'}]
         """
-        blocks = self.get_all_blocks(page_id)
         sections = []
         current_heading = None
         current_content = []
 
-        for block in blocks:
+        for block in self.iter_blocks(page_id):
             block_type = block.get('type')
 
             # New section starts with heading_2
@@ -692,7 +1005,7 @@ class NotionClient:
 
                 # Start new section
                 rich_text = block.get('heading_2', {}).get('rich_text', [])
-                current_heading = ''.join([t.get('plain_text', '') for t in rich_text])
+                current_heading = _plain_text(rich_text)
                 current_content = []
 
             # Accumulate content for current section
@@ -712,10 +1025,21 @@ class NotionClient:
         return sections
 
     def get_database_schema(self, database_id: str) -> Dict:
-        """Get database schema to understand available properties."""
+        """Get database schema to understand available properties.
+
+        Schemas rarely change, so responses are cached per token and
+        database for SCHEMA_CACHE_TTL seconds across all client instances.
+        """
+        key = (self.headers['Authorization'], database_id)
+        cached = NotionClient._schema_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.SCHEMA_CACHE_TTL:
+            return cached[1]
+
         response = self.client.get(f'https://api.notion.com/v1/databases/{database_id}')
         response.raise_for_status()
-        return response.json()
+        schema = _json_loads(response.content)
+        NotionClient._schema_cache[key] = (time.monotonic(), schema)
+        return schema
 
 
 # ============================================================================
@@ -731,11 +1055,12 @@ class SupabaseClient:
         records = supabase.select_all()
         record = supabase.get_by_id(record_id)
         supabase.upsert(data, conflict_column='notion_page_id')
+        supabase.upsert_many(rows, conflict_column='notion_page_id')
         supabase.update(record_id, data)
         supabase.delete(record_id)
     """
     
-    PAGE_SIZE = 1000  # Supabase REST API default limit
+    PAGE_SIZE = SUPABASE_PAGE_SIZE  # Rows per Range request, see SUPABASE_PAGE_SIZE
 
     def __init__(self, url: str, key: str, table_name: str):
         self.base_url = f"{url}/rest/v1"
@@ -744,16 +1069,34 @@ class SupabaseClient:
             'apikey': key,
             'Authorization': f'Bearer {key}',
             'Content-Type': 'application/json',
-            'Prefer': 'return=representation'
+            'Prefer': 'return=representation',
+            'Range-Unit': 'items',
+            'Accept-Encoding': _ACCEPT_ENCODING
         }
-        self.client = httpx.Client(headers=self.headers, timeout=30.0)
+        self.client = httpx.Client(
+            headers=self.headers,
+            timeout=30.0,
+            transport=_PooledTransport(_shared_transport(self.base_url)),
+        )
+        # Built once: upsert is the hottest write path in two-way syncs
+        self._upsert_headers = httpx.Headers(
+            {**self.headers, 'Prefer': 'resolution=merge-duplicates,return=representation'}
+        )
+        self._upsert_minimal_headers = httpx.Headers(
+            {**self.headers, 'Prefer': 'resolution=merge-duplicates,return=minimal'}
+        )
+        self._minimal_headers = httpx.Headers({**self.headers, 'Prefer': 'return=minimal'})
         self.logger = setup_logger(f'Supabase.{table_name}')
-    
-    def __del__(self):
-        if hasattr(self, 'client'):
-            self.client.close()
 
-    @retry_on_error(max_retries=3, base_delay=1.0)
+    def close(self):
+        self.client.close()
+
+    def __enter__(self) -> 'SupabaseClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _paginated_get(self, params: Dict[str, Any]) -> List[Dict]:
         """Fetch all rows matching params using pagination.
 
@@ -767,27 +1110,23 @@ class SupabaseClient:
         Returns:
             Complete list of matching records across all pages.
         """
-        all_records: List[Dict] = []
+        return list(self._iter_paginated(params))
+
+    def _iter_paginated(self, params: Dict[str, Any]) -> Iterator[Dict]:
+        """Yield rows matching params page by page, as _paginated_get fetches them.
+
+        Only one page is held in memory at a time. Each page request is
+        retried on its own, so a transient error does not restart the scan.
+        """
         page = 0
         page_size = self.PAGE_SIZE
+        fetched = 0
 
         while True:
             start = page * page_size
-            end = start + page_size - 1
-
-            headers = {**self.client.headers, "Range": f"{start}-{end}"}
-            response = self.client.get(
-                f"{self.base_url}/{self.table_name}",
-                params=params,
-                headers=headers,
-            )
-
-            # 200 = all results fit, 206 = partial content (more pages available)
-            if response.status_code not in (200, 206):
-                response.raise_for_status()
-
-            batch = response.json()
-            all_records.extend(batch)
+            batch = self._get_range(params, start, start + page_size - 1)
+            fetched += len(batch)
+            yield from batch
 
             # If we got fewer rows than the page size, we've reached the end
             if len(batch) < page_size:
@@ -797,11 +1136,25 @@ class SupabaseClient:
 
         if page > 0:
             self.logger.warning(
-                f"Paginated fetch on '{self.table_name}': retrieved {len(all_records)} "
+                f"Paginated fetch on '{self.table_name}': retrieved {fetched} "
                 f"rows across {page + 1} pages"
             )
 
-        return all_records
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def _get_range(self, params: Dict[str, Any], start: int, end: int) -> List[Dict]:
+        """GET one Range-limited page of rows."""
+        # Client headers are merged in by httpx; only the Range varies
+        response = self.client.get(
+            f"{self.base_url}/{self.table_name}",
+            params=params,
+            headers={"Range": f"{start}-{end}"},
+        )
+
+        # 200 = all results fit, 206 = partial content (more pages available)
+        if response.status_code not in (200, 206):
+            response.raise_for_status()
+
+        return _json_loads(response.content)
 
     def select_all(self, columns: str = "*", order_by: str = "created_at.desc") -> List[Dict]:
         """Select all records from the table.
@@ -809,7 +1162,68 @@ class SupabaseClient:
         Automatically paginates to avoid Supabase's ~1000 row default limit.
         """
         return self._paginated_get({"select": columns, "order": order_by})
-    
+
+    def iter_all(self, columns: str = "*", order_by: str = "created_at.desc") -> Iterator[Dict]:
+        """Yield all records from the table, one page in memory at a time.
+
+        Streaming counterpart of select_all for callers that index or
+        filter rows as they arrive instead of keeping the full list.
+        """
+        return self._iter_paginated({"select": columns, "order": order_by})
+
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count rows matching filters without downloading them.
+
+        Issues a HEAD request with ``Prefer: count=exact`` so PostgREST
+        reports the total in the Content-Range header (e.g. ``*/1234``).
+        If a proxy strips the header or no total comes back (``*/*``), the
+        matching IDs are fetched and counted instead.
+
+        Args:
+            filters: Optional PostgREST filters, e.g. {"deleted_at": "is.null"}.
+        """
+        params = {"select": "id", **(filters or {})}
+        response = self.client.head(
+            f"{self.base_url}/{self.table_name}",
+            params=params,
+            headers={"Prefer": "count=exact"},
+        )
+        response.raise_for_status()
+        content_range = response.headers.get("Content-Range", "")
+        total = content_range.rpartition("/")[2]
+        if total.isdigit():
+            return int(total)
+        self.logger.warning(
+            f"No row count in Content-Range ({content_range!r}) for {self.table_name}, counting rows instead"
+        )
+        return sum(1 for _ in self._iter_paginated(params))
+
+    # (base_url, table, column) -> exists; a table's columns do not change under a running process
+    _column_cache: Dict[Tuple[str, str, str], bool] = {}
+
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def has_column(self, column: str) -> bool:
+        """Whether the table has a column, probed once per process.
+
+        PostgREST does not expose information_schema, so this selects the
+        column with limit=0: unknown columns are rejected with a 400.
+        """
+        key = (self.base_url, self.table_name, column)
+        exists = SupabaseClient._column_cache.get(key)
+        if exists is None:
+            response = self.client.get(
+                f"{self.base_url}/{self.table_name}",
+                params={"select": column, "limit": 0}
+            )
+            if response.status_code == 400:
+                exists = False
+            else:
+                response.raise_for_status()
+                exists = True
+            SupabaseClient._column_cache[key] = exists
+        return exists
+
     @retry_on_error(max_retries=3, base_delay=1.0)
     def select_where(self, column: str, value: Any, columns: str = "*") -> List[Dict]:
         """Select records where column equals value."""
@@ -818,8 +1232,46 @@ class SupabaseClient:
             params={"select": columns, column: f"eq.{value}"}
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
+    def select_gte(self, column: str, value: Any, columns: str = "*") -> List[Dict]:
+        """Select records where column >= value, filtered server-side.
+
+        Paginated like select_all, so large windows are not silently capped.
+        """
+        return self._paginated_get({"select": columns, column: f"gte.{value}"})
+
+    def select_linked_active(
+        self,
+        columns: str = "id,notion_page_id",
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict]:
+        """Select non-deleted records linked to a Notion page, filtered server-side.
+
+        Paginated like select_all. Pass only the columns you need: deletion
+        checks read just the ID and the page link. Extra PostgREST filters
+        narrow the selection further.
+        """
+        return self._paginated_get({
+            "select": columns,
+            "notion_page_id": "not.is.null",
+            "deleted_at": "is.null",
+            **(filters or {})
+        })
+
+    def select_in(self, column: str, values: List[Any], columns: str = "*") -> List[Dict]:
+        """Select records whose column is one of values, filtered server-side.
+
+        Values are sent ID_FILTER_CHUNK_SIZE at a time as in.(...) filters,
+        so the cost scales with len(values) rather than the table size.
+        """
+        values = list(dict.fromkeys(values))
+        rows: List[Dict] = []
+        for start in range(0, len(values), self.ID_FILTER_CHUNK_SIZE):
+            chunk = values[start:start + self.ID_FILTER_CHUNK_SIZE]
+            rows += self._paginated_get({"select": columns, column: f"in.({','.join(chunk)})"})
+        return rows
+
     @retry_on_error(max_retries=3, base_delay=1.0)
     def select_updated_since(self, since: datetime, columns: str = "*") -> List[Dict]:
         """Select records updated since a given timestamp."""
@@ -831,29 +1283,32 @@ class SupabaseClient:
             }
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     @retry_on_error(max_retries=3, base_delay=1.0)
-    def get_by_id(self, record_id: str) -> Optional[Dict]:
-        """Get a single record by ID."""
+    def _get_one(self, params: Dict[str, Any]) -> Optional[Dict]:
+        """Fetch at most one row as a bare JSON object.
+
+        Uses PostgREST's singular-object media type, which returns the row
+        without an array wrapper, or 406 when nothing matches.
+        """
         response = self.client.get(
             f"{self.base_url}/{self.table_name}",
-            params={"select": "*", "id": f"eq.{record_id}"}
+            params={**params, "limit": 1},
+            headers={"Accept": "application/vnd.pgrst.object+json"}
         )
+        if response.status_code == 406:
+            return None
         response.raise_for_status()
-        data = response.json()
-        return data[0] if data else None
+        return _json_loads(response.content)
+
+    def get_by_id(self, record_id: str) -> Optional[Dict]:
+        """Get a single record by ID."""
+        return self._get_one({"select": "*", "id": f"eq.{record_id}"})
     
-    @retry_on_error(max_retries=3, base_delay=1.0)
     def get_by_notion_id(self, notion_page_id: str) -> Optional[Dict]:
         """Get a record by its Notion page ID."""
-        response = self.client.get(
-            f"{self.base_url}/{self.table_name}",
-            params={"select": "*", "notion_page_id": f"eq.{notion_page_id}"}
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data[0] if data else None
+        return self._get_one({"select": "*", "notion_page_id": f"eq.{notion_page_id}"})
     
     @retry_on_error(max_retries=3, base_delay=1.0)
     def upsert(self, data: Dict, conflict_column: str = "notion_page_id") -> Dict:
@@ -861,35 +1316,146 @@ class SupabaseClient:
         # Upsert requires resolution=merge-duplicates to update on conflict
         response = self.client.post(
             f"{self.base_url}/{self.table_name}?on_conflict={conflict_column}",
-            json=data,
-            headers={"Prefer": "resolution=merge-duplicates,return=representation"}
+            content=_json_dumps(data),
+            headers=self._upsert_headers
         )
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         return result[0] if result else {}
     
+    UPSERT_CHUNK_SIZE = 500  # Rows per bulk upsert request
+
+    def upsert_many(
+        self,
+        rows: List[Dict],
+        conflict_column: str = "notion_page_id",
+        chunk: int = UPSERT_CHUNK_SIZE,
+        max_workers: int = 1,
+        returning: bool = True,
+    ) -> List[Dict]:
+        """Insert or update many records with one request per chunk.
+
+        PostgREST turns a JSON array body into a single multi-row
+        INSERT ... ON CONFLICT. It takes the column list from the rows, so
+        rows are grouped by key set first; mixing shapes in one body would
+        null out columns a row did not mention. Rows repeating a conflict
+        value are collapsed to the last one, since Postgres refuses to
+        update the same row twice in one statement.
+
+        With max_workers > 1 the chunks are posted concurrently. Chunks
+        never share a conflict value, so their order does not matter.
+
+        Returns:
+            All upserted records, as returned by PostgREST. With
+            returning=False PostgREST sends no body back and this is empty.
+        """
+        batches = self._upsert_batches(rows, conflict_column, chunk)
+
+        results: List[Dict] = []
+        if max_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # Each task runs in a copy of the caller's context so retries
+                # are still counted against the running sync's metrics
+                futures = [
+                    pool.submit(copy_context().run, self._upsert_chunk, batch, conflict_column, returning)
+                    for batch in batches
+                ]
+                for future in futures:
+                    results.extend(future.result())
+        else:
+            for batch in batches:
+                results.extend(self._upsert_chunk(batch, conflict_column, returning))
+        return results
+
+    @staticmethod
+    def _upsert_batches(rows: List[Dict], conflict_column: str, chunk: int) -> List[List[Dict]]:
+        """Dedupe rows on the conflict value, group them by key set and chunk each group."""
+        unique: Dict[Any, Dict] = {}
+        for index, row in enumerate(rows):
+            unique[row.get(conflict_column, ('__row', index))] = row
+
+        groups: Dict[Tuple[str, ...], List[Dict]] = {}
+        for row in unique.values():
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        return [
+            group[start:start + chunk]
+            for group in groups.values()
+            for start in range(0, len(group), chunk)
+        ]
+
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def _upsert_chunk(self, rows: List[Dict], conflict_column: str, returning: bool = True) -> List[Dict]:
+        """POST one bulk upsert body. Retried per chunk, which is safe since upserts are idempotent."""
+        response = self.client.post(
+            f"{self.base_url}/{self.table_name}?on_conflict={conflict_column}",
+            content=_json_dumps(rows),
+            headers=self._upsert_headers if returning else self._upsert_minimal_headers
+        )
+        response.raise_for_status()
+        return _json_loads(response.content) if returning else []
+
     @retry_on_error(max_retries=3, base_delay=1.0)
     def insert(self, data: Dict) -> Dict:
         """Insert a new record."""
         response = self.client.post(
             f"{self.base_url}/{self.table_name}",
-            json=data
+            content=_json_dumps(data)
         )
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         return result[0] if result else {}
     
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def insert_many(self, rows: List[Dict]) -> List[Dict]:
+        """Insert several records in one request.
+
+        PostgREST takes the column list from the rows, so they should all
+        share the same keys.
+        """
+        response = self.client.post(
+            f"{self.base_url}/{self.table_name}",
+            content=_json_dumps(rows)
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
     @retry_on_error(max_retries=3, base_delay=1.0)
     def update(self, record_id: str, data: Dict) -> Dict:
         """Update a record by ID."""
         response = self.client.patch(
             f"{self.base_url}/{self.table_name}?id=eq.{record_id}",
-            json=data
+            content=_json_dumps(data)
         )
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         return result[0] if result else {}
     
+    ID_FILTER_CHUNK_SIZE = 100  # IDs per in.(...) filter, keeps URLs well under proxy limits
+
+    def update_many(self, record_ids: List[str], data: Dict) -> int:
+        """Apply the same update to many records, one PATCH per chunk of IDs.
+
+        Returns:
+            Number of IDs sent. PostgREST is asked not to echo the rows back.
+        """
+        ids = list(dict.fromkeys(record_ids))
+        body = _json_dumps(data)
+        for start in range(0, len(ids), self.ID_FILTER_CHUNK_SIZE):
+            self._update_in(ids[start:start + self.ID_FILTER_CHUNK_SIZE], body)
+        return len(ids)
+
+    @retry_on_error(max_retries=3, base_delay=1.0)
+    def _update_in(self, record_ids: List[str], body: bytes) -> None:
+        """PATCH one chunk of IDs. Retried per chunk, which is safe since the update is idempotent."""
+        response = self.client.patch(
+            f"{self.base_url}/{self.table_name}",
+            params={"id": f"in.({','.join(record_ids)})"},
+            content=body,
+            headers=self._minimal_headers
+        )
+        response.raise_for_status()
+
     @retry_on_error(max_retries=3, base_delay=1.0)
     def delete(self, record_id: str) -> bool:
         """Delete a record by ID."""
@@ -923,6 +1489,13 @@ class SupabaseClient:
             "notion_updated_at": None
         })
     
+    def clear_notion_page_ids(self, record_ids: List[str]) -> int:
+        """clear_notion_page_id for many records, batched through update_many."""
+        return self.update_many(record_ids, {
+            "notion_page_id": None,
+            "notion_updated_at": None
+        })
+    
     def get_all_active(self) -> List[Dict]:
         """Get all non-deleted records.
 
@@ -941,6 +1514,24 @@ class SupabaseClient:
 
 import re
 
+# Inline markdown spans, tried in this order at each position: multi-char
+# markers first so ** is not read as two italics
+_MARKDOWN_INLINE_RE = re.compile('|'.join([
+    r'(\*\*\*.+?\*\*\*)',      # bold+italic ***
+    r'(___.+?___)',            # bold+italic ___
+    r'(\*\*.+?\*\*)',          # bold **
+    r'(__.+?__)',              # bold __
+    r'(\*.+?\*)',              # italic *
+    r'((?<![a-zA-Z])_.+?_(?![a-zA-Z]))',  # italic _
+    r'(~~.+?~~)',              # strikethrough
+    r'(`[^`]+`)',              # code
+    r'(\[[^\]]+\]\([^)]+\))',  # link
+]))
+_MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+# Characters any span above must start with
+_MARKDOWN_MARKER_RE = re.compile(r'[*_~`\[]')
+_PARAGRAPH_BREAK_RE = re.compile('\n\n')
+
 
 def rich_text_to_markdown(rich_text_array: List[Dict]) -> str:
     """
@@ -1012,44 +1603,16 @@ def parse_markdown_to_rich_text(text: str) -> List[Dict]:
     if not text:
         return []
 
-    rich_text = []
+    # Fast path: nothing that could start a markdown span, so the whole text
+    # is one plain segment (what the scan below would produce anyway)
+    if not _MARKDOWN_MARKER_RE.search(text):
+        return [{"type": "text", "text": {"content": text}}]
 
-    # Pattern to match markdown inline formatting
-    # Order matters: check multi-char patterns first
-    patterns = [
-        # Bold + italic combined: ***text*** or ___text___
-        (r'\*\*\*(.+?)\*\*\*', {'bold': True, 'italic': True}),
-        (r'___(.+?)___', {'bold': True, 'italic': True}),
-        # Bold: **text** or __text__
-        (r'\*\*(.+?)\*\*', {'bold': True}),
-        (r'__(.+?)__', {'bold': True}),
-        # Italic: *text* or _text_ (but not inside words for underscore)
-        (r'\*(.+?)\*', {'italic': True}),
-        (r'(?<![a-zA-Z])_(.+?)_(?![a-zA-Z])', {'italic': True}),
-        # Strikethrough: ~~text~~
-        (r'~~(.+?)~~', {'strikethrough': True}),
-        # Code: `text`
-        (r'`([^`]+)`', {'code': True}),
-        # Links: [text](url)
-        (r'\[([^\]]+)\]\(([^)]+)\)', 'link'),
-    ]
-
-    # Build a combined pattern to find all markdown segments
-    combined_pattern = '|'.join([
-        r'(\*\*\*.+?\*\*\*)',      # bold+italic ***
-        r'(___.+?___)',            # bold+italic ___
-        r'(\*\*.+?\*\*)',          # bold **
-        r'(__.+?__)',              # bold __
-        r'(\*.+?\*)',              # italic *
-        r'((?<![a-zA-Z])_.+?_(?![a-zA-Z]))',  # italic _
-        r'(~~.+?~~)',              # strikethrough
-        r'(`[^`]+`)',              # code
-        r'(\[[^\]]+\]\([^)]+\))',  # link
-    ])
+    rich_text = []
 
     # Split text into segments (formatted and plain)
     pos = 0
-    for match in re.finditer(combined_pattern, text):
+    for match in _MARKDOWN_INLINE_RE.finditer(text):
         # Add plain text before this match
         if match.start() > pos:
             plain_text = text[pos:match.start()]
@@ -1090,7 +1653,7 @@ def parse_markdown_to_rich_text(text: str) -> List[Dict]:
             annotations = {'code': True}
         # Link
         elif matched_text.startswith('['):
-            link_match = re.match(r'\[([^\]]+)\]\(([^)]+)\)', matched_text)
+            link_match = _MARKDOWN_LINK_RE.match(matched_text)
             if link_match:
                 content = link_match.group(1)
                 link_url = link_match.group(2)
@@ -1133,6 +1696,16 @@ def parse_markdown_to_rich_text(text: str) -> List[Dict]:
     return rich_text
 
 
+# Notion's limit is 2000 chars per rich text item; Unicode chars (emojis)
+# may count differently, so 1990 leaves a safety margin
+_NOTION_TEXT_LIMIT = 1990
+
+
+def _clip(text: str, limit: int = _NOTION_TEXT_LIMIT) -> str:
+    """Truncate text to limit characters, skipping the slice when it already fits."""
+    return text if len(text) <= limit else text[:limit]
+
+
 def _build_rich_text_block(block_type: str, text: str, extra_props: Dict = None) -> Dict:
     """
     Build a Notion block with parsed rich text.
@@ -1146,7 +1719,7 @@ def _build_rich_text_block(block_type: str, text: str, extra_props: Dict = None)
         Notion block dictionary
     """
     # Truncate to Notion's limit (1990 for safety margin)
-    text = text[:1990] if text else ""
+    text = _clip(text) if text else ""
     rich_text = parse_markdown_to_rich_text(text)
 
     block = {
@@ -1168,9 +1741,13 @@ def _build_rich_text_block(block_type: str, text: str, extra_props: Dict = None)
 # ============================================================================
 
 class ContentBlockBuilder:
-    """Helper class to build Notion content blocks from text with markdown support."""
+    """Helper class to build Notion content blocks from text with markdown support.
+    
+    Blocks are returned as plain dicts in Notion's wire format: syncs attach
+    children to them in place and they are posted as-is by append_blocks.
+    """
 
-    NOTION_BLOCK_LIMIT = 1990  # Notion's character limit per block (using 1990 for safety margin)
+    NOTION_BLOCK_LIMIT = _NOTION_TEXT_LIMIT  # Notion's character limit per block
     
     @staticmethod
     def paragraph(text: str) -> Dict:
@@ -1250,34 +1827,39 @@ class ContentBlockBuilder:
             text: The text to split
             chunk_size: Max characters per block (default: NOTION_BLOCK_LIMIT)
         """
+        return list(cls.iter_chunked_paragraphs(text, chunk_size))
+    
+    @classmethod
+    def iter_chunked_paragraphs(cls, text: str, chunk_size: int = None) -> Iterator[Dict]:
+        """Generator version of chunked_paragraphs, yielding one block at a time."""
         if not text:
-            return []
+            return
         
         chunk_size = chunk_size or cls.NOTION_BLOCK_LIMIT
-        blocks = []
-        
-        # Try to split on paragraph boundaries first
-        paragraphs = text.split('\n\n')
-        current_chunk = ""
-        
-        for para in paragraphs:
-            if len(current_chunk) + len(para) + 2 <= chunk_size:
-                if current_chunk:
-                    current_chunk += "\n\n"
-                current_chunk += para
-            else:
-                if current_chunk:
-                    blocks.append(cls.paragraph(current_chunk))
-                # Handle very long paragraphs
-                while len(para) > chunk_size:
-                    blocks.append(cls.paragraph(para[:chunk_size]))
-                    para = para[chunk_size:]
-                current_chunk = para
-        
-        if current_chunk:
-            blocks.append(cls.paragraph(current_chunk))
+        paragraph = cls.paragraph
         
-        return blocks
+        # Paragraph i spans text[ends[i - 1] + 2:ends[i]]. Each chunk is one
+        # slice of `text`, and its extent is found by binary search over the
+        # boundaries rather than by adding up paragraph lengths.
+        ends = [m.start() for m in _PARAGRAPH_BREAK_RE.finditer(text)]
+        ends.append(len(text))
+        count = len(ends)
+        i = 0
+        while i < count:
+            start = ends[i - 1] + 2 if i else 0
+            end = ends[i]
+            if start == end:
+                # Empty paragraphs never open a chunk
+                i += 1
+                continue
+            # Handle very long paragraphs
+            while end - start > chunk_size:
+                yield paragraph(text[start:start + chunk_size])
+                start += chunk_size
+            # Extend to the last paragraph that still fits
+            i = bisect_right(ends, start + chunk_size, i) - 1
+            yield paragraph(text[start:ends[i]])
+            i += 1
     
     @classmethod
     def from_structured_content(cls, content: Dict) -> List[Dict]:
@@ -1293,61 +1875,111 @@ class ContentBlockBuilder:
             "action_items": ["task1", "task2"]
         }
         """
-        blocks = []
+        return list(cls.from_structured_content_iter(content))
+    
+    @classmethod
+    def from_structured_content_iter(cls, content: Dict) -> Iterator[Dict]:
+        """
+        Generator version of from_structured_content.
         
+        Pass it straight to NotionClient.append_blocks to build only one
+        100-block request at a time instead of the whole document.
+        """
         # Summary
         if content.get("summary"):
-            blocks.append(cls.heading_2("Summary"))
-            blocks.extend(cls.chunked_paragraphs(content["summary"]))
+            yield cls.heading_2("Summary")
+            yield from cls.iter_chunked_paragraphs(content["summary"])
         
         # Sections
         for section in content.get("sections", []):
             if section.get("heading"):
-                blocks.append(cls.heading_3(section["heading"]))
+                yield cls.heading_3(section["heading"])
             if section.get("content"):
-                blocks.extend(cls.chunked_paragraphs(section["content"]))
+                yield from cls.iter_chunked_paragraphs(section["content"])
             for item in section.get("items", []):
-                blocks.append(cls.bulleted_list_item(item))
+                yield cls.bulleted_list_item(item)
         
         # Action items
         if content.get("action_items"):
-            blocks.append(cls.heading_2("Action Items"))
+            yield cls.heading_2("Action Items")
             for item in content["action_items"]:
-                blocks.append(cls.to_do(item))
-        
-        return blocks
+                yield cls.to_do(item)
 
 
 # ============================================================================
 # SYNC LOGGING SERVICE WITH METRICS
 # ============================================================================
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
 class SyncLogger:
-    """Unified logging to sync_logs table with metrics support."""
+    """Unified logging to sync_logs table with metrics support.
+    
+    Rows are buffered and written with one bulk insert per FLUSH_SIZE
+    events or FLUSH_INTERVAL_SECONDS (checked on the next log), whichever
+    comes first. log_complete flushes; callers must flush() when they are
+    done, which the sync services do in a finally on every return path.
+    """
+    
+    FLUSH_SIZE = 50
+    FLUSH_INTERVAL_SECONDS = 2.0
     
     def __init__(self, service_name: str):
         self.service_name = service_name
         self.supabase = SupabaseClient(SUPABASE_URL, SUPABASE_KEY, 'sync_logs')
         self.logger = setup_logger(f'SyncLogger.{service_name}')
+        self._buffer: List[Dict] = []
+        self._buffer_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        # Whether sync_logs has a details column; probed on first log()
+        self._log_with_details: Optional[bool] = None
     
     def log(self, event_type: str, status: str, message: str, details: Optional[Dict] = None):
-        """Log a sync event to the database.
+        """Queue a sync event for the database.
         
-        Note: The 'details' column may not exist in all environments.
-        We try with details first, then fall back to without.
+        Note: The 'details' column may not exist in all environments, so
+        whether to send it is decided once per logger. When it is sent,
+        every row carries the key, as one bulk insert needs matching keys.
         """
         log_data = {
             'event_type': f"{self.service_name}_{event_type}",
             'status': status,
-            'message': message[:500] if message else '',
+            'message': _clip(message, 500) if message else '',
             'created_at': datetime.now(timezone.utc).isoformat()
         }
+        if self._details_supported():
+            log_data['details'] = details
         
+        with self._buffer_lock:
+            self._buffer.append(log_data)
+            due = (
+                len(self._buffer) >= self.FLUSH_SIZE
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SECONDS
+            )
+        if due:
+            self.flush()
+    
+    def _details_supported(self) -> bool:
+        if self._log_with_details is None:
+            try:
+                self._log_with_details = self.supabase.has_column('details')
+            except Exception as e:
+                self.logger.warning(f"Could not check sync_logs for a details column: {e}")
+                self._log_with_details = False
+        return self._log_with_details
+    
+    def flush(self):
+        """Write all buffered events with a single insert. Failures only warn."""
+        with self._buffer_lock:
+            rows, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+        if not rows:
+            return
         try:
-            # Try without details first (safer)
-            self.supabase.insert(log_data)
+            self.supabase.insert_many(rows)
         except Exception as e:
-            self.logger.warning(f"Failed to log sync event: {e}")
+            self.logger.warning(f"Failed to log {len(rows)} sync event(s): {e}")
     
     def log_success(self, event_type: str, message: str, details: Optional[Dict] = None):
         self.log(event_type, 'success', message, details)
@@ -1374,6 +2006,7 @@ class SyncLogger:
             metrics_summary += f" | Staleness: {m.staleness_seconds:.0f}s"
         
         self.log('complete', status, metrics_summary, result.to_dict())
+        self.flush()
         
         # Also log to console for Cloud Run visibility
         self.logger.info(f"📊 SYNC METRICS: {metrics_summary}")
@@ -1454,6 +2087,49 @@ class NotionPropertyExtractor:
         """Extract related page IDs from relation property."""
         relations = props.get(prop_name, {}).get('relation', [])
         return [r.get('id', '') for r in relations if r.get('id')]
+    
+    # Subscript path to the value for the common, fully populated case;
+    # kinds mapped to None always go through the static extractor
+    _FAST_PATHS = {
+        'title': ('title', 0, 'plain_text'),
+        'rich_text': ('rich_text', 0, 'plain_text'),
+        'number': ('number',),
+        'select': ('select', 'name'),
+        'date': ('date', 'start'),
+        'url': ('url',),
+        'checkbox': ('checkbox',),
+        'email': ('email',),
+        'phone': ('phone_number',),
+        'multi_select': None,
+        'relation': None,
+    }
+    
+    @classmethod
+    def _compile_property(cls, kind: str, prop_name: str) -> Callable[[Dict], Any]:
+        """
+        Build a reusable extractor for one property, for compile_converter.
+        
+        The callable takes a page's properties dict and returns exactly what
+        the matching static extractor would, but reads populated properties
+        with plain subscripts and only falls back to the defensive .get()
+        chain when something is missing.
+        """
+        if kind not in cls._FAST_PATHS:
+            raise ValueError(f"Unknown property kind: {kind}")
+        extract = getattr(cls, kind)
+        path = cls._FAST_PATHS[kind]
+        if path is None:
+            return lambda props: extract(props, prop_name)
+        
+        def fast(props: Dict) -> Any:
+            try:
+                value = props[prop_name]
+                for key in path:
+                    value = value[key]
+                return value
+            except (KeyError, IndexError, TypeError):
+                return extract(props, prop_name)
+        return fast
 
 
 class NotionPropertyBuilder:
@@ -1467,9 +2143,7 @@ class NotionPropertyBuilder:
     def rich_text(value: Optional[str]) -> Dict:
         if not value:
             return {"rich_text": []}
-        # Notion limit is 2000 chars, but Unicode chars (emojis) may count differently
-        # Use 1990 to be safe with multi-byte characters
-        return {"rich_text": [{"text": {"content": value[:1990]}}]}
+        return {"rich_text": [{"text": {"content": _clip(value)}}]}
     
     @staticmethod
     def number(value: Optional[float]) -> Dict:
@@ -1540,6 +2214,61 @@ class BaseSyncService(ABC, Generic[T]):
         self.logger = setup_logger(service_name)
         self.sync_logger = SyncLogger(service_name)
     
+    def _upsert_notion_rows(
+        self,
+        rows: List[Dict],
+        metrics: Optional[SyncMetrics] = None,
+        max_workers: int = 1
+    ) -> List[Dict]:
+        """Write converted Notion rows in bulk, one request per chunk.
+
+        A chunk PostgREST rejects is retried row by row, so one bad record
+        only costs itself rather than its whole chunk. With max_workers > 1
+        the chunks are written concurrently.
+
+        Returns:
+            The rows that could not be written.
+        """
+        chunk_size = SupabaseClient.UPSERT_CHUNK_SIZE
+        chunks = [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+        if max_workers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # Run in copies of the caller's context so retries are still
+                # counted against the running sync's metrics
+                futures = [
+                    pool.submit(copy_context().run, self._upsert_notion_chunk, chunk, metrics)
+                    for chunk in chunks
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [self._upsert_notion_chunk(chunk, metrics) for chunk in chunks]
+        return [row for failed in results for row in failed]
+
+    def _upsert_notion_chunk(self, chunk: List[Dict], metrics: Optional[SyncMetrics] = None) -> List[Dict]:
+        """Upsert one chunk, falling back to one request per row. Returns the failed rows."""
+        try:
+            self.supabase.upsert_many(chunk, conflict_column='notion_page_id', returning=False)
+            if metrics:
+                # upsert_many posts one request per key-set group in the chunk
+                metrics.supabase_api_calls += len(
+                    SupabaseClient._upsert_batches(chunk, 'notion_page_id', SupabaseClient.UPSERT_CHUNK_SIZE)
+                )
+            return []
+        except Exception as e:
+            self.logger.warning(
+                f"Bulk upsert of {len(chunk)} rows failed, retrying individually: {format_exception(e)}"
+            )
+        failed = []
+        for data in chunk:
+            try:
+                self.supabase.upsert(data, conflict_column='notion_page_id')
+                if metrics:
+                    metrics.supabase_api_calls += 1
+            except Exception as e:
+                self.logger.error(f"Error syncing from Notion: {format_exception(e)}")
+                failed.append(data)
+        return failed
+    
     @abstractmethod
     def convert_from_source(self, source_record: Dict) -> Dict:
         """Convert source record to destination format."""
@@ -1558,6 +2287,31 @@ class BaseSyncService(ABC, Generic[T]):
         """Get unique identifier from destination record."""
         return dest_record.get('id', '')
     
+    @staticmethod
+    def compile_converter(schema: Dict[str, Tuple[str, str]]) -> Callable[[Dict], Dict]:
+        """
+        Build a Notion page -> row converter from a column mapping.
+        
+        Args:
+            schema: Destination column -> (extractor kind, Notion property),
+                e.g. {'title': ('title', 'Name'), 'url': ('url', 'URL')}
+            
+        Returns:
+            A function taking a Notion page and returning the row dict. The
+            extractors are resolved once here, so each call is a single loop
+            over prebuilt (column, extractor) pairs. Store it with
+            staticmethod() when assigning it as a class attribute.
+        """
+        columns = tuple(
+            (column, NotionPropertyExtractor._compile_property(kind, prop_name))
+            for column, (kind, prop_name) in schema.items()
+        )
+        
+        def convert(notion_record: Dict) -> Dict:
+            props = notion_record.get('properties', {})
+            return {column: extract(props) for column, extract in columns}
+        return convert
+    
     def check_safety_valve(
         self,
         source_count: int,
@@ -1577,8 +2331,10 @@ class BaseSyncService(ABC, Generic[T]):
         if dest_count <= SAFETY_VALVE_MIN_RECORDS:
             return True, f"Safety valve bypassed (destination has {dest_count} records, below minimum threshold of {SAFETY_VALVE_MIN_RECORDS})"
 
-        ratio = source_count / dest_count if dest_count > 0 else 1.0
-        if source_count < dest_count * SAFETY_VALVE_THRESHOLD:
+        # Compared in integer basis points, so 0.29 means exactly 29%
+        # rather than whatever 0.29 rounds to as a float product
+        if source_count * 10_000 < dest_count * SAFETY_VALVE_THRESHOLD_BP:
+            ratio = source_count / dest_count
             msg = (
                 f"Safety Valve Triggered [{direction}]: "
                 f"source={source_count}, destination={dest_count}, "
@@ -1591,6 +2347,19 @@ class BaseSyncService(ABC, Generic[T]):
             return False, msg
 
         return True, ""
+
+    @staticmethod
+    def safety_valve_count_limit(source_count: int) -> int:
+        """Smallest destination count past which check_safety_valve's verdict stops changing.
+
+        Any destination count at or above this is treated the same, so it can
+        be passed as a limit to counting queries.
+        """
+        trigger = (
+            source_count * 10_000 // SAFETY_VALVE_THRESHOLD_BP + 1
+            if SAFETY_VALVE_THRESHOLD_BP else 0
+        )
+        return max(trigger, SAFETY_VALVE_MIN_RECORDS + 1)
     
     def compare_timestamps(
         self,
@@ -1604,25 +2373,50 @@ class BaseSyncService(ABC, Generic[T]):
         """
         if not source_updated or not dest_updated:
             return 0
+        return self.compare_timestamps_ns(
+            self._parse_ts_ns(source_updated),
+            self._parse_ts_ns(dest_updated),
+            buffer_seconds * 1_000_000_000
+        )
 
+    @staticmethod
+    def _parse_ts_ns(ts: Optional[str]) -> Optional[int]:
+        """
+        Parse an ISO timestamp to integer nanoseconds since the epoch.
+        
+        Naive timestamps are taken as UTC. Returns None for empty or
+        unparseable values, so records can be parsed once on load and
+        compared with compare_timestamps_ns afterwards.
+        """
+        if not ts:
+            return None
         try:
-            # Parse timestamps
-            def parse_ts(ts: str) -> datetime:
-                if ts.endswith('Z'):
-                    ts = ts[:-1] + '+00:00'
-                return datetime.fromisoformat(ts)
+            if ts.endswith('Z'):
+                ts = ts[:-1] + '+00:00'
+            dt = datetime.fromisoformat(ts)
+        except (TypeError, ValueError):
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        delta = dt - _EPOCH
+        return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
 
-            source_dt = parse_ts(source_updated)
-            dest_dt = parse_ts(dest_updated)
-
-            diff = (source_dt - dest_dt).total_seconds()
-
-            if abs(diff) <= buffer_seconds:
-                return 0
-            return 1 if diff > 0 else -1
-            
-        except Exception:
+    @staticmethod
+    def compare_timestamps_ns(
+        source_ns: Optional[int],
+        dest_ns: Optional[int],
+        buffer_ns: int = 5_000_000_000
+    ) -> int:
+        """
+        compare_timestamps for values already parsed with _parse_ts_ns.
+        Returns: 1 if source is newer, -1 if dest is newer, 0 if equal/unknown
+        """
+        if source_ns is None or dest_ns is None:
             return 0
+        diff = source_ns - dest_ns
+        if -buffer_ns <= diff <= buffer_ns:
+            return 0
+        return (diff > 0) - (diff < 0)
 
 
 # ============================================================================
@@ -1636,6 +2430,14 @@ class OneWaySyncService(BaseSyncService):
     Use for: Books, Highlights, LinkedIn posts, etc.
     """
     
+    # Columns read from existing Supabase rows; override if the table has no title
+    EXISTING_COLUMNS = "notion_page_id,last_sync_source,title"
+    # Bulk upsert chunks posted concurrently
+    UPSERT_WORKERS = 4
+    # Text column holding a hash of the Notion properties each row was built
+    # from. When set, records whose properties are unchanged are skipped.
+    CONTENT_HASH_COLUMN: Optional[str] = None
+    
     def __init__(
         self,
         service_name: str,
@@ -1651,6 +2453,19 @@ class OneWaySyncService(BaseSyncService):
     def get_source_id(self, source_record: Dict) -> str:
         return source_record.get('id', '')
     
+    def _content_hash_column(self) -> Optional[str]:
+        """CONTENT_HASH_COLUMN, or None while the table doesn't have it yet."""
+        column = self.CONTENT_HASH_COLUMN
+        if not column:
+            return None
+        try:
+            if self.supabase.has_column(column):
+                return column
+            self.logger.warning(f"{self.supabase.table_name}.{column} does not exist - syncing without content hashes")
+        except Exception as e:
+            self.logger.warning(f"Could not check for {column} column, syncing without content hashes: {e}")
+        return None
+    
     def sync(self, full_sync: bool = False, since_hours: int = 24) -> SyncResult:
         """
         Sync from Notion to Supabase.
@@ -1663,9 +2478,10 @@ class OneWaySyncService(BaseSyncService):
         stats = SyncStats()
         
         self.logger.info(f"Starting {self.service_name} sync (full={full_sync})")
-        self.sync_logger.log_start()
         
         try:
+            self.sync_logger.log_start()
+            
             # Build filter for incremental sync
             filter_query = None
             if not full_sync:
@@ -1676,52 +2492,98 @@ class OneWaySyncService(BaseSyncService):
                 }
             
             # Fetch from Notion
-            notion_records = self.notion.query_database(self.notion_database_id, filter=filter_query)
+            notion_records = self.notion.query_pages(self.notion_database_id, filter=filter_query)
             self.logger.info(f"Found {len(notion_records)} records in Notion")
+
+            # Safety valve (full sync only) - decided from a server-side count
+            # so an aborted sync never downloads the destination table
+            if full_sync:
+                dest_count = self.supabase.count({"notion_page_id": "not.is.null"})
+                is_safe, msg = self.check_safety_valve(len(notion_records), dest_count, "Notion → Supabase")
+                if not is_safe:
+                    self.logger.error(msg)
+                    self.sync_logger.log_error('safety_valve', msg)
+                    return SyncResult(
+                        success=False,
+                        direction="notion_to_supabase",
+                        error_message=msg,
+                        elapsed_seconds=time.time() - start_time
+                    )
+
+            # Index existing Supabase records for comparison as pages stream
+            # in, fetching only the columns the loop below reads
+            hash_column = self._content_hash_column()
+            columns = f"{self.EXISTING_COLUMNS},{hash_column}" if hash_column else self.EXISTING_COLUMNS
+            existing: Dict[str, Dict] = {}
+            for r in self.supabase.iter_all(columns=columns):
+                pid = r.get('notion_page_id')
+                if pid:
+                    existing[pid] = r
+
+            # Classify records up front with set operations:
+            # new -> created, existing -> updated, pending local edits and
+            # rows already built from identical properties -> skipped.
+            # Full syncs rebuild every row regardless of its hash.
+            notion_ids = {self.get_source_id(nr) for nr in notion_records}
+            pending_local = {
+                pid for pid, r in existing.items()
+                if r.get('last_sync_source') == 'supabase'
+            }
+            hashes = (
+                {self.get_source_id(nr): _content_hash(nr.properties) for nr in notion_records}
+                if hash_column else {}
+            )
+            unchanged = set()
+            if hash_column and not full_sync:
+                unchanged = {
+                    pid for pid, content_hash in hashes.items()
+                    if pid in existing and existing[pid].get(hash_column) == content_hash
+                } - pending_local
+            existing_ids = existing.keys()
+            stats.created = len(notion_ids - existing_ids)
+            stats.updated = len((notion_ids & existing_ids) - pending_local - unchanged)
+            stats.skipped = len(notion_ids & pending_local) + len(unchanged)
             
-            # Get existing Supabase records for comparison
-            existing = {r['notion_page_id']: r for r in self.supabase.select_all() if r.get('notion_page_id')}
-            
-            # Safety valve
-            is_safe, msg = self.check_safety_valve(len(notion_records), len(existing), "Notion → Supabase")
-            if not is_safe and full_sync:
-                self.logger.error(msg)
-                self.sync_logger.log_error('safety_valve', msg)
-                return SyncResult(
-                    success=False,
-                    direction="notion_to_supabase",
-                    error_message=msg,
-                    elapsed_seconds=time.time() - start_time
-                )
+            # One timestamp for the whole batch; the rows are written together
+            synced_at = datetime.now(timezone.utc).isoformat()
             
-            # Process each Notion record
+            # Convert each Notion record; pages that fail to convert are
+            # taken back out of created/updated below, like failed writes
+            rows = []
+            failed_ids = set()
             for notion_record in notion_records:
+                notion_id = self.get_source_id(notion_record)
                 try:
-                    notion_id = self.get_source_id(notion_record)
-                    
                     # Skip if Supabase has local changes that need to sync TO Notion
-                    existing_record = existing.get(notion_id)
-                    if existing_record and existing_record.get('last_sync_source') == 'supabase':
-                        self.logger.info(f"Skipping '{existing_record.get('title', 'Untitled')}' - has local Supabase changes pending sync to Notion")
-                        stats.skipped += 1
+                    if notion_id in pending_local:
+                        self.logger.info(f"Skipping '{existing[notion_id].get('title', 'Untitled')}' - has local Supabase changes pending sync to Notion")
+                        continue
+                    
+                    if notion_id in unchanged:
                         continue
                     
                     data = self.convert_from_source(notion_record)
+                    if hash_column:
+                        data[hash_column] = hashes[notion_id]
                     data['notion_page_id'] = notion_id
-                    data['notion_updated_at'] = notion_record.get('last_edited_time')
+                    data['notion_updated_at'] = notion_record.last_edited_time
                     data['last_sync_source'] = 'notion'
-                    data['updated_at'] = datetime.now(timezone.utc).isoformat()
-                    
-                    if notion_id in existing:
-                        stats.updated += 1
-                    else:
-                        stats.created += 1
-                    
-                    self.supabase.upsert(data, conflict_column='notion_page_id')
+                    data['updated_at'] = synced_at
+                    rows.append(data)
                     
                 except Exception as e:
-                    self.logger.error(f"Error processing record {notion_record.get('id')}: {e}")
-                    stats.errors += 1
+                    self.logger.error(f"Error processing record {notion_record.id}: {e}")
+                    failed_ids.add(notion_id)
+            
+            # Write them with bulk upserts, a few chunks in flight at a time;
+            # rows that could not be written count as errors, not writes
+            failed_ids.update(
+                data['notion_page_id']
+                for data in self._upsert_notion_rows(rows, max_workers=self.UPSERT_WORKERS)
+            )
+            stats.created -= len(failed_ids - existing_ids)
+            stats.updated -= len(failed_ids & existing_ids)
+            stats.errors += len(failed_ids)
             
             elapsed = time.time() - start_time
             result = SyncResult(
@@ -1747,6 +2609,18 @@ class OneWaySyncService(BaseSyncService):
                 error_message=str(e),
                 elapsed_seconds=time.time() - start_time
             )
+        finally:
+            # Write out buffered log rows whichever way the sync ended
+            self.sync_logger.flush()
+
+
+def _record_name(record: Dict) -> str:
+    """Human-readable name of a record for log messages, whatever the table."""
+    return (
+        record.get('title') or record.get('name')
+        or f"{record.get('first_name') or ''} {record.get('last_name') or ''}".strip()
+        or str(record.get('id', '(unknown)'))
+    )
 
 
 # ============================================================================
@@ -1776,32 +2650,40 @@ class TwoWaySyncService(BaseSyncService):
         Returns:
             List of records that need syncing to Notion
         """
-        result = []
-        for r in records:
-            # Skip soft-deleted records
-            if r.get('deleted_at'):
-                continue
-
-            if not r.get('notion_page_id'):
-                # New record - needs to be created in Notion
-                result.append(r)
-            elif r.get('last_sync_source') == 'supabase':
-                # Explicitly marked for sync
-                result.append(r)
-            elif r.get('last_sync_source') != 'notion':
-                # Only use timestamp comparison if last_sync_source is NOT 'notion'.
-                # After N→S sync sets last_sync_source='notion', the Supabase updated_at
-                # trigger makes updated_at slightly later than notion_updated_at, causing
-                # a false positive every cycle (the timestamp precision bug).
-                comparison = self.compare_timestamps(
-                    r.get('updated_at'),
-                    r.get('notion_updated_at')
-                )
-                if comparison > 0:
-                    name = r.get(name_field, r.get('name', 'Unknown'))
-                    self.logger.debug(f"Record '{name}' has local changes")
-                    result.append(r)
-        return result
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        return [r for r in records if self._needs_notion_sync(r, name_field, debug)]
+
+    def _needs_notion_sync(self, r: Dict, name_field: str, debug: bool) -> bool:
+        """Decide one record for filter_records_needing_notion_sync, cheapest checks first."""
+        # Skip soft-deleted records
+        if r.get('deleted_at'):
+            return False
+
+        if not r.get('notion_page_id'):
+            # New record - needs to be created in Notion
+            return True
+        last_sync_source = r.get('last_sync_source')
+        if last_sync_source == 'supabase':
+            # Explicitly marked for sync
+            return True
+        if last_sync_source == 'notion':
+            # Only use timestamp comparison if last_sync_source is NOT 'notion'.
+            # After N→S sync sets last_sync_source='notion', the Supabase updated_at
+            # trigger makes updated_at slightly later than notion_updated_at, causing
+            # a false positive every cycle (the timestamp precision bug).
+            return False
+
+        # Only rows whose last_sync_source is neither 'notion' nor 'supabase'
+        # (legacy rows without one, or other sources) get this far, so the
+        # parse cost is paid for those alone
+        if self.compare_timestamps_ns(
+            self._parse_ts_ns(r.get('updated_at')),
+            self._parse_ts_ns(r.get('notion_updated_at'))
+        ) <= 0:
+            return False
+        if debug:
+            self.logger.debug("Record '%s' has local changes", r.get(name_field, r.get('name', 'Unknown')))
+        return True
     
     def __init__(
         self,
@@ -1818,6 +2700,61 @@ class TwoWaySyncService(BaseSyncService):
     def get_source_id(self, source_record: Dict) -> str:
         return source_record.get('id', '')
     
+    # Full-table reads shared by the phases of one sync() run. None outside
+    # of sync(), so phases called on their own always fetch fresh data.
+    _phase_cache: Optional[Dict[str, List[Dict]]] = None
+    # Whether the running sync() is a full sync, i.e. will read the whole table anyway
+    _phase_full_sync: bool = False
+
+    # Opt-in: let incremental sync() return early when _has_pending_changes()
+    # finds nothing to do on either side. The pre-check applies the base
+    # _sync_supabase_to_notion rule (_pushes_to_notion); a service that
+    # overrides the phases should only opt in if its own rule never pushes
+    # a row that one rejects. Notion deletions are not seen by the
+    # pre-check, so on quiet days they wait for a run with other changes.
+    SKIP_UNCHANGED = False
+
+    def _all_notion_pages(self, metrics: Optional[SyncMetrics] = None) -> List[Dict]:
+        """Every page in the Notion database, fetched at most once per sync() run."""
+        cache = self._phase_cache
+        if cache is not None and 'notion' in cache:
+            return cache['notion']
+        pages = self.notion.query_database(self.notion_database_id)
+        if metrics:
+            metrics.notion_api_calls += 1
+        if cache is not None:
+            cache['notion'] = pages
+        return pages
+
+    def _all_supabase_rows(self, metrics: Optional[SyncMetrics] = None) -> List[Dict]:
+        """Every row in the Supabase table, fetched at most once per sync() run."""
+        cache = self._phase_cache
+        if cache is not None and 'supabase' in cache:
+            return cache['supabase']
+        rows = self.supabase.select_all()
+        if metrics:
+            metrics.supabase_api_calls += 1
+        if cache is not None:
+            cache['supabase'] = rows
+        return rows
+
+    def _supabase_by_notion_id(self, metrics: Optional[SyncMetrics] = None) -> Dict[str, Dict]:
+        """Supabase rows keyed by notion_page_id, built once per cached table read."""
+        cache = self._phase_cache
+        if cache is not None and 'supabase_index' in cache:
+            return cache['supabase_index']
+        index = {r['notion_page_id']: r for r in self._all_supabase_rows(metrics) if r.get('notion_page_id')}
+        if cache is not None:
+            cache['supabase_index'] = index
+        return index
+
+    def _invalidate_phase_cache(self, *sides: str):
+        """Drop cached reads (and indexes built from them) for sides a phase has just written to."""
+        if self._phase_cache is not None:
+            for side in sides:
+                self._phase_cache.pop(side, None)
+                self._phase_cache.pop(f'{side}_index', None)
+
     def _sync_notion_deletions(self) -> int:
         """
         Detect and sync deletions: Soft-delete Supabase records whose Notion pages were deleted.
@@ -1826,44 +2763,61 @@ class TwoWaySyncService(BaseSyncService):
         """
         deleted_count = 0
         
-        # Get all Supabase records that have a notion_page_id and are not already deleted
-        all_records = self.supabase.select_all()
-        linked_records = [r for r in all_records if r.get('notion_page_id') and not r.get('deleted_at')]
+        # Get all Supabase records that have a notion_page_id and are not already deleted.
+        # Full syncs read the whole table later anyway, so share that read; otherwise
+        # fetch just the linked rows' IDs. (notion_page_id is the upsert conflict key,
+        # so the index holds every linked row.)
+        if self._phase_full_sync or (self._phase_cache is not None and 'supabase' in self._phase_cache):
+            linked_by_page = {
+                page_id: r for page_id, r in self._supabase_by_notion_id().items() if not r.get('deleted_at')
+            }
+        else:
+            linked_by_page = {r['notion_page_id']: r for r in self.supabase.select_linked_active()}
         
-        if not linked_records:
+        if not linked_by_page:
             self.logger.info("No linked records to check for Notion deletions")
             return 0
         
-        self.logger.info(f"Checking {len(linked_records)} linked records for Notion deletions...")
+        self.logger.info(f"Checking {len(linked_by_page)} linked records for Notion deletions...")
         
-        # Get all current Notion page IDs
+        # Get all current Notion page IDs. As above, only keep full pages when a
+        # later phase will use them; otherwise build the ID set as pages stream in.
         try:
-            all_notion_pages = self.notion.query_database(self.notion_database_id)
-            notion_page_ids = {p['id'] for p in all_notion_pages}
+            if self._phase_full_sync or (self._phase_cache is not None and 'notion' in self._phase_cache):
+                notion_page_ids = {p['id'] for p in self._all_notion_pages()}
+            else:
+                notion_page_ids = set(self.notion.iter_page_ids(self.notion_database_id))
             self.logger.info(f"Found {len(notion_page_ids)} pages in Notion database")
         except Exception as e:
             self.logger.error(f"Failed to query Notion database: {e}")
             return 0
         
         # Find orphaned records (Supabase has notion_page_id but page no longer exists in Notion)
-        for record in linked_records:
-            notion_page_id = record.get('notion_page_id')
+        # Sorted so the write order (and the log) is stable from run to run
+        orphans = [linked_by_page[page_id] for page_id in sorted(linked_by_page.keys() - notion_page_ids)]
+        if orphans:
+            # Soft-delete and unlink in the same write, batched across all orphans
+            unlink = {
+                'deleted_at': datetime.now(timezone.utc).isoformat(),
+                'notion_page_id': None,
+                'notion_updated_at': None
+            }
+            try:
+                self.supabase.update_many([r['id'] for r in orphans], unlink)
+                deleted = orphans
+            except Exception as e:
+                self.logger.warning(f"Batch soft-delete failed, retrying individually: {e}")
+                deleted = []
+                for record in orphans:
+                    try:
+                        self.supabase.update(record['id'], unlink)
+                        deleted.append(record)
+                    except Exception as e:
+                        self.logger.error(f"Failed to soft-delete record {record['id']}: {e}")
             
-            if notion_page_id not in notion_page_ids:
-                # Page was deleted in Notion - soft-delete in Supabase
-                record_id = record.get('id')
-                record_name = record.get('title') or record.get('name') or record.get('first_name', '') + ' ' + record.get('last_name', '')
-                
-                try:
-                    self.supabase.soft_delete(record_id)
-                    self.supabase.update(record_id, {
-                        'notion_page_id': None,
-                        'notion_updated_at': None
-                    })
-                    deleted_count += 1
-                    self.logger.info(f"Soft-deleted '{record_name}' (Notion page was deleted)")
-                except Exception as e:
-                    self.logger.error(f"Failed to soft-delete record {record_id}: {e}")
+            for record in deleted:
+                self.logger.info("Soft-deleted '%s' (Notion page was deleted)", _record_name(record))
+            deleted_count = len(deleted)
         
         if deleted_count > 0:
             self.logger.info(f"Soft-deleted {deleted_count} records (Notion pages were deleted)")
@@ -1889,31 +2843,41 @@ class TwoWaySyncService(BaseSyncService):
         
         self.logger.info(f"Found {len(deleted_records)} deleted records to archive in Notion")
         
-        for record in deleted_records:
-            record_id = record.get('id')
-            notion_page_id = record.get('notion_page_id')
-            record_name = record.get('title') or record.get('name') or record.get('first_name', '') + ' ' + record.get('last_name', '')
-            
+        # Records whose pages are gone from Notion, either archived now or already
+        to_clear: List[Dict] = []
+        with ThreadPoolExecutor(max_workers=self.NOTION_WRITE_WORKERS) as pool:
+            futures = [
+                pool.submit(copy_context().run, self.notion.archive_page, record.get('notion_page_id'))
+                for record in deleted_records
+            ]
+            for record, future in zip(deleted_records, futures):
+                try:
+                    future.result()
+                    self.logger.info("Archived Notion page for deleted record: %s", _record_name(record))
+                    to_clear.append(record)
+                except Exception as e:
+                    # Page might not exist any more (archive_page already
+                    # treats "archived"/"in trash" 400s as success)
+                    error_str = str(e).lower()
+                    if "404" in error_str or "archived" in error_str or "trash" in error_str:
+                        self.logger.info("Notion page already archived/deleted: %s", _record_name(record))
+                        to_clear.append(record)  # Count as archived since end state is same
+                    else:
+                        self.logger.error(f"Error archiving Notion page for {_record_name(record)}: {e}")
+        
+        # Clear the notion_page_id so we don't try again
+        if to_clear:
             try:
-                # Archive the Notion page
-                self.notion.archive_page(notion_page_id)
-                self.logger.info(f"Archived Notion page for deleted record: {record_name}")
-                
-                # Clear the notion_page_id so we don't try again
-                self.supabase.clear_notion_page_id(record_id)
-                
-                archived += 1
-                
+                self.supabase.clear_notion_page_ids([r['id'] for r in to_clear])
+                archived = len(to_clear)
             except Exception as e:
-                # Page might already be archived, in trash, or not exist
-                # 400 = already archived, 404 = not found
-                error_str = str(e).lower()
-                if "404" in error_str or "400" in error_str or "archived" in error_str or "trash" in error_str:
-                    self.logger.info(f"Notion page already archived/deleted: {record_name}")
-                    self.supabase.clear_notion_page_id(record_id)
-                    archived += 1  # Count as archived since end state is same
-                else:
-                    self.logger.error(f"Error archiving Notion page for {record_name}: {e}")
+                self.logger.warning(f"Batch notion_page_id clear failed, retrying individually: {e}")
+                for record in to_clear:
+                    try:
+                        self.supabase.clear_notion_page_id(record['id'])
+                        archived += 1
+                    except Exception as e:
+                        self.logger.error(f"Failed to clear notion_page_id for {_record_name(record)}: {e}")
         
         if archived > 0:
             self.logger.info(f"Archived {archived} Notion pages for deleted records")
@@ -1925,6 +2889,94 @@ class TwoWaySyncService(BaseSyncService):
         Bidirectional sync between Notion and Supabase with comprehensive metrics.
         """
         metrics = SyncMetrics()
+        metrics_token = _current_metrics.set(metrics)
+        self._phase_cache = {}
+        self._phase_full_sync = full_sync
+        try:
+            if self.SKIP_UNCHANGED and not full_sync and not self._has_pending_changes(since_hours):
+                self.logger.info(f"No changes in the last {since_hours}h on either side - skipping sync")
+                metrics.finish()
+                return SyncResult(success=True, direction="bidirectional", metrics=metrics)
+            return self._run_phases(full_sync, since_hours, metrics)
+        finally:
+            # Write out buffered log rows whichever way the sync ended
+            self.sync_logger.flush()
+            self._phase_cache = None
+            self._phase_full_sync = False
+            _current_metrics.reset(metrics_token)
+
+    def _pushes_to_notion(self, r: Dict) -> bool:
+        """Whether _sync_supabase_to_notion writes this record to Notion."""
+        # Skip soft-deleted records
+        if r.get('deleted_at'):
+            return False
+
+        # New records without notion_page_id always need syncing
+        if not r.get('notion_page_id'):
+            return True
+
+        # Explicitly marked for sync to Notion
+        if r.get('last_sync_source') == 'supabase':
+            return True
+
+        # Skip if last_sync_source is 'notion' — this means the record was
+        # just synced FROM Notion. The Supabase updated_at trigger fires after
+        # the stamp-back update, making updated_at slightly > notion_updated_at,
+        # which would cause a false positive every cycle.
+        if r.get('last_sync_source') == 'notion':
+            return False
+
+        # For other records, check if Supabase is newer than last Notion sync
+        notion_updated_at = r.get('notion_updated_at')
+        if not notion_updated_at:
+            # No notion timestamp means it was created but never synced back
+            return True
+
+        # Compare timestamps with buffer, on integer nanoseconds like
+        # _needs_notion_sync
+        return self.compare_timestamps_ns(
+            self._parse_ts_ns(r.get('updated_at')),
+            self._parse_ts_ns(notion_updated_at)
+        ) > 0
+
+    def _has_pending_changes(self, since_hours: int) -> bool:
+        """Cheap pre-check for incremental syncs: can any phase have work to do?
+
+        Costs one single-page Notion query, one Supabase count and a projected
+        read of the rows whose sync source is neither side. Notion
+        deletions cannot be seen this way (deleted pages just drop out of
+        queries); they are picked up by the next run that has other changes,
+        or by a full sync. Any error counts as "changes pending".
+        """
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=since_hours)).isoformat()
+        try:
+            if self.notion.count_pages(
+                self.notion_database_id,
+                filter={"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": cutoff}},
+                limit=1
+            ):
+                return True
+            # Rows _pushes_to_notion always accepts (new local rows, local
+            # edits) and deletions still to archive
+            if self.supabase.count({"or": (
+                "(and(deleted_at.is.null,or(notion_page_id.is.null,last_sync_source.eq.supabase)),"
+                "and(deleted_at.not.is.null,notion_page_id.not.is.null))"
+            )}):
+                return True
+            # Any other source (or none) is decided by comparing updated_at with
+            # notion_updated_at, which PostgREST cannot do across columns: fetch
+            # just those rows and apply the same rule as the Supabase → Notion phase
+            candidates = self.supabase.select_linked_active(
+                columns="id,notion_page_id,deleted_at,last_sync_source,updated_at,notion_updated_at",
+                filters={"or": "(last_sync_source.is.null,last_sync_source.not.in.(notion,supabase))"}
+            )
+            return any(self._pushes_to_notion(r) for r in candidates)
+        except Exception as e:
+            self.logger.warning(f"Change pre-check failed, syncing anyway: {format_exception(e)}")
+            return True
+
+    def _run_phases(self, full_sync: bool, since_hours: int, metrics: SyncMetrics) -> SyncResult:
+        """Run the deletion and both sync-direction phases of sync()."""
         start_time = time.time()
         
         # Step 0a: Sync Notion deletions → Supabase (soft-delete)
@@ -1932,18 +2984,25 @@ class TwoWaySyncService(BaseSyncService):
         phase_start = time.time()
         notion_deletions = self._sync_notion_deletions()
         metrics.notion_deletions_duration = time.time() - phase_start
+        if notion_deletions:
+            self._invalidate_phase_cache('supabase')
         
         # Step 0b: Sync Supabase deletions → Notion (archive)
         self.logger.info("Phase 0b: Sync Supabase Deletions → Notion")
         phase_start = time.time()
         supabase_deletions = self._sync_supabase_deletions()
         metrics.supabase_deletions_duration = time.time() - phase_start
+        if supabase_deletions:
+            self._invalidate_phase_cache('notion', 'supabase')
         
         # Step 1: Notion → Supabase
         self.logger.info("Phase 1: Notion → Supabase")
         phase_start = time.time()
         result1 = self._sync_notion_to_supabase(full_sync, since_hours, metrics)
         metrics.notion_to_supabase_duration = time.time() - phase_start
+        if result1.stats.created or result1.stats.updated or result1.stats.errors:
+            # Errors may still have written part of the batch
+            self._invalidate_phase_cache('supabase')
         
         # Step 2: Supabase → Notion  
         self.logger.info("Phase 2: Supabase → Notion")
@@ -1980,6 +3039,7 @@ class TwoWaySyncService(BaseSyncService):
         """Sync from Notion to Supabase with metrics tracking."""
         stats = SyncStats()
         start_time = time.time()
+        sync_started_iso = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
         
         try:
             # Build filter
@@ -1991,12 +3051,24 @@ class TwoWaySyncService(BaseSyncService):
                     "last_edited_time": {"after": cutoff}
                 }
             
-            # Fetch from Notion
-            notion_records = self.notion.query_database(self.notion_database_id, filter=filter_query)
+            # Fetch from Notion, reusing the full page list when an earlier
+            # phase of this run already downloaded it
+            cached_pages = self._phase_cache.get('notion') if self._phase_cache is not None else None
+            if full_sync:
+                notion_records = self._all_notion_pages(metrics)
+            elif cached_pages is not None:
+                cutoff_ns = self._parse_ts_ns(cutoff)
+                notion_records = [
+                    p for p in cached_pages
+                    if (self._parse_ts_ns(p.get('last_edited_time')) or 0) > cutoff_ns
+                ]
+            else:
+                notion_records = self.notion.query_database(self.notion_database_id, filter=filter_query)
+                if metrics:
+                    metrics.notion_api_calls += 1
             self.logger.info(f"Found {len(notion_records)} records in Notion")
             
             if metrics:
-                metrics.notion_api_calls += 1
                 metrics.source_total = len(notion_records)
                 metrics.records_read += len(notion_records)
                 # Track staleness - find newest change in Notion
@@ -2007,19 +3079,46 @@ class TwoWaySyncService(BaseSyncService):
                     except (ValueError, AttributeError):
                         pass  # Invalid date format or None
             
-            # Get existing for comparison
-            existing = {r['notion_page_id']: r for r in self.supabase.select_all() if r.get('notion_page_id')}
+            # Safety valve (full sync only) - decided from a server-side count
+            # so an aborted sync never downloads the destination table
+            if full_sync:
+                dest_count = self.supabase.count({"notion_page_id": "not.is.null"})
+                if metrics:
+                    metrics.supabase_api_calls += 1
+                is_safe, msg = self.check_safety_valve(len(notion_records), dest_count, "Notion → Supabase")
+                if not is_safe:
+                    self.logger.error(msg)
+                    return SyncResult(success=False, direction="notion_to_supabase", error_message=msg)
+
+            # Get existing for comparison. Incremental syncs only look up the
+            # rows linked to the pages that actually changed.
+            if full_sync:
+                existing = self._supabase_by_notion_id(metrics)
+            else:
+                notion_ids = [self.get_source_id(r) for r in notion_records]
+                existing_rows = self.supabase.select_in(
+                    'notion_page_id', notion_ids,
+                    columns='notion_page_id,notion_updated_at,last_sync_source'
+                )
+                existing = {r['notion_page_id']: r for r in existing_rows if r.get('notion_page_id')}
+                if metrics:
+                    metrics.supabase_api_calls += -(-len(set(notion_ids)) // SupabaseClient.ID_FILTER_CHUNK_SIZE)
             if metrics:
-                metrics.supabase_api_calls += 1
-                metrics.destination_total = len(existing)
-            
-            # Safety valve
-            is_safe, msg = self.check_safety_valve(len(notion_records), len(existing), "Notion → Supabase")
-            if not is_safe and full_sync:
-                self.logger.error(msg)
-                return SyncResult(success=False, direction="notion_to_supabase", error_message=msg)
-            
-            # Process records
+                # existing holds the whole table only on full syncs
+                if full_sync:
+                    metrics.destination_total = len(existing)
+                else:
+                    metrics.destination_total = self.supabase.count({"notion_page_id": "not.is.null"})
+                    metrics.supabase_api_calls += 1
+            # Parsed once up front so the loop below compares integers
+            existing_ns = {
+                nid: self._parse_ts_ns(r.get('notion_updated_at'))
+                for nid, r in existing.items()
+            }
+
+            # Process records. Converted rows are collected and written in
+            # bulk below instead of one upsert round trip per record.
+            to_upsert: List[Dict] = []
             for notion_record in notion_records:
                 try:
                     notion_id = self.get_source_id(notion_record)
@@ -2034,9 +3133,9 @@ class TwoWaySyncService(BaseSyncService):
                             stats.skipped += 1
                             continue
 
-                        comparison = self.compare_timestamps(
-                            notion_record.get('last_edited_time'),
-                            existing_record.get('notion_updated_at')
+                        comparison = self.compare_timestamps_ns(
+                            self._parse_ts_ns(notion_record.get('last_edited_time')),
+                            existing_ns[notion_id]
                         )
                         if comparison <= 0:
                             stats.skipped += 1
@@ -2052,16 +3151,18 @@ class TwoWaySyncService(BaseSyncService):
                     data['notion_page_id'] = notion_id
                     data['notion_updated_at'] = notion_record.get('last_edited_time')
                     data['last_sync_source'] = 'notion'
-                    data['updated_at'] = datetime.now(timezone.utc).isoformat()
-                    
-                    self.supabase.upsert(data, conflict_column='notion_page_id')
-                    if metrics:
-                        metrics.supabase_api_calls += 1
+                    data['updated_at'] = sync_started_iso
+                    to_upsert.append(data)
                     
                 except Exception as e:
                     self.logger.error(f"Error syncing from Notion: {format_exception(e)}")
                     stats.errors += 1
 
+            failed_ids = {data['notion_page_id'] for data in self._upsert_notion_rows(to_upsert, metrics)}
+            stats.created -= len(failed_ids - existing.keys())
+            stats.updated -= len(failed_ids & existing.keys())
+            stats.errors += len(failed_ids)
+
             return SyncResult(
                 success=True,
                 direction="notion_to_supabase",
@@ -2072,6 +3173,53 @@ class TwoWaySyncService(BaseSyncService):
         except Exception as e:
             return SyncResult(success=False, direction="notion_to_supabase", error_message=format_exception(e))
     
+    NOTION_WRITE_WORKERS = 3  # Concurrent page writes, matching Notion's ~3 requests/second budget
+
+    def _write_notion_page(self, record: Dict) -> Dict:
+        """Update the record's Notion page, or create one if it is not linked yet."""
+        notion_props = self.convert_to_source(record)
+        notion_page_id = record.get('notion_page_id')
+        if notion_page_id:
+            return self.notion.update_page(notion_page_id, notion_props)
+        return self.notion.create_page(self.notion_database_id, notion_props)
+
+    def _stamp_back_synced(self, record_ids: List[str], metrics: Optional[SyncMetrics] = None) -> int:
+        """Mark records whose Notion pages were just updated as synced, in one batched write.
+
+        Stamps with NOW() to prevent re-sync loops. IMPORTANT: Use current UTC
+        time, NOT Notion's last_edited_time (which has minute precision). This
+        avoids a loop where updated_at (ms precision) > notion_updated_at
+        (minute precision). Falls back to one update per record if the batch
+        is rejected.
+
+        Returns:
+            Number of records that could not be stamped.
+        """
+        if not record_ids:
+            return 0
+        stamp = {
+            'notion_updated_at': datetime.now(timezone.utc).isoformat(),
+            'last_sync_source': 'notion'
+        }
+        try:
+            self.supabase.update_many(record_ids, stamp)
+            if metrics:
+                metrics.supabase_api_calls += -(-len(record_ids) // SupabaseClient.ID_FILTER_CHUNK_SIZE)
+            return 0
+        except Exception as e:
+            self.logger.warning(f"Batch stamp-back failed, retrying individually: {format_exception(e)}")
+
+        errors = 0
+        for record_id in record_ids:
+            try:
+                self.supabase.update(record_id, stamp)
+                if metrics:
+                    metrics.supabase_api_calls += 1
+            except Exception as e:
+                self.logger.error(f"Error stamping back {record_id}: {format_exception(e)}")
+                errors += 1
+        return errors
+
     def _sync_supabase_to_notion(self, full_sync: bool, since_hours: int, metrics: Optional[SyncMetrics] = None) -> SyncResult:
         """Sync from Supabase to Notion with metrics tracking."""
         stats = SyncStats()
@@ -2080,107 +3228,74 @@ class TwoWaySyncService(BaseSyncService):
         try:
             # Get Supabase records that need syncing
             if full_sync:
-                supabase_records = self.supabase.select_all()
+                supabase_records = self._all_supabase_rows(metrics)
             else:
                 cutoff = datetime.now(timezone.utc) - timedelta(hours=since_hours)
                 supabase_records = self.supabase.select_updated_since(cutoff)
-            
-            if metrics:
-                metrics.supabase_api_calls += 1
+                if metrics:
+                    metrics.supabase_api_calls += 1
             
             # Filter to records that need syncing to Notion
-            records_to_sync = []
-            for r in supabase_records:
-                # Skip soft-deleted records
-                if r.get('deleted_at'):
-                    continue
-
-                # New records without notion_page_id always need syncing
-                if not r.get('notion_page_id'):
-                    records_to_sync.append(r)
-                    continue
-
-                # Explicitly marked for sync to Notion
-                if r.get('last_sync_source') == 'supabase':
-                    records_to_sync.append(r)
-                    continue
-
-                # Skip if last_sync_source is 'notion' — this means the record was
-                # just synced FROM Notion. The Supabase updated_at trigger fires after
-                # the stamp-back update, making updated_at slightly > notion_updated_at,
-                # which would cause a false positive every cycle.
-                if r.get('last_sync_source') == 'notion':
-                    continue
-
-                # For other records, check if Supabase is newer than last Notion sync
-                updated_at = r.get('updated_at')
-                notion_updated_at = r.get('notion_updated_at')
-
-                if not notion_updated_at:
-                    # No notion timestamp means it was created but never synced back
-                    records_to_sync.append(r)
-                    continue
-
-                # Compare timestamps with buffer
-                comparison = self.compare_timestamps(updated_at, notion_updated_at)
-                if comparison > 0:
-                    records_to_sync.append(r)
+            records_to_sync = [r for r in supabase_records if self._pushes_to_notion(r)]
             
             self.logger.info(f"Found {len(records_to_sync)} records to sync to Notion")
             
-            # Safety valve
-            notion_records = self.notion.query_database(self.notion_database_id)
-            if metrics:
-                metrics.notion_api_calls += 1
-            
-            is_safe, msg = self.check_safety_valve(len(records_to_sync), len(notion_records), "Supabase → Notion")
-            # For Supabase→Notion we don't abort, just warn
-            if not is_safe:
-                self.logger.warning(msg)
+            # Safety valve. Only the page count matters here: reuse the page
+            # list if this run already has it, otherwise count just far
+            # enough to settle the check
+            if records_to_sync:
+                cached_pages = self._phase_cache.get('notion') if self._phase_cache is not None else None
+                if cached_pages is not None:
+                    notion_count = len(cached_pages)
+                else:
+                    notion_count = self.notion.count_pages(
+                        self.notion_database_id,
+                        limit=self.safety_valve_count_limit(len(records_to_sync))
+                    )
+                    if metrics:
+                        metrics.notion_api_calls += 1
+
+                is_safe, msg = self.check_safety_valve(len(records_to_sync), notion_count, "Supabase → Notion")
+                # For Supabase→Notion we don't abort, just warn
+                if not is_safe:
+                    self.logger.warning(msg)
             
-            for record in records_to_sync:
-                try:
-                    notion_page_id = record.get('notion_page_id')
-                    notion_props = self.convert_to_source(record)
-                    
-                    if notion_page_id:
-                        # Update existing
-                        updated_page = self.notion.update_page(notion_page_id, notion_props)
+            # IDs of updated pages, stamped back together once all Notion writes are done
+            stamp_back: List[str] = []
+            with ThreadPoolExecutor(max_workers=self.NOTION_WRITE_WORKERS) as pool:
+                # Each write runs in a copy of the caller's context so retries
+                # are still counted against the running sync's metrics
+                futures = [
+                    pool.submit(copy_context().run, self._write_notion_page, record)
+                    for record in records_to_sync
+                ]
+                for record, future in zip(records_to_sync, futures):
+                    try:
+                        page = future.result()
                         if metrics:
                             metrics.notion_api_calls += 1
 
-                        # Stamp back with NOW() to prevent re-sync loops.
-                        # IMPORTANT: Use current UTC time, NOT Notion's last_edited_time
-                        # (which has minute precision). This avoids a loop where updated_at
-                        # (ms precision) > notion_updated_at (minute precision).
-                        now_utc = datetime.now(timezone.utc).isoformat()
-                        self.supabase.update(record['id'], {
-                            'notion_updated_at': now_utc,
-                            'last_sync_source': 'notion'
-                        })
-                        if metrics:
-                            metrics.supabase_api_calls += 1
-
-                        stats.updated += 1
-                    else:
-                        # Create new
-                        new_page = self.notion.create_page(self.notion_database_id, notion_props)
-                        if metrics:
-                            metrics.notion_api_calls += 1
-                        # Update Supabase with new Notion ID
-                        now_utc = datetime.now(timezone.utc).isoformat()
-                        self.supabase.update(record['id'], {
-                            'notion_page_id': new_page['id'],
-                            'notion_updated_at': now_utc,
-                            'last_sync_source': 'notion'
-                        })
-                        if metrics:
-                            metrics.supabase_api_calls += 1
-                        stats.created += 1
-                    
-                except Exception as e:
-                    self.logger.error(f"Error syncing to Notion: {format_exception(e)}")
-                    stats.errors += 1
+                        if record.get('notion_page_id'):
+                            stamp_back.append(record['id'])
+                            stats.updated += 1
+                        else:
+                            # Store the new Notion ID right away: a page created but
+                            # not linked would be created again on the next run
+                            now_utc = datetime.now(timezone.utc).isoformat()
+                            self.supabase.update(record['id'], {
+                                'notion_page_id': page['id'],
+                                'notion_updated_at': now_utc,
+                                'last_sync_source': 'notion'
+                            })
+                            if metrics:
+                                metrics.supabase_api_calls += 1
+                            stats.created += 1
+
+                    except Exception as e:
+                        self.logger.error(f"Error syncing to Notion: {format_exception(e)}")
+                        stats.errors += 1
+
+            stats.errors += self._stamp_back_synced(stamp_back, metrics)
 
             return SyncResult(
                 success=True,
@@ -2217,6 +3332,7 @@ __all__ = [
     'SUPABASE_URL',
     'SUPABASE_KEY',
     'SAFETY_VALVE_THRESHOLD',
+    'SAFETY_VALVE_THRESHOLD_BP',
     'SAFETY_VALVE_MIN_RECORDS',
     'SAFETY_VALVE_MODE',
     
@@ -2232,6 +3348,7 @@ __all__ = [
     'SyncStats',
     'SyncMetrics',
     'SyncResult',
+    'NotionPage',
     
     # Clients
     'NotionClient',
@@ -16,7 +16,10 @@ Storage: sync_state table in Supabase (already exists)
 Key format: "{entity}_sync_cursor" → ISO timestamp
 """
 
+import asyncio
+import atexit
 import logging
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
@@ -28,6 +31,17 @@ logger = logging.getLogger(__name__)
 # Notion API
 NOTION_API_TOKEN = os.environ.get('NOTION_API_TOKEN')
 
+NOTION_HEADERS = {
+    'Authorization': f'Bearer {NOTION_API_TOKEN}',
+    'Notion-Version': '2022-06-28',
+    'Content-Type': 'application/json'
+}
+
+# One pooled HTTP/2 client for every change check, so only the first check
+# of the process pays for the TCP + TLS handshake
+_NOTION_CLIENT = httpx.Client(timeout=10.0, http2=True, headers=NOTION_HEADERS)
+atexit.register(_NOTION_CLIENT.close)
+
 # Database IDs - MUST match the respective sync service modules exactly
 NOTION_DB_IDS = {
     'meetings': os.environ.get('NOTION_MEETING_DB_ID', '297cd3f1-eb28-810f-86f0-f142f7e3a5ca'),
@@ -50,12 +64,29 @@ class ChangeCheckResult:
     skipped_reason: Optional[str] = None
 
 
+# Cursors read within the last CURSOR_CACHE_TTL_SECONDS are served from
+# memory: entity -> (cursor, monotonic time it was read or written)
+CURSOR_CACHE_TTL_SECONDS = 60.0
+_cursor_cache: Dict[str, Tuple[Optional[datetime], float]] = {}
+
+
+def clear_cursor_cache():
+    """Forget every cached sync cursor."""
+    _cursor_cache.clear()
+
+
 def get_sync_cursor(supabase_client, entity: str) -> Optional[datetime]:
     """Get the last sync timestamp for an entity."""
+    cached = _cursor_cache.get(entity)
+    if cached and time.monotonic() - cached[1] < CURSOR_CACHE_TTL_SECONDS:
+        return cached[0]
     try:
         result = supabase_client.table('sync_state').select('value').eq('key', f'{entity}_sync_cursor').execute()
+        cursor = None
         if result.data and result.data[0].get('value'):
-            return datetime.fromisoformat(result.data[0]['value'].replace('Z', '+00:00'))
+            cursor = datetime.fromisoformat(result.data[0]['value'].replace('Z', '+00:00'))
+        _cursor_cache[entity] = (cursor, time.monotonic())
+        return cursor
     except Exception as e:
         logger.warning(f"Could not get sync cursor for {entity}: {e}")
     return None
@@ -69,11 +100,35 @@ def set_sync_cursor(supabase_client, entity: str, timestamp: datetime):
             'value': timestamp.isoformat(),
             'updated_at': datetime.now(timezone.utc).isoformat()
         }).execute()
+        _cursor_cache[entity] = (timestamp, time.monotonic())
         logger.debug(f"Updated sync cursor for {entity} to {timestamp}")
     except Exception as e:
+        _cursor_cache.pop(entity, None)
         logger.warning(f"Could not update sync cursor for {entity}: {e}")
 
 
+def _notion_changes_query(since: datetime) -> Dict:
+    """Request body for a one-result query of pages edited after `since`."""
+    return {
+        'filter': {
+            'timestamp': 'last_edited_time',
+            'last_edited_time': {'after': since.isoformat()}
+        },
+        'page_size': 1  # We only need count, not data
+    }
+
+
+def _notion_changes_from_response(data: Dict) -> int:
+    """Interpret a _notion_changes_query response as a change count."""
+    # If has_more is True, there are definitely changes
+    # Otherwise, count the results (0 or 1)
+    if data.get('has_more'):
+        # More than 1 change - we know we need to sync
+        # Could paginate to get exact count, but >1 is enough to trigger sync
+        return 100  # Signal "multiple changes"
+    return len(data.get('results', []))
+
+
 def count_notion_changes_since(database_id: str, since: datetime) -> int:
     """
     Count records in Notion modified since the given timestamp.
@@ -84,33 +139,32 @@ def count_notion_changes_since(database_id: str, since: datetime) -> int:
         return -1  # Unknown
     
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                f'https://api.notion.com/v1/databases/{database_id}/query',
-                headers={
-                    'Authorization': f'Bearer {NOTION_API_TOKEN}',
-                    'Notion-Version': '2022-06-28',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'filter': {
-                        'timestamp': 'last_edited_time',
-                        'last_edited_time': {'after': since.isoformat()}
-                    },
-                    'page_size': 1  # We only need count, not data
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # If has_more is True, there are definitely changes
-            # Otherwise, count the results (0 or 1)
-            if data.get('has_more'):
-                # More than 1 change - we know we need to sync
-                # Could paginate to get exact count, but >1 is enough to trigger sync
-                return 100  # Signal "multiple changes"
-            return len(data.get('results', []))
-            
+        response = _NOTION_CLIENT.post(
+            f'https://api.notion.com/v1/databases/{database_id}/query',
+            json=_notion_changes_query(since)
+        )
+        response.raise_for_status()
+        return _notion_changes_from_response(response.json())
+        
+    except Exception as e:
+        logger.warning(f"Error checking Notion changes: {e}")
+        return -1  # Unknown - should sync to be safe
+
+
+async def _count_notion_changes_async(client: httpx.AsyncClient, database_id: str, since: datetime) -> int:
+    """count_notion_changes_since on a caller-provided async client."""
+    if not NOTION_API_TOKEN:
+        logger.warning("No Notion API token - cannot check for changes")
+        return -1  # Unknown
+    
+    try:
+        response = await client.post(
+            f'https://api.notion.com/v1/databases/{database_id}/query',
+            json=_notion_changes_query(since)
+        )
+        response.raise_for_status()
+        return _notion_changes_from_response(response.json())
+        
     except Exception as e:
         logger.warning(f"Error checking Notion changes: {e}")
         return -1  # Unknown - should sync to be safe
@@ -136,55 +190,14 @@ def count_supabase_changes_since(supabase_client, table: str, since: datetime) -
         return -1  # Unknown
 
 
-def check_for_changes(supabase_client, entity: str) -> ChangeCheckResult:
-    """
-    Check if there are any changes to sync for an entity.
-    Returns quickly if no changes detected.
-    
-    Args:
-        supabase_client: Supabase client instance
-        entity: One of 'meetings', 'tasks', 'reflections', 'journals'
-    
-    Returns:
-        ChangeCheckResult with has_changes=True/False
-    """
-    import time
-    start_time = time.time()
-    
-    # Get database ID
-    database_id = NOTION_DB_IDS.get(entity)
-    if not database_id:
-        return ChangeCheckResult(
-            entity=entity,
-            has_changes=True,  # Unknown entity - sync to be safe
-            notion_changes=-1,
-            supabase_changes=-1,
-            last_cursor=None,
-            check_duration_ms=(time.time() - start_time) * 1000,
-            skipped_reason="Unknown entity"
-        )
-    
-    # Get last sync cursor
-    cursor = get_sync_cursor(supabase_client, entity)
-    
-    # If no cursor, this is first sync - must run
-    if not cursor:
-        return ChangeCheckResult(
-            entity=entity,
-            has_changes=True,
-            notion_changes=-1,
-            supabase_changes=-1,
-            last_cursor=None,
-            check_duration_ms=(time.time() - start_time) * 1000,
-            skipped_reason="No cursor - first sync"
-        )
-    
-    # Check Notion for changes
-    notion_changes = count_notion_changes_since(database_id, cursor)
-    
-    # Check Supabase for changes
-    supabase_changes = count_supabase_changes_since(supabase_client, entity, cursor)
-    
+def _change_check_result(
+    entity: str,
+    cursor: Optional[datetime],
+    notion_changes: int,
+    supabase_changes: int,
+    start_time: float
+) -> ChangeCheckResult:
+    """Decide whether an entity needs syncing from its change counts."""
     # Determine if sync needed
     # -1 means error/unknown - sync to be safe
     # Contacts always sync: Google changes (new phone contacts, edits) are
@@ -215,15 +228,103 @@ def check_for_changes(supabase_client, entity: str) -> ChangeCheckResult:
     )
 
 
+def _precheck_result(entity: str, cursor: Optional[datetime], start_time: float) -> Optional[ChangeCheckResult]:
+    """Result for entities that must sync without counting changes, else None."""
+    if entity not in NOTION_DB_IDS:
+        reason = "Unknown entity"  # Unknown entity - sync to be safe
+    elif not cursor:
+        reason = "No cursor - first sync"  # If no cursor, this is first sync - must run
+    else:
+        return None
+    return ChangeCheckResult(
+        entity=entity,
+        has_changes=True,
+        notion_changes=-1,
+        supabase_changes=-1,
+        last_cursor=None,
+        check_duration_ms=(time.time() - start_time) * 1000,
+        skipped_reason=reason
+    )
+
+
+def check_for_changes(supabase_client, entity: str) -> ChangeCheckResult:
+    """
+    Check if there are any changes to sync for an entity.
+    Returns quickly if no changes detected.
+    
+    Args:
+        supabase_client: Supabase client instance
+        entity: One of 'meetings', 'tasks', 'reflections', 'journals'
+    
+    Returns:
+        ChangeCheckResult with has_changes=True/False
+    """
+    start_time = time.time()
+    
+    # Get last sync cursor
+    cursor = get_sync_cursor(supabase_client, entity) if entity in NOTION_DB_IDS else None
+    precheck = _precheck_result(entity, cursor, start_time)
+    if precheck:
+        return precheck
+    
+    # Check Notion for changes
+    notion_changes = count_notion_changes_since(NOTION_DB_IDS[entity], cursor)
+    
+    # Check Supabase for changes
+    supabase_changes = count_supabase_changes_since(supabase_client, entity, cursor)
+    
+    return _change_check_result(entity, cursor, notion_changes, supabase_changes, start_time)
+
+
+async def _check_for_changes_async(
+    supabase_client,
+    notion_client: httpx.AsyncClient,
+    entity: str
+) -> ChangeCheckResult:
+    """check_for_changes with the Notion and Supabase counts in flight together."""
+    start_time = time.time()
+    
+    cursor = await asyncio.to_thread(get_sync_cursor, supabase_client, entity)
+    precheck = _precheck_result(entity, cursor, start_time)
+    if precheck:
+        return precheck
+    
+    # The Supabase client is synchronous, so its count runs in a worker
+    # thread while the Notion count goes out on the shared async client
+    notion_changes, supabase_changes = await asyncio.gather(
+        _count_notion_changes_async(notion_client, NOTION_DB_IDS[entity], cursor),
+        asyncio.to_thread(count_supabase_changes_since, supabase_client, entity, cursor)
+    )
+    
+    return _change_check_result(entity, cursor, notion_changes, supabase_changes, start_time)
+
+
+async def check_all_entities_async(supabase_client) -> Dict[str, ChangeCheckResult]:
+    """
+    Check all entities for changes.
+    Returns a dict of entity -> ChangeCheckResult, in NOTION_DB_IDS order.
+
+    Every entity is checked at once and the Notion queries share one HTTP/2
+    connection, so the total takes about as long as the slowest check.
+    """
+    entities = list(NOTION_DB_IDS)
+    async with httpx.AsyncClient(timeout=10.0, http2=True, headers=NOTION_HEADERS) as notion_client:
+        checks = await asyncio.gather(*[
+            _check_for_changes_async(supabase_client, notion_client, entity)
+            for entity in entities
+        ])
+    return dict(zip(entities, checks))
+
+
 def check_all_entities(supabase_client) -> Dict[str, ChangeCheckResult]:
     """
     Check all entities for changes.
     Returns a dict of entity -> ChangeCheckResult
+
+    Synchronous wrapper around check_all_entities_async; must not be called
+    from a running event loop (await check_all_entities_async there instead).
     """
-    results = {}
-    for entity in NOTION_DB_IDS.keys():
-        results[entity] = check_for_changes(supabase_client, entity)
-    return results
+    return asyncio.run(check_all_entities_async(supabase_client))
 
 
 def update_cursor_after_sync(supabase_client, entity: str, sync_completed_at: datetime = None):
@@ -7,22 +7,27 @@ from lib.google_contacts import (
     create_contact,
     update_contact,
     delete_contact,
-    format_exception,
-    retry_async
+    format_exception
 )
 from lib.supabase_client import supabase
-from lib.logging_service import log_sync_event
+from lib.logging_service import log_sync_event, batched_sync_events
+import asyncio
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Optional, Set, Tuple
 
 # Configure logging (keep standard logging for console output as well)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def ensure_group_exists(token, location_name, name_to_id_map):
+async def ensure_group_exists(token, location_name, name_to_id_map, group_mapping=None):
     """
     Checks if a location group exists in the mapping.
-    If not, creates it in Google Contacts and updates the mapping.
+    If not, creates it in Google Contacts and updates the mapping
+    (and its ID -> Name counterpart group_mapping, when given).
     """
     if not location_name:
         return
@@ -31,9 +36,12 @@ async def ensure_group_exists(token, location_name, name_to_id_map):
     if location_name not in name_to_id_map:
         logger.info(f"Location '{location_name}' not found in Google Groups. Creating...")
         try:
-            new_group_id = await retry_async(create_contact_group, token, location_name)
+            new_group = await create_contact_group(token, location_name)
+            new_group_id = (new_group or {}).get("resourceName")
             if new_group_id:
                 name_to_id_map[location_name] = new_group_id
+                if group_mapping is not None:
+                    group_mapping[new_group_id] = location_name
                 await log_sync_event("create_group", "success", f"Created new Google Group: {location_name}")
             else:
                 logger.error(f"Failed to create group for {location_name}")
@@ -42,6 +50,411 @@ async def ensure_group_exists(token, location_name, name_to_id_map):
             logger.error(f"Error creating group {location_name}: {error_msg}")
             await log_sync_event("create_group", "error", f"Failed to create group {location_name}: {error_msg}")
 
+# The Supabase client is synchronous, so every query below runs through
+# asyncio.to_thread to keep Google requests moving while it waits.
+
+# Rows per page when reading the contacts table
+SUPABASE_PAGE_SIZE = 1000
+
+
+async def fetch_all_contacts():
+    """
+    Fetch every Supabase contact (including soft-deleted).
+    
+    The row count is read first so all pages can be requested at once
+    instead of one after another. Pages are ordered by id so the ranges
+    don't overlap, and reading continues past the counted total while
+    pages come back full, in case rows were added in between.
+    """
+    def fetch_page(start):
+        return supabase.table("contacts").select("*").order("id")\
+            .range(start, start + SUPABASE_PAGE_SIZE - 1).execute().data
+
+    count_response = await asyncio.to_thread(
+        lambda: supabase.table("contacts").select("id", count="exact").limit(1).execute()
+    )
+    total = count_response.count or 0
+    starts = range(0, max(total, 1), SUPABASE_PAGE_SIZE)
+    pages = await asyncio.gather(*[asyncio.to_thread(fetch_page, start) for start in starts])
+
+    contacts = [row for page in pages for row in page]
+    start = starts[-1] + SUPABASE_PAGE_SIZE
+    last_page = pages[-1]
+    while len(last_page) == SUPABASE_PAGE_SIZE:
+        last_page = await asyncio.to_thread(fetch_page, start)
+        contacts.extend(last_page)
+        start += SUPABASE_PAGE_SIZE
+    return contacts
+
+
+# Max Supabase-only writes in flight at once during a sync. People API
+# mutations for one user are sent one at a time, as Google asks.
+SUPABASE_WRITE_CONCURRENCY = 8
+
+# Planned actions that mutate Google Contacts
+GOOGLE_WRITE_ACTIONS = ("delete_google", "create_google", "update_google")
+
+# Supabase columns produced by transform_contact (its other keys are
+# internal, prefixed with _)
+PUBLIC_FIELDS = (
+    "google_resource_name", "first_name", "last_name", "birthday", "email",
+    "phone", "phone_secondary", "company", "job_title", "linkedin_url",
+    "notes", "profile_content", "subscribed", "location"
+)
+
+# Fields compared to decide whether Google is out of date with Supabase
+# (subscribed must stay last, see content_key).
+# NOTE: We compare profile_content (not notes) because profile_content
+# is the canonical field. Google biographies are set from profile_content
+# via transform_to_google_body, but transform_contact reads them back
+# into both notes AND profile_content. Comparing notes would cause
+# false positives when Supabase notes=None but profile_content has data.
+CONTENT_FIELDS = (
+    "first_name", "last_name", "email", "phone", "phone_secondary",
+    "company", "job_title", "profile_content", "birthday", "linkedin_url",
+    "location", "subscribed"
+)
+
+
+def content_key(record) -> Tuple:
+    """
+    CONTENT_FIELDS of a contact as one comparable tuple.
+    
+    None and empty string are treated as equivalent, and subscribed
+    (always the last field) is reduced to a bool so False and None match.
+    """
+    *values, subscribed = map(record.get, CONTENT_FIELDS)
+    return tuple(None if v == "" else v for v in values) + (bool(subscribed),)
+
+
+# Clock-skew tolerance when comparing update times, in microseconds
+CONFLICT_BUFFER_US = 5_000_000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def parse_epoch_us(ts: Optional[str]) -> Optional[int]:
+    """
+    Parse an ISO timestamp to integer microseconds since the epoch.
+    
+    Naive timestamps are taken as UTC. Returns None for empty values and
+    raises ValueError for malformed ones. Cached because the same
+    timestamps come back on every sync of an unchanged contact.
+    """
+    if not ts:
+        return None
+    if ts.endswith('Z'):
+        ts = ts[:-1] + '+00:00'
+    dt = datetime.fromisoformat(ts)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+
+# transform_contact results kept across syncs, keyed by (resourceName, etag).
+# Google changes a contact's etag whenever the contact changes, so an
+# unchanged contact is transformed once rather than on every sync.
+TRANSFORM_CACHE_SIZE = 10_000
+_transform_cache: "OrderedDict[Tuple[str, str], Tuple[frozenset, Dict[str, Any]]]" = OrderedDict()
+
+
+def groups_key(group_mapping) -> frozenset:
+    """Hashable snapshot of group_mapping, for transform_contact_cached."""
+    return frozenset(group_mapping.items())
+
+
+def transform_contact_cached(google_contact, group_mapping, groups=None) -> Dict[str, Any]:
+    """
+    transform_contact, reusing the result from an earlier sync when neither
+    the contact (etag) nor the group names it was resolved with changed.
+    
+    groups is groups_key(group_mapping); a sync builds it once and passes
+    it in rather than rebuilding it for every contact.
+    The result is shared between calls, so callers must not modify it.
+    """
+    etag = google_contact.get("etag")
+    if not etag:
+        return transform_contact(google_contact, group_mapping)
+    key = (google_contact.get("resourceName"), etag)
+    if groups is None:
+        groups = groups_key(group_mapping)
+    cached = _transform_cache.get(key)
+    if cached and cached[0] == groups:
+        _transform_cache.move_to_end(key)
+        return cached[1]
+    result = transform_contact(google_contact, group_mapping)
+    _transform_cache[key] = (groups, result)
+    _transform_cache.move_to_end(key)
+    if len(_transform_cache) > TRANSFORM_CACHE_SIZE:
+        _transform_cache.popitem(last=False)
+    return result
+
+
+@dataclass(slots=True)
+class SyncOp:
+    """A write decided for one Supabase contact by plan_contact."""
+    action: str  # delete_google, create_google, update_supabase, update_google, delete_supabase, delete_skipped
+    sb_contact: Dict[str, Any]
+    resource_name: Optional[str] = None
+    google_contact: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None
+
+
+def google_wins(sb_ts, google_ts, synced_ts) -> bool:
+    """
+    Whether Google's copy should overwrite Supabase's (last write wins).
+    
+    Timestamps are epoch microseconds. google_updated_at (synced_ts) tracks
+    when WE last synced with Google, so only changes SINCE that watermark
+    count. This prevents ping-pong where pushing makes Google "newer",
+    causing a pull, which makes Supabase "newer", causing a push...
+    """
+    if google_ts is None:
+        return False
+    if synced_ts is not None:
+        if google_ts - synced_ts <= CONFLICT_BUFFER_US:
+            return False
+        # Google changed since last sync; if Supabase did too, the newer write wins
+        return sb_ts is None or sb_ts - synced_ts <= CONFLICT_BUFFER_US or google_ts > sb_ts
+    # No watermark yet - first sync, use direct comparison
+    return sb_ts is not None and google_ts - sb_ts > CONFLICT_BUFFER_US
+
+
+def plan_contact(
+    sb_contact, google_contacts_map, processed, group_mapping, google_count, supabase_count, track_etag=True,
+    groups=None
+) -> Optional[SyncOp]:
+    """
+    Decide what to do for one Supabase contact, without any I/O.
+    
+    Google contacts matched to the row are added to processed (the map is
+    left untouched), so google_contacts_map.keys() - processed afterwards
+    exists only in Google.
+    track_etag is False while the contacts table has no last_etag column
+    (migration 040 not applied yet), so no write includes it. groups is
+    passed on to transform_contact_cached.
+    Returns None when nothing needs writing.
+    """
+    resource_name = sb_contact.get("google_resource_name")
+
+    if sb_contact.get("deleted_at"):
+        # Case: Soft-deleted in Supabase -> Delete from Google
+        if resource_name and resource_name in google_contacts_map and resource_name not in processed:
+            # Mark as processed so we don't re-ingest it
+            processed.add(resource_name)
+            return SyncOp("delete_google", sb_contact, resource_name)
+        return None
+
+    # Case: Active in Supabase
+    if not resource_name:
+        # Case: New in Supabase (Notion/Manual) -> Create in Google
+        return SyncOp("create_google", sb_contact)
+
+    if resource_name not in google_contacts_map or resource_name in processed:
+        # Case: In Supabase (with Google ID) but NOT in Google
+        # This could mean:
+        # 1. Contact was deleted in Google (normal case)
+        # 2. Google API issue (returned partial data)
+        # 3. Google account was wiped/reset
+        # 
+        # SAFETY: Only soft-delete if Google has a reasonable number of contacts
+        # If Google returned very few contacts, something is wrong - don't delete!
+        if google_count >= 10 or supabase_count < 20:
+            return SyncOp("delete_supabase", sb_contact, resource_name)
+        return SyncOp("delete_skipped", sb_contact, resource_name, data={"google_count": google_count})
+
+    # Case: Exists in both -> Compare timestamps
+    # Marked as processed so it is not ingested again in pass 5
+    processed.add(resource_name)
+    google_contact = google_contacts_map[resource_name]
+
+    sb_ts = parse_epoch_us(sb_contact.get("updated_at"))
+    synced_ts = parse_epoch_us(sb_contact.get("google_updated_at"))  # Our sync watermark
+
+    # Same etag as the last write from Google -> Google is unchanged.
+    # Also require Supabase unchanged since the watermark, since the update
+    # trigger keeps last_sync_source as-is on direct edits.
+    etag = google_contact.get("etag")
+    if (
+        etag
+        and etag == sb_contact.get("last_etag")
+        and sb_contact.get("last_sync_source") == "google"
+        and synced_ts is not None
+        and (sb_ts is None or sb_ts - synced_ts <= CONFLICT_BUFFER_US)
+    ):
+        return None
+
+    # Transform current Google data to Supabase format for comparison
+    current_google_data = transform_contact_cached(google_contact, group_mapping, groups)
+    google_ts = parse_epoch_us(current_google_data.get("_google_updated_at"))
+
+    # Determine winner using watermark-based comparison (see google_wins)
+    if google_wins(sb_ts, google_ts, synced_ts):
+        # Keep only Supabase columns (drops internal fields)
+        update_data = {k: current_google_data[k] for k in PUBLIC_FIELDS if k in current_google_data}
+        if track_etag:
+            update_data["last_etag"] = etag
+        return SyncOp("update_supabase", sb_contact, resource_name, google_contact, update_data)
+
+    # Supabase newer, or no clear winner: check if content actually changed before pushing to Google
+    sb_content = content_key(sb_contact)
+    google_content = content_key(current_google_data)
+    needs_update = sb_content != google_content
+    if needs_update:
+        field = next(f for f, a, b in zip(CONTENT_FIELDS, sb_content, google_content) if a != b)
+        logger.info(f"Content diff for {sb_contact.get('email') or sb_contact.get('first_name')}: {field}")
+    
+    # Also check if contact needs to be added to My Contacts
+    if not needs_update:
+        memberships = google_contact.get("memberships", [])
+        groups = [m.get("contactGroupMembership", {}).get("contactGroupResourceName") for m in memberships]
+        if "contactGroups/myContacts" not in groups:
+            needs_update = True
+            logger.info(f"Contact {sb_contact.get('email')} needs to be added to My Contacts")
+    
+    if needs_update:
+        return SyncOp("update_google", sb_contact, resource_name, google_contact)
+    return None
+
+
+async def execute_op(op: SyncOp, token, name_to_id_map, track_etag=True) -> bool:
+    """
+    Carry out one planned write. Raises on failure.
+    Returns True if something was synced. track_etag is as for plan_contact.
+    """
+    sb_contact = op.sb_contact
+    resource_name = op.resource_name
+
+    if op.action == "delete_google":
+        logger.info(f"Deleting Google contact {resource_name} (Deleted in Supabase)")
+        await delete_contact(token, resource_name)
+        await log_sync_event("delete_google", "success", f"Deleted {sb_contact.get('email')} from Google")
+        return True
+
+    if op.action == "create_google":
+        logger.info(f"Creating contact in Google: {sb_contact.get('email')}")
+        new_contact = await create_contact(token, sb_contact, name_to_id_map)
+        new_resource_name = new_contact["resourceName"]
+
+        # Update Supabase with the new ID and sync state
+        now_utc = datetime.now(timezone.utc).isoformat()
+        write_back = {
+            "google_resource_name": new_resource_name,
+            "last_sync_source": "google",
+            "google_updated_at": now_utc,
+        }
+        if track_etag:
+            write_back["last_etag"] = new_contact.get("etag")
+        await asyncio.to_thread(supabase.table("contacts").update(write_back).eq("id", sb_contact["id"]).execute)
+        
+        await log_sync_event("create_google", "success", f"Created {sb_contact.get('email')} in Google")
+        return True
+
+    if op.action == "update_supabase":
+        logger.info(f"Updating Supabase contact {sb_contact.get('email')} from Google (Google is newer)")
+        update_data = dict(op.data)
+        update_data["last_sync_source"] = "google"
+        # Set watermark to NOW so the next cycle knows we just synced
+        now_utc = datetime.now(timezone.utc).isoformat()
+        update_data["google_updated_at"] = now_utc
+        update_data["updated_at"] = now_utc
+
+        await asyncio.to_thread(supabase.table("contacts").update(update_data).eq("id", sb_contact["id"]).execute)
+        await log_sync_event("update_supabase", "success", f"Updated {sb_contact.get('email')} from Google")
+        return True
+
+    if op.action == "update_google":
+        logger.info(f"Updating Google contact {resource_name} (Supabase is newer/different)")
+        etag = op.google_contact.get("etag")
+        await update_contact(token, resource_name, sb_contact, etag, op.google_contact, name_to_id_map)
+        await log_sync_event("update_google", "success", f"Updated {sb_contact.get('email')} in Google")
+        return True
+
+    if op.action == "delete_skipped":
+        google_count = op.data["google_count"]
+        logger.warning(f"SKIPPING deletion of {sb_contact.get('email')} - Google returned too few contacts ({google_count}), possible API issue")
+        await log_sync_event("delete_skipped", "warning", f"Skipped deletion of {sb_contact.get('email')} - Google returned only {google_count} contacts")
+        return False
+
+    raise ValueError(f"Unknown sync action: {op.action}")
+
+
+# IDs per in.(...) filter for batched updates, keeps request URLs short
+UPDATE_CHUNK_SIZE = 100
+
+
+async def bulk_update_contacts(contact_ids, fields) -> Set[str]:
+    """
+    Apply the same update to many contacts, one request per UPDATE_CHUNK_SIZE ids.
+    
+    A rejected chunk is retried row by row. Returns the ids that could
+    not be updated (already logged).
+    """
+    failed = set()
+    for start in range(0, len(contact_ids), UPDATE_CHUNK_SIZE):
+        chunk = contact_ids[start:start + UPDATE_CHUNK_SIZE]
+        try:
+            await asyncio.to_thread(supabase.table("contacts").update(fields).in_("id", chunk).execute)
+            continue
+        except Exception as e:
+            logger.warning(f"Bulk update of {len(chunk)} contacts failed, retrying individually: {format_exception(e)}")
+        for contact_id in chunk:
+            try:
+                await asyncio.to_thread(supabase.table("contacts").update(fields).eq("id", contact_id).execute)
+            except Exception as e:
+                error_msg = format_exception(e)
+                logger.error(f"Error updating Supabase contact {contact_id}: {error_msg}")
+                await log_sync_event("sync_error", "error", f"Error updating contact {contact_id}: {error_msg}")
+                failed.add(contact_id)
+    return failed
+
+
+# Rows per bulk upsert when ingesting Google-only contacts
+INGEST_CHUNK_SIZE = 500
+
+
+async def ingest_contacts(rows) -> Tuple[int, int]:
+    """
+    Upsert contacts ingested from Google, INGEST_CHUNK_SIZE rows per request.
+    
+    Chunks are sent concurrently (each holds different google_resource_names).
+    A rejected chunk is retried row by row so one bad contact doesn't
+    fail the rest. Returns (ingested, errors).
+    """
+    async def ingest_chunk(chunk) -> Tuple[int, int]:
+        errors = 0
+        try:
+            await asyncio.to_thread(supabase.table("contacts").upsert(chunk, on_conflict="google_resource_name").execute)
+            done = chunk
+        except Exception as e:
+            logger.warning(f"Bulk ingest of {len(chunk)} contacts failed, retrying individually: {format_exception(e)}")
+            done = []
+            for contact_data in chunk:
+                try:
+                    await asyncio.to_thread(
+                        supabase.table("contacts").upsert(contact_data, on_conflict="google_resource_name").execute
+                    )
+                    done.append(contact_data)
+                except Exception as e:
+                    error_msg = format_exception(e)
+                    resource_name = contact_data.get("google_resource_name")
+                    logger.error(f"Error ingesting Google contact {resource_name}: {error_msg}")
+                    await log_sync_event("sync_error", "error", f"Error ingesting Google contact {resource_name}: {error_msg}")
+                    errors += 1
+
+        for contact_data in done:
+            logger.info(f"Ingested new contact from Google: {contact_data.get('google_resource_name')}")
+            await log_sync_event("create_supabase", "success", f"Ingested {contact_data.get('email')} from Google")
+        return len(done), errors
+
+    results = await asyncio.gather(*[
+        ingest_chunk(rows[start:start + INGEST_CHUNK_SIZE])
+        for start in range(0, len(rows), INGEST_CHUNK_SIZE)
+    ])
+    return sum(r[0] for r in results), sum(r[1] for r in results)
+
+
 async def sync_contacts():
     """
     Bi-directional sync between Google Contacts and Supabase.
@@ -49,311 +462,204 @@ async def sync_contacts():
     
     REQUIRES: 'deleted_at' timestamp column in Supabase 'contacts' table.
     """
-    try:
-        await log_sync_event("sync_start", "info", "Starting bi-directional sync")
-        logger.info("Starting bi-directional sync...")
-        
-        # 1. Get Access Token & Groups
-        token = await get_access_token()
-        group_mapping = await get_contact_groups(token)
-        # Invert mapping for writing (Name -> ID)
-        name_to_id_map = {v: k for k, v in group_mapping.items()}
-
-        # Ensure "Subscribed" group exists (auto-create like location groups)
-        await ensure_group_exists(token, "Subscribed", name_to_id_map)
-
-        # 2. Fetch all from Google
-        google_contacts_list = await get_all_contacts(token)
-        # Map by resourceName for easy lookup
-        google_contacts_map = {gc["resourceName"]: gc for gc in google_contacts_list}
-        logger.info(f"Fetched {len(google_contacts_list)} contacts from Google.")
+    # sync_logs rows are written in batches, not one insert per event
+    async with batched_sync_events():
+        try:
+            await log_sync_event("sync_start", "info", "Starting bi-directional sync")
+            logger.info("Starting bi-directional sync...")
         
-        # 3. Fetch all from Supabase (including soft-deleted) with Pagination
-        supabase_contacts = []
-        page_size = 1000
-        start = 0
-        while True:
-            response = supabase.table("contacts").select("*").range(start, start + page_size - 1).execute()
-            batch = response.data
-            supabase_contacts.extend(batch)
-            if len(batch) < page_size:
-                break
-            start += page_size
-            
-        logger.info(f"Fetched {len(supabase_contacts)} contacts from Supabase.")
+            async def fetch_google():
+                # 1. Get Access Token & Groups
+                token = await get_access_token()
+                group_mapping = await get_contact_groups(token)
+                # Invert mapping for writing (Name -> ID). The few dozen groups
+                # make this copy cheap; new groups are added to both maps.
+                name_to_id_map = {v: k for k, v in group_mapping.items()}
+
+                # Ensure "Subscribed" group exists (auto-create like location groups)
+                if "Subscribed" not in name_to_id_map:
+                    await ensure_group_exists(token, "Subscribed", name_to_id_map, group_mapping)
+
+                # 2. Fetch all from Google
+                google_contacts_list = await get_all_contacts(token)
+                logger.info(f"Fetched {len(google_contacts_list)} contacts from Google.")
+                return token, group_mapping, name_to_id_map, google_contacts_list
+
+            # 3. Fetch all from Supabase (including soft-deleted) with Pagination,
+            #    at the same time as the Google requests since neither needs the other
+            (token, group_mapping, name_to_id_map, google_contacts_list), supabase_contacts = await asyncio.gather(
+                fetch_google(), fetch_all_contacts()
+            )
+            # Map by resourceName for easy lookup
+            google_contacts_map = {gc["resourceName"]: gc for gc in google_contacts_list}
+            logger.info(f"Fetched {len(supabase_contacts)} contacts from Supabase.")
+            # Rows are fetched with select=*, so they show whether migration
+            # 040 (last_etag) has been applied; until then no write sends it
+            track_etag = bool(supabase_contacts) and "last_etag" in supabase_contacts[0]
+            if supabase_contacts and not track_etag:
+                logger.warning("contacts.last_etag column missing (migration 040), syncing without etags")
         
-        # SAFETY VALVE: Enhanced protection against mass deletions
-        # Check multiple conditions that indicate something is wrong with Google data
-        google_count = len(google_contacts_list)
-        supabase_count = len(supabase_contacts)
-        active_supabase = len([c for c in supabase_contacts if not c.get('deleted_at')])
+            # SAFETY VALVE: Enhanced protection against mass deletions
+            # Check multiple conditions that indicate something is wrong with Google data
+            google_count = len(google_contacts_list)
+            supabase_count = len(supabase_contacts)
+            active_supabase = sum(1 for c in supabase_contacts if not c.get('deleted_at'))
         
-        # Condition 1: Google has < 10% of Supabase contacts
-        ratio_check = supabase_count > 10 and google_count < (supabase_count * 0.1)
+            # Condition 1: Google has < 10% of Supabase contacts
+            ratio_check = supabase_count > 10 and google_count < (supabase_count * 0.1)
         
-        # Condition 2: Google has very few contacts but Supabase has many active
-        minimum_check = google_count < 5 and active_supabase > 20
+            # Condition 2: Google has very few contacts but Supabase has many active
+            minimum_check = google_count < 5 and active_supabase > 20
         
-        # Condition 3: Google is completely empty but we have data
-        empty_check = google_count == 0 and supabase_count > 0
+            # Condition 3: Google is completely empty but we have data
+            empty_check = google_count == 0 and supabase_count > 0
         
-        if ratio_check or minimum_check or empty_check:
-            msg = f"Safety Valve Triggered: Google returned {google_count} contacts, but Supabase has {supabase_count} ({active_supabase} active). Aborting."
-            await log_sync_event("sync_abort", "error", msg)
-            logger.error(msg)
-            logger.error("This usually means Google Contacts was wiped or there's an API issue.")
-            logger.error("To restore: python restore_google_contacts.py")
-            raise Exception(msg)
-
-        synced_count = 0
-        errors_count = 0
+            if ratio_check or minimum_check or empty_check:
+                msg = f"Safety Valve Triggered: Google returned {google_count} contacts, but Supabase has {supabase_count} ({active_supabase} active). Aborting."
+                await log_sync_event("sync_abort", "error", msg)
+                logger.error(msg)
+                logger.error("This usually means Google Contacts was wiped or there's an API issue.")
+                logger.error("To restore: python restore_google_contacts.py")
+                raise Exception(msg)
+
+            synced_count = 0
+            errors_count = 0
         
-        # 4. Process Supabase Contacts (Source of Truth)
-        for sb_contact in supabase_contacts:
-            resource_name = sb_contact.get("google_resource_name")
-            deleted_at = sb_contact.get("deleted_at")
-            
-            try:
-                if deleted_at:
-                    # Case: Soft-deleted in Supabase -> Delete from Google
-                    if resource_name and resource_name in google_contacts_map:
-                        logger.info(f"Deleting Google contact {resource_name} (Deleted in Supabase)")
-                        await retry_async(delete_contact, token, resource_name)
-                        await log_sync_event("delete_google", "success", f"Deleted {sb_contact.get('email')} from Google")
-                        # Remove from map so we don't re-ingest it
-                        del google_contacts_map[resource_name]
-                        synced_count += 1
-                    continue
+            # 4. Process Supabase Contacts (Source of Truth)
+            #    Decide every contact first, then run the resulting writes:
+            #    Google mutations in order, Supabase-only ones concurrently
+            ops = []
+            processed: Set[str] = set()
+            groups = groups_key(group_mapping)
+            for sb_contact in supabase_contacts:
+                try:
+                    op = plan_contact(
+                        sb_contact, google_contacts_map, processed, group_mapping,
+                        google_count, supabase_count, track_etag, groups
+                    )
+                    if op:
+                        ops.append(op)
+                except Exception as e:
+                    error_msg = format_exception(e)
+                    logger.error(f"Error processing Supabase contact {sb_contact.get('id')}: {error_msg}")
+                    await log_sync_event("sync_error", "error", f"Error processing {sb_contact.get('email')}: {error_msg}")
+                    errors_count += 1
 
-                # Case: Active in Supabase
-                if not resource_name:
-                    # Case: New in Supabase (Notion/Manual) -> Create in Google
-                    logger.info(f"Creating contact in Google: {sb_contact.get('email')}")
-
-                    # Ensure group exists
-                    await ensure_group_exists(token, sb_contact.get("location"), name_to_id_map)
-
-                    new_contact = await retry_async(create_contact, token, sb_contact, name_to_id_map)
-                    new_resource_name = new_contact["resourceName"]
-
-                    # Update Supabase with the new ID and sync state
-                    now_utc = datetime.now(timezone.utc).isoformat()
-                    supabase.table("contacts").update({
-                        "google_resource_name": new_resource_name,
-                        "last_sync_source": "google",
-                        "google_updated_at": now_utc
-                    }).eq("id", sb_contact["id"]).execute()
-                    
-                    await log_sync_event("create_google", "success", f"Created {sb_contact.get('email')} in Google")
-                    synced_count += 1
-                    
-                elif resource_name in google_contacts_map:
-                    # Case: Exists in both -> Compare timestamps
-                    google_contact = google_contacts_map[resource_name]
-                    etag = google_contact.get("etag")
-                    
-                    # Transform current Google data to Supabase format for comparison
-                    current_google_data = transform_contact(google_contact, group_mapping)
-                    
-                    # Timestamps
-                    sb_updated_at = sb_contact.get("updated_at")
-                    google_api_updated = current_google_data.get("_google_updated_at")
-                    last_synced_at = sb_contact.get("google_updated_at")  # Our sync watermark
-
-                    # Determine winner using watermark-based comparison.
-                    # google_updated_at tracks when WE last synced with Google.
-                    # Only act if either side changed SINCE that watermark.
-                    # This prevents ping-pong where pushing makes Google "newer",
-                    # causing a pull, which makes Supabase "newer", causing a push...
-                    update_direction = None # None, 'to_google', 'to_supabase'
-
-                    def parse_iso(ts):
-                        if not ts: return None
-                        if ts.endswith('Z'):
-                            ts = ts[:-1] + '+00:00'
-                        return datetime.fromisoformat(ts)
-
-                    sb_dt = parse_iso(sb_updated_at)
-                    google_dt = parse_iso(google_api_updated)
-                    synced_dt = parse_iso(last_synced_at)
-
-                    buffer = timedelta(seconds=5)
-
-                    if synced_dt:
-                        # We have a watermark - compare against it
-                        google_changed = google_dt and google_dt > synced_dt + buffer
-                        supabase_changed = sb_dt and sb_dt > synced_dt + buffer
-
-                        if google_changed and supabase_changed:
-                            # Both changed since last sync - last write wins
-                            if google_dt > sb_dt:
-                                update_direction = 'to_supabase'
-                            else:
-                                update_direction = 'to_google'
-                        elif google_changed:
-                            update_direction = 'to_supabase'
-                        elif supabase_changed:
-                            update_direction = 'to_google'
-                        # else: neither changed since last sync → content comparison only
-                    elif sb_dt and google_dt:
-                        # No watermark yet - first sync, use direct comparison
-                        if google_dt > sb_dt + buffer:
-                            update_direction = 'to_supabase'
-                        elif sb_dt > google_dt:
-                            update_direction = 'to_google'
-                    elif not google_dt:
-                        update_direction = 'to_google'
-
-                    # Execute Update
-                    if update_direction == 'to_supabase':
-                        logger.info(f"Updating Supabase contact {sb_contact.get('email')} from Google (Google is newer)")
-                        # Remove internal fields
-                        update_data = {k: v for k, v in current_google_data.items() if not k.startswith('_')}
-                        update_data["last_sync_source"] = "google"
-                        # Set watermark to NOW so the next cycle knows we just synced
-                        now_utc = datetime.now(timezone.utc).isoformat()
-                        update_data["google_updated_at"] = now_utc
-                        update_data["updated_at"] = now_utc
-
-                        supabase.table("contacts").update(update_data).eq("id", sb_contact["id"]).execute()
-                        await log_sync_event("update_supabase", "success", f"Updated {sb_contact.get('email')} from Google")
-                        synced_count += 1
-                        
-                    elif update_direction == 'to_google' or update_direction is None:
-                        # Check if content actually changed before pushing to Google
-                        # NOTE: We compare profile_content (not notes) because profile_content
-                        # is the canonical field. Google biographies are set from profile_content
-                        # via transform_to_google_body, but transform_contact reads them back
-                        # into both notes AND profile_content. Comparing notes would cause
-                        # false positives when Supabase notes=None but profile_content has data.
-                        fields_to_check = [
-                            "first_name", "last_name", "email", "phone", "phone_secondary",
-                            "company", "job_title", "profile_content", "birthday", "linkedin_url",
-                            "location", "subscribed"
-                        ]
-
-                        needs_update = False
-                        for field in fields_to_check:
-                            sb_val = sb_contact.get(field)
-                            google_val = current_google_data.get(field)
-
-                            if sb_val != google_val:
-                                # Treat None and empty string as equivalent
-                                if (sb_val is None and google_val == "") or (sb_val == "" and google_val is None):
-                                    continue
-                                # Treat False and None as equivalent for boolean fields
-                                if field == "subscribed" and (not sb_val) and (not google_val):
-                                    continue
-                                needs_update = True
-                                logger.info(f"Content diff for {sb_contact.get('email') or sb_contact.get('first_name')}: {field}")
-                                break
-                        
-                        # Also check if contact needs to be added to My Contacts
-                        if not needs_update:
-                            memberships = google_contact.get("memberships", [])
-                            groups = [m.get("contactGroupMembership", {}).get("contactGroupResourceName") for m in memberships]
-                            if "contactGroups/myContacts" not in groups:
-                                needs_update = True
-                                logger.info(f"Contact {sb_contact.get('email')} needs to be added to My Contacts")
-                        
-                        if needs_update:
-                            logger.info(f"Updating Google contact {resource_name} (Supabase is newer/different)")
-
-                            # Ensure group exists
-                            await ensure_group_exists(token, sb_contact.get("location"), name_to_id_map)
-
-                            await retry_async(update_contact, token, resource_name, sb_contact, etag, google_contact, name_to_id_map)
-
-                            # Write back google_updated_at to prevent redundant pushes on next cycle.
-                            # NOTE: We intentionally do NOT set last_sync_source here. The change
-                            # detection in sync_cursor.py filters for last_sync_source='supabase'
-                            # to detect manual edits. Setting it to 'google' would make future
-                            # Supabase edits invisible to change detection.
-                            now_utc = datetime.now(timezone.utc).isoformat()
-                            supabase.table("contacts").update({
-                                "google_updated_at": now_utc
-                            }).eq("id", sb_contact["id"]).execute()
-
-                            await log_sync_event("update_google", "success", f"Updated {sb_contact.get('email')} in Google")
-                            synced_count += 1
-                    
-                    # Remove from google_contacts_map so we know we processed it
-                    del google_contacts_map[resource_name]
-                    
-                else:
-                    # Case: In Supabase (with Google ID) but NOT in Google
-                    # This could mean:
-                    # 1. Contact was deleted in Google (normal case)
-                    # 2. Google API issue (returned partial data)
-                    # 3. Google account was wiped/reset
-                    # 
-                    # SAFETY: Only soft-delete if Google has a reasonable number of contacts
-                    # If Google returned very few contacts, something is wrong - don't delete!
-                    if len(google_contacts_list) >= 10 or len(supabase_contacts) < 20:
-                        logger.warning(f"Contact {resource_name} missing in Google. Soft-deleting in Supabase.")
-                        supabase.table("contacts").update({
-                            "deleted_at": datetime.now(timezone.utc).isoformat(),
-                            "last_sync_source": "google"
-                        }).eq("id", sb_contact["id"]).execute()
-                        await log_sync_event("delete_supabase", "success", f"Soft-deleted {sb_contact.get('email')} (Missing in Google)")
-                        synced_count += 1
-                    else:
-                        logger.warning(f"SKIPPING deletion of {sb_contact.get('email')} - Google returned too few contacts ({len(google_contacts_list)}), possible API issue")
-                        await log_sync_event("delete_skipped", "warning", f"Skipped deletion of {sb_contact.get('email')} - Google returned only {len(google_contacts_list)} contacts")
-                    
-            except Exception as e:
-                error_msg = format_exception(e)
-                logger.error(f"Error processing Supabase contact {sb_contact.get('id')}: {error_msg}")
-                await log_sync_event("sync_error", "error", f"Error processing {sb_contact.get('email')}: {error_msg}")
-                errors_count += 1
+            # Groups are created up front, one at a time, so concurrent writes
+            # for the same new location don't each create it
+            missing_groups = {
+                op.sb_contact.get("location") for op in ops if op.action in ("create_google", "update_google")
+            } - name_to_id_map.keys() - {None, ""}
+            for location in sorted(missing_groups):
+                await ensure_group_exists(token, location, name_to_id_map, group_mapping)
+            if missing_groups:
+                groups = groups_key(group_mapping)
 
-        # 5. Process remaining Google Contacts
-        #    - These are in Google but NOT in Supabase (or at least not linked)
-        for resource_name, google_contact in google_contacts_map.items():
-            try:
-                # Check if this contact was previously soft-deleted in Supabase.
-                # If so, skip re-ingestion — the deletion was intentional (e.g., from Notion).
-                existing_deleted = supabase.table("contacts").select("id")\
-                    .eq("google_resource_name", resource_name)\
-                    .not_.is_("deleted_at", "null")\
-                    .execute()
-                if existing_deleted.data:
-                    logger.info(f"Skipping re-ingestion of soft-deleted contact {resource_name} — deleting from Google instead")
-                    await retry_async(delete_contact, token, resource_name)
-                    synced_count += 1
-                    continue
+            # Soft-deletes only touch Supabase, so they are written in bulk below
+            soft_deletes = [op for op in ops if op.action == "delete_supabase"]
+            ops = [op for op in ops if op.action != "delete_supabase"]
 
-                logger.info(f"Ingesting new contact from Google: {resource_name}")
-                raw_data = transform_contact(google_contact, group_mapping)
+            google_ops = [op for op in ops if op.action in GOOGLE_WRITE_ACTIONS]
+            local_ops = [op for op in ops if op.action not in GOOGLE_WRITE_ACTIONS]
+            ops = google_ops + local_ops
 
-                # Filter out internal fields (starting with _)
-                contact_data = {k: v for k, v in raw_data.items() if not k.startswith('_')}
-                contact_data["last_sync_source"] = "google"
-                contact_data["google_updated_at"] = raw_data.get("_google_updated_at")
+            async def _run_google():
+                # Concurrent mutations for one user make the People API reject
+                # writes, which would also trip the shared contacts breaker
+                google_results = []
+                for op in google_ops:
+                    try:
+                        google_results.append(await execute_op(op, token, name_to_id_map, track_etag))
+                    except Exception as e:
+                        google_results.append(e)
+                return google_results
 
-                # Insert into Supabase
-                supabase.table("contacts").upsert(
-                    contact_data,
-                    on_conflict="google_resource_name"
-                ).execute()
-                await log_sync_event("create_supabase", "success", f"Ingested {contact_data.get('email')} from Google")
+            sem = asyncio.Semaphore(SUPABASE_WRITE_CONCURRENCY)
+
+            async def _run_local(op):
+                async with sem:
+                    return await execute_op(op, token, name_to_id_map, track_etag)
+
+            google_results, local_results = await asyncio.gather(
+                _run_google(),
+                asyncio.gather(*[_run_local(op) for op in local_ops], return_exceptions=True)
+            )
+            results = google_results + list(local_results)
+
+            # Supabase write-backs that share one payload are batched by id.
+            # Write back google_updated_at to prevent redundant pushes on next cycle.
+            # NOTE: We intentionally do NOT set last_sync_source there. The change
+            # detection in sync_cursor.py filters for last_sync_source='supabase'
+            # to detect manual edits. Setting it to 'google' would make future
+            # Supabase edits invisible to change detection.
+            now_utc = datetime.now(timezone.utc).isoformat()
+            pushed_ids = [
+                op.sb_contact["id"] for op, result in zip(ops, results)
+                if op.action == "update_google" and result is True
+            ]
+            failed_ids = await bulk_update_contacts(pushed_ids, {"google_updated_at": now_utc})
+            failed_ids |= await bulk_update_contacts(
+                [op.sb_contact["id"] for op in soft_deletes],
+                {"deleted_at": now_utc, "last_sync_source": "google"}
+            )
+
+            for op, result in zip(ops, results):
+                if isinstance(result, Exception):
+                    error_msg = format_exception(result)
+                    logger.error(f"Error processing Supabase contact {op.sb_contact.get('id')}: {error_msg}")
+                    await log_sync_event("sync_error", "error", f"Error processing {op.sb_contact.get('email')}: {error_msg}")
+                    errors_count += 1
+                elif op.sb_contact["id"] in failed_ids:
+                    errors_count += 1
+                elif result:
+                    synced_count += 1
+
+            for op in soft_deletes:
+                if op.sb_contact["id"] in failed_ids:
+                    errors_count += 1
+                    continue
+                logger.warning(f"Contact {op.resource_name} missing in Google. Soft-deleted in Supabase.")
+                await log_sync_event("delete_supabase", "success", f"Soft-deleted {op.sb_contact.get('email')} (Missing in Google)")
                 synced_count += 1
+
+            # 5. Process remaining Google Contacts
+            #    - These are in Google but NOT in Supabase (or at least not linked)
+            #    - Contacts soft-deleted in Supabase were claimed by plan_contact
+            #      above (deleted from Google, never re-ingested), so none are left
+            to_ingest = []
+            for resource_name in google_contacts_map.keys() - processed:
+                google_contact = google_contacts_map[resource_name]
+                try:
+                    raw_data = transform_contact_cached(google_contact, group_mapping, groups)
+
+                    # Keep only Supabase columns (drops internal fields)
+                    contact_data = {k: raw_data[k] for k in PUBLIC_FIELDS if k in raw_data}
+                    contact_data["last_sync_source"] = "google"
+                    contact_data["google_updated_at"] = raw_data.get("_google_updated_at")
+                    if track_etag:
+                        contact_data["last_etag"] = google_contact.get("etag")
+                    to_ingest.append(contact_data)
                 
-            except Exception as e:
-                error_msg = format_exception(e)
-                logger.error(f"Error ingesting Google contact {resource_name}: {error_msg}")
-                await log_sync_event("sync_error", "error", f"Error ingesting Google contact {resource_name}: {error_msg}")
-                errors_count += 1
+                except Exception as e:
+                    error_msg = format_exception(e)
+                    logger.error(f"Error ingesting Google contact {resource_name}: {error_msg}")
+                    await log_sync_event("sync_error", "error", f"Error ingesting Google contact {resource_name}: {error_msg}")
+                    errors_count += 1
+
+            # Insert into Supabase in bulk
+            ingested, ingest_errors = await ingest_contacts(to_ingest)
+            synced_count += ingested
+            errors_count += ingest_errors
                 
-        logger.info(f"Sync complete. Synced: {synced_count}, Errors: {errors_count}")
-        await log_sync_event("sync_complete", "info", f"Synced: {synced_count}, Errors: {errors_count}")
-        return {"synced": synced_count, "errors": errors_count}
-
-    except Exception as e:
-        error_msg = format_exception(e)
-        logger.error(f"Fatal error during sync: {error_msg}")
-        await log_sync_event("sync_fatal", "error", f"Fatal error: {error_msg}")
-        raise
+            logger.info(f"Sync complete. Synced: {synced_count}, Errors: {errors_count}")
+            await log_sync_event("sync_complete", "info", f"Synced: {synced_count}, Errors: {errors_count}")
+            return {"synced": synced_count, "errors": errors_count}
+
+        except Exception as e:
+            error_msg = format_exception(e)
+            logger.error(f"Fatal error during sync: {error_msg}")
+            await log_sync_event("sync_fatal", "error", f"Fatal error: {error_msg}")
+            raise
 
 # Legacy alias if needed, or we can remove it
 sync_google_contacts_to_supabase = sync_contacts
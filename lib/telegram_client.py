@@ -4,6 +4,7 @@ import httpx
 import logging
 import asyncio
 import traceback
+import weakref
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,53 @@ TRANSIENT_ERROR_PATTERNS = [
     "index out of range",
 ]
 
+# Shared HTTP client, reused across messages so each send doesn't pay a
+# new TCP/TLS handshake. Kept per event loop: scheduled jobs (staleness
+# monitor, sleep briefing) send from their own short-lived loops, and a
+# client can't be used outside the loop it was created in. Those jobs go
+# through run_blocking(), which closes their loop's client when done.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get or create the HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            http2=True,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_client():
+    """Close the running event loop's HTTP client (e.g. on app shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def run_blocking(coro):
+    """
+    Run a send (or any coroutine using the shared client) from synchronous
+    code on a fresh event loop, closing that loop's client before the loop.
+    """
+    async def run_and_close():
+        try:
+            return await coro
+        finally:
+            await close_client()
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run_and_close())
+    finally:
+        loop.close()
+
+
 def is_transient_error(error: str) -> bool:
     """Check if an error is likely transient (network issues)."""
     error_lower = error.lower()
@@ -93,9 +141,8 @@ async def send_telegram_message(text: str, force: bool = False):
         headers = {}
         if INTERNAL_API_KEY and TELEGRAM_BOT_SERVICE_URL:
             headers["X-API-Key"] = INTERNAL_API_KEY
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers, timeout=10.0)
-            response.raise_for_status()
+        response = await _get_client().post(url, json=payload, headers=headers, timeout=10.0)
+        response.raise_for_status()
     except Exception as e:
         logger.error(f"Failed to send Telegram message: {e}")
 
@@ -129,9 +176,8 @@ async def send_telegram_photo(photo_bytes: bytes, caption: str = "", force: bool
         if INTERNAL_API_KEY:
             headers["X-API-Key"] = INTERNAL_API_KEY
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=headers, timeout=30.0)
-                response.raise_for_status()
+            response = await _get_client().post(url, json=payload, headers=headers, timeout=30.0)
+            response.raise_for_status()
             logger.info(f"Telegram photo sent ({len(photo_bytes)} bytes)")
         except Exception as e:
             logger.error(f"Failed to send Telegram photo via bot service: {e}")
@@ -139,14 +185,13 @@ async def send_telegram_photo(photo_bytes: bytes, caption: str = "", force: bool
         # Direct Telegram API fallback (multipart upload)
         url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendPhoto"
         try:
-            async with httpx.AsyncClient() as client:
-                files = {"photo": ("chart.png", photo_bytes, "image/png")}
-                data = {"chat_id": TELEGRAM_CHAT_ID}
-                if caption:
-                    data["caption"] = caption
-                    data["parse_mode"] = "Markdown"
-                response = await client.post(url, data=data, files=files, timeout=30.0)
-                response.raise_for_status()
+            files = {"photo": ("chart.png", photo_bytes, "image/png")}
+            data = {"chat_id": TELEGRAM_CHAT_ID}
+            if caption:
+                data["caption"] = caption
+                data["parse_mode"] = "Markdown"
+            response = await _get_client().post(url, data=data, files=files, timeout=30.0)
+            response.raise_for_status()
             logger.info(f"Telegram photo sent directly ({len(photo_bytes)} bytes)")
         except Exception as e:
             logger.error(f"Failed to send Telegram photo via direct API: {e}")
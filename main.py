@@ -12,7 +12,7 @@ from pydantic import BaseModel
 from lib.sync_service import sync_contacts
 from lib.notion_sync import sync_notion_to_supabase, sync_supabase_to_notion
 from lib.logging_service import log_sync_event
-from lib.telegram_client import notify_error, reset_failure_count
+from lib.telegram_client import notify_error, reset_failure_count, close_client as close_telegram_client
 from lib.health_monitor import check_sync_health, get_sync_statistics, run_health_check, SystemHealthMonitor
 from reports import generate_daily_report, generate_evening_journal_prompt, generate_morning_task_digest, check_overdue_task_alerts, generate_email_digest, scan_draft_sent_diffs
 from backup import backup_contacts
@@ -93,7 +93,7 @@ from lib.sync_audit import (
 # Import lean sync cursor for change detection
 from lib.sync_cursor import (
     check_for_changes,
-    check_all_entities,
+    check_all_entities_async,
     update_cursor_after_sync,
     ChangeCheckResult
 )
@@ -240,6 +240,9 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
 
 app = FastAPI(title="Jarvis Backend")
 
+# Close the shared Telegram HTTP client with the app
+app.add_event_handler("shutdown", close_telegram_client)
+
 # ============================================================================
 # CORS MIDDLEWARE - Allow Chrome extension and other clients
 # ============================================================================
@@ -634,7 +637,7 @@ async def sync_everything(background_tasks: BackgroundTasks):
         # PHASE 1: Lightweight change detection for all entities
         # =====================================================================
         logger.info("Phase 1: Checking for changes across all entities...")
-        change_checks = await run_in_threadpool(check_all_entities, supabase)
+        change_checks = await check_all_entities_async(supabase)
         
         for entity, check in change_checks.items():
             if check.has_changes:
@@ -0,0 +1,8 @@
+-- Migration: Add content_hash to books
+-- Lets the one-way books sync skip Notion pages whose properties have not
+-- changed since the row was last written
+-- Run this in Supabase SQL Editor
+
+ALTER TABLE books ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMENT ON COLUMN books.content_hash IS 'Hash of the Notion properties this row was last built from';
@@ -0,0 +1,8 @@
+-- Migration: Add last_etag to contacts
+-- Lets the Google contacts sync skip contacts whose People API etag is
+-- unchanged since the row was last written from Google
+-- Run this in Supabase SQL Editor
+
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS last_etag TEXT;
+
+COMMENT ON COLUMN contacts.last_etag IS 'Google People API etag this row was last synced from';
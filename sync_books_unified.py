@@ -25,7 +25,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
 
 from lib.sync_base import (
     OneWaySyncService,
-    NotionPropertyExtractor as Extract,
     NotionClient,
     create_cli_parser,
     setup_logger,
@@ -62,6 +61,21 @@ class BooksSyncService(OneWaySyncService):
     - Cover (files) → cover_url
     """
     
+    # Skip unchanged pages (migrations/039_books_content_hash.sql)
+    CONTENT_HASH_COLUMN = 'content_hash'
+    
+    # Compiled once and reused for every record
+    convert_properties = staticmethod(OneWaySyncService.compile_converter({
+        'title': ('title', 'Name'),
+        'author': ('rich_text', 'Author'),
+        'status': ('select', 'Status'),  # "Reading", "Read", "To Read"
+        'rating': ('number', 'Rating'),
+        'date_read': ('date', 'Date Read'),
+        'genres': ('multi_select', 'Genre'),
+        'notes': ('rich_text', 'Notes'),
+        'url': ('url', 'URL'),
+    }))
+    
     def __init__(self):
         super().__init__(
             service_name='books_sync',
@@ -71,21 +85,10 @@ class BooksSyncService(OneWaySyncService):
     
     def convert_from_source(self, notion_record: Dict) -> Dict:
         """Convert Notion book page to Supabase format."""
-        props = notion_record.get('properties', {})
-        
-        # Extract values using helpers
-        return {
-            'title': Extract.title(props, 'Name'),
-            'author': Extract.rich_text(props, 'Author'),
-            'status': Extract.select(props, 'Status'),  # "Reading", "Read", "To Read"
-            'rating': Extract.number(props, 'Rating'),
-            'date_read': Extract.date(props, 'Date Read'),
-            'genres': Extract.multi_select(props, 'Genre'),
-            'notes': Extract.rich_text(props, 'Notes'),
-            'url': Extract.url(props, 'URL'),
-            # Files need special handling
-            'cover_url': self._extract_cover(props),
-        }
+        data = self.convert_properties(notion_record)
+        # Files need special handling
+        data['cover_url'] = self._extract_cover(notion_record.get('properties', {}))
+        return data
     
     def _extract_cover(self, props: Dict) -> str:
         """Extract cover image URL from files property."""
@@ -113,34 +116,33 @@ def show_schema():
         print("   Or update the NOTION_BOOKS_DATABASE_ID constant in this file")
         return
     
-    notion = NotionClient(NOTION_API_TOKEN)
-    
-    try:
-        schema = notion.get_database_schema(NOTION_BOOKS_DATABASE_ID)
+    with NotionClient(NOTION_API_TOKEN) as notion:
+        try:
+            schema = notion.get_database_schema(NOTION_BOOKS_DATABASE_ID)
         
-        print(f"\n📚 BOOKS DATABASE SCHEMA")
-        print(f"{'='*60}")
-        print(f"Title: {schema.get('title', [{}])[0].get('plain_text', 'Untitled')}")
-        print(f"ID: {schema.get('id')}")
-        print(f"\nProperties:")
-        print(f"{'-'*60}")
+            print(f"\n📚 BOOKS DATABASE SCHEMA")
+            print(f"{'='*60}")
+            print(f"Title: {schema.get('title', [{}])[0].get('plain_text', 'Untitled')}")
+            print(f"ID: {schema.get('id')}")
+            print(f"\nProperties:")
+            print(f"{'-'*60}")
         
-        for name, prop in schema.get('properties', {}).items():
-            prop_type = prop.get('type', 'unknown')
+            for name, prop in schema.get('properties', {}).items():
+                prop_type = prop.get('type', 'unknown')
             
-            # Get additional info based on type
-            extra = ""
-            if prop_type == 'select':
-                options = [o.get('name') for o in prop.get('select', {}).get('options', [])]
-                extra = f" → [{', '.join(options[:5])}{'...' if len(options) > 5 else ''}]"
-            elif prop_type == 'multi_select':
-                options = [o.get('name') for o in prop.get('multi_select', {}).get('options', [])]
-                extra = f" → [{', '.join(options[:5])}{'...' if len(options) > 5 else ''}]"
+                # Get additional info based on type
+                extra = ""
+                if prop_type == 'select':
+                    options = [o.get('name') for o in prop.get('select', {}).get('options', [])]
+                    extra = f" → [{', '.join(options[:5])}{'...' if len(options) > 5 else ''}]"
+                elif prop_type == 'multi_select':
+                    options = [o.get('name') for o in prop.get('multi_select', {}).get('options', [])]
+                    extra = f" → [{', '.join(options[:5])}{'...' if len(options) > 5 else ''}]"
             
-            print(f"  • {name:25} ({prop_type}){extra}")
+                print(f"  • {name:25} ({prop_type}){extra}")
             
-    except Exception as e:
-        print(f"❌ Failed to get schema: {e}")
+        except Exception as e:
+            print(f"❌ Failed to get schema: {e}")
 
 
 def run_sync(full: bool = False, hours: int = 24) -> Dict:
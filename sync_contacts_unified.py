@@ -409,6 +409,7 @@ class ContactsSyncService(TwoWaySyncService):
         from datetime import timedelta
         stats = SyncStats()
         start_time = time.time()
+        sync_started_iso = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
         
         try:
             # Build filter for incremental sync
@@ -446,7 +447,7 @@ class ContactsSyncService(TwoWaySyncService):
                     data['notion_page_id'] = notion_id
                     data['notion_updated_at'] = notion_record.get('last_edited_time')
                     data['last_sync_source'] = 'notion'
-                    data['updated_at'] = datetime.now(timezone.utc).isoformat()
+                    data['updated_at'] = sync_started_iso
 
                     # Extract content from Notion page body (personal details, notes, etc.)
                     try:
@@ -575,25 +576,13 @@ class ContactsSyncService(TwoWaySyncService):
                     updated_at = r.get('updated_at')
                     notion_updated_at = r.get('notion_updated_at')
                     
-                    if updated_at and notion_updated_at:
-                        # Parse timestamps for comparison
-                        from dateutil.parser import parse as parse_dt
-                        try:
-                            local_ts = parse_dt(updated_at) if isinstance(updated_at, str) else updated_at
-                            notion_ts = parse_dt(notion_updated_at) if isinstance(notion_updated_at, str) else notion_updated_at
-                            
-                            # Ensure both are timezone-aware
-                            if local_ts.tzinfo is None:
-                                local_ts = local_ts.replace(tzinfo=timezone.utc)
-                            if notion_ts.tzinfo is None:
-                                notion_ts = notion_ts.replace(tzinfo=timezone.utc)
-                            
-                            # 5-second buffer to account for timestamp precision
-                            if (local_ts - notion_ts).total_seconds() > 5:
-                                needs_sync = True
-                                self.logger.debug(f"Contact {r.get('id')[:8]}: local update ({local_ts}) > notion ({notion_ts})")
-                        except Exception as e:
-                            self.logger.warning(f"Timestamp comparison failed for {r.get('id')}: {e}")
+                    # 5-second buffer to account for timestamp precision
+                    if self.compare_timestamps(updated_at, notion_updated_at) > 0:
+                        needs_sync = True
+                        self.logger.debug(
+                            "Contact %s: local update (%s) > notion (%s)",
+                            r.get('id', '')[:8], updated_at, notion_updated_at
+                        )
                 
                 if needs_sync:
                     records_to_sync.append(r)
@@ -734,8 +723,14 @@ class ContactsSyncService(TwoWaySyncService):
             self.logger.info(f"Found {len(google_contacts)} Google contacts")
             
             # Get existing Supabase contacts
-            existing = {r.get('google_contact_id'): r for r in self.supabase.select_all() if r.get('google_contact_id')}
-            by_email = {r.get('email'): r for r in self.supabase.select_all() if r.get('email')}
+            # One streamed pass builds both indexes
+            existing = {}
+            by_email = {}
+            for r in self.supabase.iter_all():
+                if r.get('google_contact_id'):
+                    existing[r['google_contact_id']] = r
+                if r.get('email'):
+                    by_email[r['email']] = r
             
             # Safety valve
             is_safe, msg = self.check_safety_valve(len(google_contacts), len(existing), "Google → Supabase")
@@ -844,29 +839,29 @@ def show_schema():
     
     # Notion schema
     print("\n🔷 NOTION CONTACTS:")
-    notion = NotionClient(NOTION_API_TOKEN)
-    try:
-        schema = notion.get_database_schema(NOTION_CONTACTS_DATABASE_ID)
-        print(f"   Title: {schema.get('title', [{}])[0].get('plain_text', 'Untitled')}")
-        print(f"   ID: {schema.get('id')}")
-        print(f"\n   Properties:")
-        for name, prop in schema.get('properties', {}).items():
-            print(f"     • {name:20} ({prop.get('type')})")
-    except Exception as e:
-        print(f"   ❌ Failed to get Notion schema: {e}")
+    with NotionClient(NOTION_API_TOKEN) as notion:
+        try:
+            schema = notion.get_database_schema(NOTION_CONTACTS_DATABASE_ID)
+            print(f"   Title: {schema.get('title', [{}])[0].get('plain_text', 'Untitled')}")
+            print(f"   ID: {schema.get('id')}")
+            print(f"\n   Properties:")
+            for name, prop in schema.get('properties', {}).items():
+                print(f"     • {name:20} ({prop.get('type')})")
+        except Exception as e:
+            print(f"   ❌ Failed to get Notion schema: {e}")
     
     # Supabase schema
     print("\n🔶 SUPABASE CONTACTS:")
-    supabase = SupabaseClient(SUPABASE_URL, SUPABASE_KEY, 'contacts')
-    try:
-        records = supabase.select_all()
-        if records:
-            print(f"   Records: {len(records)}")
-            print(f"   Columns: {', '.join(records[0].keys())}")
-        else:
-            print("   (No records)")
-    except Exception as e:
-        print(f"   ❌ Failed to query Supabase: {e}")
+    with SupabaseClient(SUPABASE_URL, SUPABASE_KEY, 'contacts') as supabase:
+        try:
+            records = supabase.select_all()
+            if records:
+                print(f"   Records: {len(records)}")
+                print(f"   Columns: {', '.join(records[0].keys())}")
+            else:
+                print("   (No records)")
+        except Exception as e:
+            print(f"   ❌ Failed to query Supabase: {e}")
     
     # Google info
     print("\n🔵 GOOGLE CONTACTS:")
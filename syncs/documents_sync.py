@@ -219,6 +219,7 @@ class DocumentsSyncService(TwoWaySyncService):
         """
         stats = SyncStats()
         start_time = __import__('time').time()
+        sync_started_iso = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
         
         try:
             # Build filter
@@ -306,7 +307,7 @@ class DocumentsSyncService(TwoWaySyncService):
                     data['notion_page_id'] = notion_id
                     data['notion_updated_at'] = notion_record.get('last_edited_time')
                     data['last_sync_source'] = 'notion'
-                    data['updated_at'] = datetime.now(timezone.utc).isoformat()
+                    data['updated_at'] = sync_started_iso
                     
                     # Upsert
                     if existing_record:
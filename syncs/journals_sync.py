@@ -249,6 +249,7 @@ class JournalsSyncService(TwoWaySyncService):
         """
         stats = SyncStats()
         start_time = __import__('time').time()
+        sync_started_iso = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
         
         try:
             # Build filter
@@ -346,7 +347,7 @@ class JournalsSyncService(TwoWaySyncService):
                     data['notion_page_id'] = notion_id
                     data['notion_updated_at'] = notion_record.get('last_edited_time')
                     data['last_sync_source'] = 'notion'
-                    data['updated_at'] = datetime.now(timezone.utc).isoformat()
+                    data['updated_at'] = sync_started_iso
                     
                     # Use upsert with date as conflict column (journals are unique by date)
                     if existing_record:
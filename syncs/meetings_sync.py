@@ -210,34 +210,11 @@ class MeetingsNotionClient(BaseNotionClient):
     
     def _get_meeting_block_text(self, block: Dict) -> Optional[str]:
         """Extract plain text from a single block."""
-        block_type = block.get('type')
-        
-        text_block_types = [
-            'paragraph', 'heading_1', 'heading_2', 'heading_3',
-            'bulleted_list_item', 'numbered_list_item', 'to_do',
-            'toggle', 'quote', 'callout'
-        ]
-        
-        if block_type in text_block_types:
-            rich_text = block.get(block_type, {}).get('rich_text', [])
-            return ''.join([t.get('plain_text', '') for t in rich_text])
-        
-        return None
+        return self._get_block_text(block, preserve_formatting=False)
     
     def _get_meeting_block_prefix(self, block_type: str) -> str:
         """Get display prefix for block type."""
-        prefixes = {
-            'heading_1': '# ',
-            'heading_2': '## ',
-            'heading_3': '### ',
-            'bulleted_list_item': '• ',
-            'numbered_list_item': '- ',
-            'to_do': '☐ ',
-            'quote': '> ',
-            'callout': '💡 ',
-            'toggle': '▶ ',
-        }
-        return prefixes.get(block_type, '')
+        return self._get_block_prefix(block_type)
 
 
 # ============================================================================
@@ -595,8 +572,12 @@ class MeetingsSyncService(TwoWaySyncService):
         """Override to use meetings-specific logic."""
         deleted_count = 0
         
-        all_records = self.supabase.select_all()
-        linked_records = [r for r in all_records if r.get('notion_page_id') and not r.get('deleted_at')]
+        # Streamed with only the columns this check reads, so the full
+        # meeting rows (transcripts, summaries) are never downloaded
+        linked_records = [
+            r for r in self.supabase.iter_all(columns='id,notion_page_id,deleted_at,title')
+            if r.get('notion_page_id') and not r.get('deleted_at')
+        ]
         
         if not linked_records:
             self.logger.info("No linked meetings to check for Notion deletions")
@@ -645,6 +626,7 @@ class MeetingsSyncService(TwoWaySyncService):
         from lib.sync_base import SyncMetrics
         stats = SyncStats()
         start_time = __import__('time').time()
+        sync_started_iso = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
         
         try:
             # Cache contacts for faster lookup
@@ -759,7 +741,7 @@ class MeetingsSyncService(TwoWaySyncService):
                     data['notion_page_id'] = notion_id
                     data['notion_updated_at'] = notion_record.get('last_edited_time')
                     data['last_sync_source'] = 'notion'
-                    data['updated_at'] = datetime.now(timezone.utc).isoformat()
+                    data['updated_at'] = sync_started_iso
                     
                     self.supabase.upsert(data, conflict_column='notion_page_id')
                     
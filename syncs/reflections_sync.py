@@ -80,6 +80,12 @@ class ReflectionsSyncService(TwoWaySyncService):
     - people_mentioned (text[]): People mentioned
     - notion_page_id, notion_updated_at, last_sync_source (sync tracking)
     """
+
+    # Quiet incremental runs stop after the pre-check. The phase overrides
+    # below push a subset of the rows the pre-check looks for, so nothing
+    # is missed; pages deleted in Notion are only soft-deleted on the next
+    # run that has other changes (or a full sync).
+    SKIP_UNCHANGED = True
     
     def __init__(self):
         super().__init__(
@@ -184,6 +190,7 @@ class ReflectionsSyncService(TwoWaySyncService):
         """
         stats = SyncStats()
         start_time = __import__('time').time()
+        sync_started_iso = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
         
         try:
             # Get Notion records
@@ -267,7 +274,7 @@ class ReflectionsSyncService(TwoWaySyncService):
                     data['notion_page_id'] = notion_id
                     data['notion_updated_at'] = notion_record.get('last_edited_time')
                     data['last_sync_source'] = 'notion'
-                    data['updated_at'] = datetime.now(timezone.utc).isoformat()
+                    data['updated_at'] = sync_started_iso
                     
                     # Use upsert
                     if existing_record:
@@ -0,0 +1,74 @@
+"""
+Tests for lib/logging_service.py
+
+All tests are fully mocked -- NO real API calls.
+
+Tests cover:
+- Unbatched events insert one row each
+- Batched events insert LOG_FLUSH_SIZE rows per request and flush on exit
+- Rows are stamped with created_at when logged
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+def inserted_batches(supabase):
+    return [c.args[0] for c in supabase.table.return_value.insert.call_args_list]
+
+
+def without_created_at(row):
+    return {k: v for k, v in row.items() if k != 'created_at'}
+
+
+class TestLogSyncEvent:
+    """Test log_sync_event with and without batching."""
+
+    def test_unbatched_event_inserted_immediately(self):
+        from lib import logging_service
+        supabase = MagicMock()
+        with patch.object(logging_service, 'supabase', supabase):
+            asyncio.run(logging_service.log_sync_event('sync_start', 'info', 'Starting'))
+
+        [row] = inserted_batches(supabase)
+        assert without_created_at(row) == {'event_type': 'sync_start', 'status': 'info', 'message': 'Starting'}
+
+    def test_batched_events_flushed_in_chunks_and_on_exit(self):
+        from lib import logging_service
+
+        async def run():
+            async with logging_service.batched_sync_events():
+                for i in range(logging_service.LOG_FLUSH_SIZE + 5):
+                    await logging_service.log_sync_event('update_google', 'success', f'Updated {i}')
+                assert len(inserted_batches(supabase)) == 1
+            # Events after the block are not batched
+            await logging_service.log_sync_event('sync_start', 'info', 'Next run')
+
+        supabase = MagicMock()
+        with patch.object(logging_service, 'supabase', supabase):
+            asyncio.run(run())
+
+        batches = inserted_batches(supabase)
+        assert [len(b) for b in batches[:2]] == [logging_service.LOG_FLUSH_SIZE, 5]
+        assert batches[1][-1]['message'] == f'Updated {logging_service.LOG_FLUSH_SIZE + 4}'
+        assert batches[2]['message'] == 'Next run'
+        # Each row keeps the time it was logged, not the time of its batch insert
+        created = [row['created_at'] for row in batches[0]]
+        assert created == sorted(created)
+
+    def test_buffer_flushed_when_block_raises(self):
+        from lib import logging_service
+
+        async def run():
+            async with logging_service.batched_sync_events():
+                await logging_service.log_sync_event('sync_fatal', 'error', 'Boom')
+                raise RuntimeError('boom')
+
+        supabase = MagicMock()
+        with patch.object(logging_service, 'supabase', supabase):
+            with pytest.raises(RuntimeError):
+                asyncio.run(run())
+
+        [[row]] = inserted_batches(supabase)
+        assert without_created_at(row) == {'event_type': 'sync_fatal', 'status': 'error', 'message': 'Boom'}
@@ -99,8 +99,10 @@ class TestSafetyValve:
         service = self._make_service()
         import lib.sync_base as sb
         original = sb.SAFETY_VALVE_THRESHOLD
+        original_bp = sb.SAFETY_VALVE_THRESHOLD_BP
         original_mode = sb.SAFETY_VALVE_MODE
         sb.SAFETY_VALVE_THRESHOLD = 0.5
+        sb.SAFETY_VALVE_THRESHOLD_BP = 5000
         sb.SAFETY_VALVE_MODE = 'abort'
         try:
             # 40 / 100 = 40%, below 50% threshold
@@ -109,8 +111,33 @@ class TestSafetyValve:
             assert "threshold=50%" in msg
         finally:
             sb.SAFETY_VALVE_THRESHOLD = original
+            sb.SAFETY_VALVE_THRESHOLD_BP = original_bp
             sb.SAFETY_VALVE_MODE = original_mode
 
+    def test_threshold_boundary_is_exact(self):
+        """Exactly at the threshold is safe, even where the float product overshoots."""
+        service = self._make_service()
+        with patch('lib.sync_base.SAFETY_VALVE_THRESHOLD', 0.07), \
+                patch('lib.sync_base.SAFETY_VALVE_THRESHOLD_BP', 700), \
+                patch('lib.sync_base.SAFETY_VALVE_MODE', 'abort'):
+            assert 100 * 0.07 > 7
+            assert service.check_safety_valve(7, 100, "test") == (True, "")
+            assert service.check_safety_valve(6, 100, "test")[0] is False
+
+    def test_count_limit_settles_the_verdict(self):
+        """Any destination count at or past the limit gets the same verdict as the limit."""
+        service = self._make_service()
+        with patch('lib.sync_base.SAFETY_VALVE_THRESHOLD', 0.07), \
+                patch('lib.sync_base.SAFETY_VALVE_THRESHOLD_BP', 700), \
+                patch('lib.sync_base.SAFETY_VALVE_MODE', 'abort'):
+            for source in (0, 1, 7, 50):
+                limit = service.safety_valve_count_limit(source)
+                verdict = service.check_safety_valve(source, limit, "test")[0]
+                for dest in range(limit, limit + 200):
+                    assert service.check_safety_valve(source, dest, "test")[0] is verdict
+                # One short of the limit the verdict is different
+                assert service.check_safety_valve(source, limit - 1, "test")[0] is not verdict
+
     def test_warning_mode_continues(self):
         """In warning mode, safety valve logs but allows sync to continue."""
         service = self._make_service()
@@ -275,6 +302,25 @@ class TestCompareTimestamps:
         )
         assert result == 0
 
+    def test_parse_ts_ns(self):
+        from lib.sync_base import BaseSyncService
+        parse = BaseSyncService._parse_ts_ns
+        assert parse("1970-01-01T00:00:01.000001Z") == 1_000_001_000
+        assert parse("2025-01-01T02:00:00+02:00") == parse("2025-01-01T00:00:00Z")
+        assert parse("2025-01-01T00:00:00") == parse("2025-01-01T00:00:00Z")
+        assert parse("not-a-date") is None
+        assert parse(None) is None
+
+    def test_compare_timestamps_ns(self):
+        from lib.sync_base import BaseSyncService
+        compare = BaseSyncService.compare_timestamps_ns
+        second = 1_000_000_000
+        assert compare(10 * second, 0) == 1
+        assert compare(0, 10 * second) == -1
+        assert compare(5 * second, 0) == 0
+        assert compare(2 * second, 0, buffer_ns=second) == 1
+        assert compare(None, 0) == 0
+
 
 # ============================================================================
 # NotionPropertyExtractor Tests
@@ -406,6 +452,44 @@ class TestNotionPropertyExtractor:
         props = {"People": {"relation": []}}
         assert NotionPropertyExtractor.relation(props, "People") == []
 
+    @pytest.mark.parametrize("kind,prop", [
+        ("title", {"title": [{"plain_text": "Hi"}]}),
+        ("title", {"title": []}),
+        ("rich_text", {"rich_text": [{"text": {}}]}),
+        ("rich_text", {"rich_text": []}),
+        ("select", {"select": {"name": "A"}}),
+        ("select", {"select": None}),
+        ("date", {"date": None}),
+        ("number", {"number": 3}),
+        ("checkbox", {}),
+        ("multi_select", {"multi_select": [{"name": "x"}]}),
+        ("relation", {"relation": [{"id": "p"}, {}]}),
+        ("url", None),
+    ])
+    def test_compile_converter_matches_static_extractors(self, kind, prop):
+        from lib.sync_base import BaseSyncService, NotionPropertyExtractor
+        props = {"P": prop} if prop is not None else {}
+        convert = BaseSyncService.compile_converter({"col": (kind, "P")})
+        assert convert({"properties": props})["col"] == getattr(NotionPropertyExtractor, kind)(props, "P")
+
+    def test_compile_converter_builds_rows(self):
+        from lib.sync_base import BaseSyncService, NotionPage
+        convert = BaseSyncService.compile_converter({
+            'title': ('title', 'Name'),
+            'tags': ('multi_select', 'Tags'),
+            'url': ('url', 'Missing'),
+        })
+        page = {'properties': {'Name': {'title': [{'plain_text': 'Book'}]},
+                               'Tags': {'multi_select': [{'name': 'a'}]}}}
+        expected = {'title': 'Book', 'tags': ['a'], 'url': None}
+        assert convert(page) == expected
+        assert convert(NotionPage.from_api({'id': 'p', **page})) == expected
+
+    def test_compile_converter_rejects_unknown_kind(self):
+        from lib.sync_base import BaseSyncService
+        with pytest.raises(ValueError):
+            BaseSyncService.compile_converter({"col": ("compile_converter", "P")})
+
 
 # ============================================================================
 # NotionPropertyBuilder Tests
@@ -435,6 +519,22 @@ class TestNotionPropertyBuilder:
         result = NotionPropertyBuilder.rich_text(None)
         assert result == {"rich_text": []}
 
+    def test_builders_return_fresh_objects(self):
+        """Empty values must not share one dict: callers edit property sets in place."""
+        from lib.sync_base import NotionPropertyBuilder
+        for build, value in [
+            (NotionPropertyBuilder.rich_text, None),
+            (NotionPropertyBuilder.select, None),
+            (NotionPropertyBuilder.date, None),
+            (NotionPropertyBuilder.multi_select, []),
+        ]:
+            first, second = build(value), build(value)
+            assert first == second
+            assert first is not second
+            key = next(iter(first))
+            if first[key] is not None:
+                assert first[key] is not second[key]
+
     def test_build_rich_text_truncation(self):
         from lib.sync_base import NotionPropertyBuilder
         long_text = "x" * 3000
@@ -628,6 +728,37 @@ class TestContentBlockBuilder:
         # Should have at least 2 blocks since total > 1990
         assert len(blocks) >= 2
 
+    def test_chunked_paragraphs_chunk_text(self):
+        """Chunks keep separators between packed paragraphs and drop leading blank ones."""
+        from lib.sync_base import ContentBlockBuilder
+        with patch.object(ContentBlockBuilder, 'paragraph', side_effect=lambda t: t):
+            assert ContentBlockBuilder.chunked_paragraphs("\n\naa\n\nbb\n\ncc", 6) == ["aa\n\nbb", "cc"]
+            assert ContentBlockBuilder.chunked_paragraphs("abcdefg\n\nh", 3) == ["abc", "def", "g", "h"]
+            assert ContentBlockBuilder.chunked_paragraphs("\n\n\n\n", 3) == []
+
+    def test_clip(self):
+        from lib.sync_base import ContentBlockBuilder, _clip
+        short = "x" * 10
+        assert _clip(short) is short
+        assert _clip("abcdef", 3) == "abc"
+        block = ContentBlockBuilder.paragraph("y" * 3000)
+        assert len(block["paragraph"]["rich_text"][0]["text"]["content"]) == ContentBlockBuilder.NOTION_BLOCK_LIMIT
+
+    def test_from_structured_content_iter_is_lazy(self):
+        from lib.sync_base import ContentBlockBuilder
+        content = {
+            "summary": "Sum",
+            "sections": [{"heading": "H", "content": "C", "items": ["i"]}],
+            "action_items": ["t"],
+        }
+        stream = ContentBlockBuilder.from_structured_content_iter(content)
+        assert next(stream)["type"] == "heading_2"
+        blocks = ContentBlockBuilder.from_structured_content(content)
+        assert [b["type"] for b in blocks] == [
+            "heading_2", "paragraph", "heading_3", "paragraph",
+            "bulleted_list_item", "heading_2", "to_do",
+        ]
+
     def test_paragraph_builder(self):
         from lib.sync_base import ContentBlockBuilder
         block = ContentBlockBuilder.paragraph("Hello")
@@ -798,6 +929,107 @@ class TestRetryOnError:
             not_found()
         assert call_count == 1
 
+    def test_retries_on_408_timeout(self):
+        """408 Request Timeout is transient and should be retried."""
+        from lib.sync_base import retry_on_error
+
+        call_count = 0
+        mock_response = MagicMock()
+        mock_response.status_code = 408
+        mock_response.headers = {}
+
+        @retry_on_error(max_retries=3, base_delay=0.01)
+        def timeout_then_ok():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise httpx.HTTPStatusError("timeout", request=MagicMock(), response=mock_response)
+            return "ok"
+
+        assert timeout_then_ok() == "ok"
+        assert call_count == 2
+
+    def test_no_retry_on_501(self):
+        """501 Not Implemented will not fix itself and should not be retried."""
+        from lib.sync_base import retry_on_error
+
+        call_count = 0
+        mock_response = MagicMock()
+        mock_response.status_code = 501
+        mock_response.headers = {}
+
+        @retry_on_error(max_retries=3, base_delay=0.01)
+        def not_implemented():
+            nonlocal call_count
+            call_count += 1
+            raise httpx.HTTPStatusError("not implemented", request=MagicMock(), response=mock_response)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            not_implemented()
+        assert call_count == 1
+
+    def test_retry_after_is_capped(self):
+        """Huge Retry-After values should be capped."""
+        from lib.sync_base import retry_on_error, MAX_RETRY_AFTER_SECONDS
+
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.headers = {'Retry-After': '3600'}
+        calls = []
+
+        @retry_on_error(max_retries=2, base_delay=0.01)
+        def rate_limited_then_ok():
+            calls.append(1)
+            if len(calls) < 2:
+                raise httpx.HTTPStatusError("rate limited", request=MagicMock(), response=mock_response)
+            return "ok"
+
+        with patch('lib.sync_base.time.sleep') as mock_sleep:
+            assert rate_limited_then_ok() == "ok"
+        mock_sleep.assert_called_once_with(MAX_RETRY_AFTER_SECONDS)
+
+    def test_backoff_includes_jitter(self):
+        """Transient-error backoff adds up to base_delay of jitter."""
+        from lib.sync_base import retry_on_error
+
+        @retry_on_error(max_retries=2, base_delay=1.0)
+        def always_fail():
+            raise ConnectionError("down")
+
+        with patch('lib.sync_base.time.sleep') as mock_sleep, \
+                patch('lib.sync_base.random.uniform', return_value=0.5) as mock_uniform:
+            with pytest.raises(ConnectionError):
+                always_fail()
+        mock_uniform.assert_called_with(0, 1.0)
+        mock_sleep.assert_called_once_with(1.5)
+
+    def test_retries_counted_on_running_sync_metrics(self):
+        """Retries during a sync are reported to that sync's SyncMetrics."""
+        from lib.sync_base import retry_on_error, SyncMetrics, _current_metrics
+
+        rate_limited = MagicMock()
+        rate_limited.status_code = 429
+        rate_limited.headers = {'Retry-After': '0.01'}
+        calls = []
+
+        @retry_on_error(max_retries=3, base_delay=0.01)
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise httpx.HTTPStatusError("rate limited", request=MagicMock(), response=rate_limited)
+            if len(calls) == 2:
+                raise ConnectionError("reset")
+            return "ok"
+
+        metrics = SyncMetrics()
+        token = _current_metrics.set(metrics)
+        try:
+            assert flaky() == "ok"
+        finally:
+            _current_metrics.reset(token)
+        assert metrics.retries == 2
+        assert metrics.rate_limit_events == 1
+
 
 # ============================================================================
 # _extract_retry_after Tests
@@ -859,6 +1091,49 @@ class TestSyncStats:
         assert d['updated'] == 2
         assert d['total_processed'] == 3
 
+    def test_is_slotted(self):
+        from lib.sync_base import SyncStats
+        stats = SyncStats()
+        assert not hasattr(stats, '__dict__')
+        with pytest.raises(AttributeError):
+            stats.unknown_counter = 1
+
+
+# ============================================================================
+# SyncMetrics Tests
+# ============================================================================
+
+
+class TestSyncMetrics:
+    """Test SyncMetrics dataclass."""
+
+    def test_to_dict_uses_one_clock_reading(self):
+        from datetime import datetime, timezone, timedelta
+        from lib.sync_base import SyncMetrics
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        metrics = SyncMetrics(start_time=start, end_time=start + timedelta(seconds=4), records_read=10)
+        d = metrics.to_dict()
+        assert d['timing']['total_seconds'] == 4.0
+        assert d['throughput']['records_per_second'] == 2.5
+        assert d['staleness']['newest_source_change'] is None
+
+    def test_is_slotted_and_finish_fixes_duration(self):
+        from lib.sync_base import SyncMetrics
+        metrics = SyncMetrics()
+        assert not hasattr(metrics, '__dict__')
+        metrics.finish()
+        duration = metrics.total_duration_seconds
+        time.sleep(0.01)
+        assert metrics.total_duration_seconds == duration
+
+    def test_to_dict_returns_independent_dicts(self):
+        from lib.sync_base import SyncMetrics
+        metrics = SyncMetrics()
+        first = metrics.to_dict()
+        metrics.records_read = 7
+        assert first['counts']['records_read'] == 0
+        assert metrics.to_dict()['counts']['records_read'] == 7
+
 
 # ============================================================================
 # SyncResult Tests
@@ -876,3 +1151,874 @@ class TestSyncResult:
         assert d['success'] is True
         assert d['direction'] == "test"
         assert d['stats']['created'] == 1
+
+
+# ============================================================================
+# SupabaseClient Tests
+# ============================================================================
+
+
+def _make_supabase_client(handler, table_name='meetings'):
+    """Create a SupabaseClient whose HTTP traffic is served by handler."""
+    from lib.sync_base import SupabaseClient
+    client = SupabaseClient('https://test.supabase.co', 'test-key', table_name)
+    client.client = httpx.Client(headers=client.headers, transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestSetupLogger:
+    """Test setup_logger idempotence."""
+
+    def test_repeat_calls_reuse_handler_and_skip_set_level(self):
+        import logging
+        from lib.sync_base import setup_logger
+        logger = setup_logger("TestSetupLogger.repeat")
+        with patch.object(logging.Logger, 'setLevel') as set_level:
+            assert setup_logger("TestSetupLogger.repeat") is logger
+            set_level.assert_not_called()
+        assert len(logger.handlers) == 1
+        setup_logger("TestSetupLogger.repeat", logging.DEBUG)
+        assert logger.level == logging.DEBUG
+
+
+class TestJsonHelpers:
+    """Test _json_dumps/_json_loads with and without orjson."""
+
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_round_trip(self, has_orjson):
+        import lib.sync_base as sb
+        if has_orjson and not sb.HAS_ORJSON:
+            pytest.skip('orjson not installed')
+        payload = {'title': 'Café ☕', 'tags': ['a', 'b'], 'count': 3, 'archived': None}
+        with patch.object(sb, 'HAS_ORJSON', has_orjson):
+            encoded = sb._json_dumps(payload)
+            assert isinstance(encoded, bytes)
+            assert sb._json_loads(encoded) == payload
+
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_dumps_dates_and_int_keys(self, has_orjson):
+        import lib.sync_base as sb
+        from datetime import date, datetime, timezone
+        if has_orjson and not sb.HAS_ORJSON:
+            pytest.skip('orjson not installed')
+        payload = {'day': date(2025, 1, 2), 'at': datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc), 1: 'one'}
+        with patch.object(sb, 'HAS_ORJSON', has_orjson):
+            decoded = sb._json_loads(sb._json_dumps(payload))
+        assert decoded == {'day': '2025-01-02', 'at': '2025-01-02T03:04:05+00:00', '1': 'one'}
+
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_content_hash_ignores_key_order(self, has_orjson):
+        import lib.sync_base as sb
+        if has_orjson and not sb.HAS_ORJSON:
+            pytest.skip('orjson not installed')
+        with patch.object(sb, 'HAS_ORJSON', has_orjson):
+            digest = sb._content_hash({'b': [1, 'é'], 'a': None})
+            assert digest == sb._content_hash({'a': None, 'b': [1, 'é']})
+        assert len(digest) == 16
+        assert digest == sb._content_hash({'a': None, 'b': [1, 'é']})
+
+
+class TestSharedTransport:
+    """Test that API clients share one connection pool per host."""
+
+    def test_clients_for_same_host_share_transport(self):
+        from lib.sync_base import SupabaseClient, _shared_transport
+        a = SupabaseClient('https://pool.supabase.co', 'test-key', 'meetings')
+        b = SupabaseClient('https://pool.supabase.co', 'test-key', 'tasks')
+        assert a.client._transport._pool is b.client._transport._pool
+        assert a.client._transport._pool is _shared_transport('https://pool.supabase.co/rest/v1')
+        # Default headers stay per client
+        assert a.client.headers['apikey'] == 'test-key'
+
+    def test_closing_one_client_keeps_pool_open(self):
+        from lib.sync_base import SupabaseClient
+        with SupabaseClient('https://pool.supabase.co', 'test-key', 'meetings') as a:
+            pool = a.client._transport._pool
+        assert a.client.is_closed
+        b = SupabaseClient('https://pool.supabase.co', 'test-key', 'tasks')
+        assert not b.client.is_closed
+        assert b.client._transport._pool is pool
+
+    def test_notion_clients_share_transport(self):
+        from lib.sync_base import NotionClient
+        a = NotionClient('token-a')
+        b = NotionClient('token-b')
+        assert a.client._transport._pool is b.client._transport._pool
+        assert a.client.headers['Authorization'] == 'Bearer token-a'
+        assert b.client.headers['Authorization'] == 'Bearer token-b'
+
+
+class TestNotionPage:
+    """Test the slotted NotionPage record view."""
+
+    def test_wraps_api_page(self):
+        from lib.sync_base import NotionPage
+        raw = {'id': 'p-1', 'last_edited_time': 't', 'properties': {'Name': {}}, 'url': 'u'}
+        page = NotionPage.from_api(raw)
+        assert (page.id, page.last_edited_time, page.properties) == ('p-1', 't', {'Name': {}})
+        assert page.get('url') == 'u'
+        assert page['id'] == 'p-1'
+        assert page.get('missing', 'x') == 'x'
+        assert not hasattr(page, '__dict__')
+
+    def test_query_pages_wraps_results(self):
+        from lib.sync_base import NotionClient, NotionPage
+        client = NotionClient("test-token")
+        with patch.object(client, 'iter_database', return_value=iter([{'id': 'p-1'}])):
+            pages = client.query_pages('db')
+        assert pages == [NotionPage('p-1', None, {}, {'id': 'p-1'})]
+
+
+class TestNotionClientIterators:
+    """Test NotionClient.iter_database / iter_blocks streaming pagination."""
+
+    def _make_client(self, handler):
+        from lib.sync_base import NotionClient
+        client = NotionClient('test-token')
+        client.client = httpx.Client(headers=client.headers, transport=httpx.MockTransport(handler))
+        return client
+
+    def test_iter_database_yields_across_pages(self):
+        import json
+        calls = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            calls.append(body.get('start_cursor'))
+            if body.get('start_cursor') is None:
+                return httpx.Response(200, json={'results': [{'id': 'p1'}, {'id': 'p2'}],
+                                                 'has_more': True, 'next_cursor': 'c2'})
+            return httpx.Response(200, json={'results': [{'id': 'p3'}], 'has_more': False})
+
+        client = self._make_client(handler)
+        pages = client.iter_database('db-1')
+        assert next(pages) == {'id': 'p1'}
+        assert calls == [None]  # second page not fetched yet
+        assert [p['id'] for p in pages] == ['p2', 'p3']
+        assert calls == [None, 'c2']
+        calls.clear()
+        assert [p['id'] for p in client.query_database('db-1')] == ['p1', 'p2', 'p3']
+
+    def test_iter_page_ids_streams_ids(self):
+        def handler(request):
+            return httpx.Response(200, json={'results': [{'id': 'p1', 'properties': {}}, {'id': 'p2'}],
+                                             'has_more': False})
+
+        client = self._make_client(handler)
+        assert list(client.iter_page_ids('db-1')) == ['p1', 'p2']
+
+    def test_count_pages_stops_at_limit(self):
+        import json
+        sizes = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            sizes.append(body['page_size'])
+            results = [{'id': f'p{i}'} for i in range(body['page_size'])]
+            return httpx.Response(200, json={'results': results, 'has_more': True, 'next_cursor': 'c'})
+
+        client = self._make_client(handler)
+        assert client.count_pages('db-1', limit=5) == 5
+        assert sizes == [5]
+        assert client.count_pages('db-1', limit=0) == 0
+        assert sizes == [5]
+
+    def test_iter_blocks_paginates(self):
+        def handler(request):
+            if 'start_cursor' not in request.url.params:
+                return httpx.Response(200, json={'results': [{'id': 'b1'}], 'has_more': True, 'next_cursor': 'c2'})
+            return httpx.Response(200, json={'results': [{'id': 'b2'}], 'has_more': False})
+
+        client = self._make_client(handler)
+        assert [b['id'] for b in client.iter_blocks('page-1')] == ['b1', 'b2']
+        assert client.get_all_blocks('page-1') == [{'id': 'b1'}, {'id': 'b2'}]
+
+
+class TestExtractBlocksText:
+    """Test NotionClient._extract_blocks_text traversal."""
+
+    BLOCKS = {
+        'ai': [
+            {'id': 'ai-1', 'type': 'paragraph', 'has_children': False,
+             'paragraph': {'rich_text': [{'plain_text': 'Summary'}]}},
+        ],
+        't1': [
+            {'id': 't1-1', 'type': 'bulleted_list_item', 'has_children': False,
+             'bulleted_list_item': {'rich_text': [{'plain_text': 'Nested'}]}},
+        ],
+    }
+
+    def _client(self, fetched):
+        from lib.sync_base import NotionClient
+        client = NotionClient('test-token')
+
+        def get_children(block_id):
+            fetched.append(block_id)
+            return self.BLOCKS.get(block_id, [])
+
+        client.get_block_children = get_children
+        return client
+
+    def test_page_order_indent_and_unsupported(self):
+        fetched = []
+        client = self._client(fetched)
+        blocks = [
+            {'id': 'h', 'type': 'heading_2', 'has_children': False,
+             'heading_2': {'rich_text': [{'plain_text': 'Title'}]}},
+            {'id': 'ai', 'type': 'unsupported', 'has_children': True},
+            {'id': 't1', 'type': 'toggle', 'has_children': True,
+             'toggle': {'rich_text': [{'plain_text': 'Toggle'}]}},
+            {'id': 'p', 'type': 'paragraph', 'has_children': False,
+             'paragraph': {'rich_text': [{'plain_text': 'End'}]}},
+        ]
+        text, has_unsupported = client._extract_blocks_text(blocks)
+        assert text == '## Title\n  Summary\n▶ Toggle\n  • Nested\nEnd'
+        assert has_unsupported is True
+        assert sorted(fetched) == ['ai', 't1']
+
+    def test_max_depth_zero_skips_children(self):
+        fetched = []
+        client = self._client(fetched)
+        blocks = [{'id': 't1', 'type': 'toggle', 'has_children': True,
+                   'toggle': {'rich_text': [{'plain_text': 'Toggle'}]}}]
+        text, _ = client._extract_blocks_text(blocks, max_depth=0)
+        assert text == '▶ Toggle'
+        assert fetched == []
+
+
+class TestNotionArchivePage:
+    """Test NotionClient.archive_page."""
+
+    def _client(self, handler):
+        from lib.sync_base import NotionClient
+        client = NotionClient('test-token')
+        client.client = httpx.Client(headers=client.headers, transport=httpx.MockTransport(handler))
+        return client
+
+    def test_single_patch_without_precheck(self):
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(200, json={'id': 'p1', 'archived': True})
+
+        assert self._client(handler).archive_page('p1')['archived'] is True
+        assert methods == ['PATCH']
+
+    def test_already_archived_validation_error_is_success(self):
+        def handler(request):
+            return httpx.Response(400, json={'code': 'validation_error',
+                                             'message': "Can't edit block that is archived."})
+
+        result = self._client(handler).archive_page('p1')
+        assert result == {'id': 'p1', 'archived': True, 'already_archived': True}
+
+    def test_trashed_page_validation_error_is_success(self):
+        def handler(request):
+            return httpx.Response(400, json={'code': 'validation_error',
+                                             'message': "Can't edit page on block with an archived ancestor (in trash)."})
+
+        assert self._client(handler).archive_page('p1')['already_archived'] is True
+
+    def test_other_validation_errors_raise(self):
+        def handler(request):
+            return httpx.Response(400, json={'code': 'validation_error',
+                                             'message': 'body failed validation: body.properties should be an object.'})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            self._client(handler).archive_page('p1')
+
+    def test_other_errors_raise(self):
+        def handler(request):
+            return httpx.Response(401, json={'code': 'unauthorized'})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            self._client(handler).archive_page('p1')
+
+
+class TestNotionAppendBlocks:
+    """Test NotionClient.append_blocks chunking."""
+
+    def test_chunks_over_block_limit_and_keeps_order(self):
+        import json
+        from lib.sync_base import NotionClient, MAX_BLOCKS_PER_REQUEST
+        bodies = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            bodies.append(body)
+            offset = sum(len(b['children']) for b in bodies[:-1])
+            return httpx.Response(200, json={'results': [
+                {'id': f'new-{offset + i}'} for i in range(len(body['children']))
+            ]})
+
+        client = NotionClient('test-token')
+        client.client = httpx.Client(headers=client.headers, transport=httpx.MockTransport(handler))
+        blocks = [{'type': 'paragraph'} for _ in range(MAX_BLOCKS_PER_REQUEST * 2 + 5)]
+        results = client.append_blocks('page-1', blocks, after='anchor')
+
+        assert [len(b['children']) for b in bodies] == [MAX_BLOCKS_PER_REQUEST, MAX_BLOCKS_PER_REQUEST, 5]
+        assert [b['after'] for b in bodies] == [
+            'anchor', f'new-{MAX_BLOCKS_PER_REQUEST - 1}', f'new-{MAX_BLOCKS_PER_REQUEST * 2 - 1}'
+        ]
+        assert len(results) == len(blocks)
+
+    def test_accepts_generator(self):
+        import json
+        from lib.sync_base import NotionClient, MAX_BLOCKS_PER_REQUEST
+        sizes = []
+
+        def handler(request):
+            children = json.loads(request.content)['children']
+            sizes.append(len(children))
+            return httpx.Response(200, json={'results': [{'id': 'x'} for _ in children]})
+
+        client = NotionClient('test-token')
+        client.client = httpx.Client(headers=client.headers, transport=httpx.MockTransport(handler))
+        blocks = ({'type': 'paragraph'} for _ in range(MAX_BLOCKS_PER_REQUEST + 1))
+        assert len(client.append_blocks('page-1', blocks)) == MAX_BLOCKS_PER_REQUEST + 1
+        assert sizes == [MAX_BLOCKS_PER_REQUEST, 1]
+        assert client.append_blocks('page-1', iter([])) == []
+        assert sizes == [MAX_BLOCKS_PER_REQUEST, 1]
+
+
+class TestNotionSchemaCache:
+    """Test NotionClient.get_database_schema TTL caching."""
+
+    def test_schema_cached_across_instances_until_ttl(self):
+        from lib.sync_base import NotionClient
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={'id': 'db-cache', 'properties': {}})
+
+        def make():
+            client = NotionClient('schema-token')
+            client.client = httpx.Client(headers=client.headers, transport=httpx.MockTransport(handler))
+            return client
+
+        NotionClient._schema_cache.clear()
+        with patch('lib.sync_base.time.monotonic', return_value=1000.0):
+            assert make().get_database_schema('db-cache')['id'] == 'db-cache'
+            make().get_database_schema('db-cache')
+        assert len(calls) == 1
+
+        with patch('lib.sync_base.time.monotonic', return_value=1000.0 + NotionClient.SCHEMA_CACHE_TTL):
+            make().get_database_schema('db-cache')
+        assert len(calls) == 2
+        NotionClient._schema_cache.clear()
+
+
+class TestSupabaseClientPagination:
+    """Test SupabaseClient._paginated_get Range paging."""
+
+    def test_pages_until_short_page(self):
+        ranges = []
+        rows = [{'id': i} for i in range(5)]
+
+        def handler(request):
+            assert request.headers['Range-Unit'] == 'items'
+            assert request.headers['apikey'] == 'test-key'
+            start, end = map(int, request.headers['Range'].split('-'))
+            ranges.append((start, end))
+            return httpx.Response(206, json=rows[start:end + 1])
+
+        client = _make_supabase_client(handler)
+        client.PAGE_SIZE = 2
+        assert client.select_all() == rows
+        assert ranges == [(0, 1), (2, 3), (4, 5)]
+
+    def test_iter_all_fetches_pages_lazily(self):
+        ranges = []
+        rows = [{'id': i} for i in range(5)]
+
+        def handler(request):
+            start, end = map(int, request.headers['Range'].split('-'))
+            ranges.append((start, end))
+            return httpx.Response(206, json=rows[start:end + 1])
+
+        client = _make_supabase_client(handler)
+        client.PAGE_SIZE = 2
+        stream = client.iter_all(columns='id')
+        assert [next(stream), next(stream)] == rows[:2]
+        assert ranges == [(0, 1)]
+        assert list(stream) == rows[2:]
+        assert ranges == [(0, 1), (2, 3), (4, 5)]
+
+
+class TestSupabaseClientCount:
+    """Test SupabaseClient.count HEAD-based row counting."""
+
+    def test_count_parses_content_range(self):
+        seen = {}
+
+        def handler(request):
+            seen['method'] = request.method
+            seen['prefer'] = request.headers.get('Prefer')
+            seen['params'] = dict(request.url.params)
+            return httpx.Response(200, headers={'Content-Range': '*/1234'})
+
+        client = _make_supabase_client(handler)
+        assert client.count({'notion_page_id': 'not.is.null'}) == 1234
+        assert seen['method'] == 'HEAD'
+        assert seen['prefer'] == 'count=exact'
+        assert seen['params']['notion_page_id'] == 'not.is.null'
+
+    def test_count_with_range_prefix(self):
+        client = _make_supabase_client(
+            lambda request: httpx.Response(206, headers={'Content-Range': '0-0/42'})
+        )
+        assert client.count() == 42
+
+    @pytest.mark.parametrize('headers', [{}, {'Content-Range': '*/*'}])
+    def test_count_falls_back_to_get_without_total(self, headers):
+        def handler(request):
+            if request.method == 'HEAD':
+                return httpx.Response(200, headers=headers)
+            assert request.url.params['deleted_at'] == 'is.null'
+            return httpx.Response(200, json=[{'id': 'a'}, {'id': 'b'}])
+
+        client = _make_supabase_client(handler)
+        assert client.count({'deleted_at': 'is.null'}) == 2
+
+
+class TestSupabaseClientUpsert:
+    """Test SupabaseClient.upsert request shape."""
+
+    def test_upsert_sends_merge_duplicates_prefer(self):
+        seen = {}
+
+        def handler(request):
+            seen['prefer'] = request.headers.get('Prefer')
+            seen['apikey'] = request.headers.get('apikey')
+            seen['query'] = request.url.query.decode()
+            return httpx.Response(201, json=[{'id': 'row-1'}])
+
+        client = _make_supabase_client(handler)
+        assert client.upsert({'notion_page_id': 'n-1'}) == {'id': 'row-1'}
+        assert seen['prefer'] == 'resolution=merge-duplicates,return=representation'
+        assert seen['apikey'] == 'test-key'
+        assert seen['query'] == 'on_conflict=notion_page_id'
+
+
+class TestSupabaseClientUpsertMany:
+    """Test SupabaseClient.upsert_many bulk upserts."""
+
+    def _client(self, bodies):
+        import json
+
+        def handler(request):
+            body = json.loads(request.content)
+            bodies.append(body)
+            return httpx.Response(201, json=body)
+
+        return _make_supabase_client(handler)
+
+    def test_chunks_rows(self):
+        bodies = []
+        client = self._client(bodies)
+        rows = [{'notion_page_id': f'n-{i}', 'title': str(i)} for i in range(5)]
+        result = client.upsert_many(rows, chunk=2)
+        assert [len(b) for b in bodies] == [2, 2, 1]
+        assert result == rows
+
+    def test_groups_rows_by_key_set(self):
+        bodies = []
+        client = self._client(bodies)
+        rows = [
+            {'notion_page_id': 'n-1', 'title': 'A'},
+            {'notion_page_id': 'n-2', 'title': 'B', 'content': 'x'},
+            {'notion_page_id': 'n-3', 'title': 'C'},
+        ]
+        client.upsert_many(rows)
+        assert len(bodies) == 2
+        for body in bodies:
+            assert len({tuple(sorted(r)) for r in body}) == 1
+
+    def test_collapses_duplicate_conflict_values(self):
+        bodies = []
+        client = self._client(bodies)
+        client.upsert_many([
+            {'notion_page_id': 'n-1', 'title': 'old'},
+            {'notion_page_id': 'n-1', 'title': 'new'},
+        ])
+        assert bodies == [[{'notion_page_id': 'n-1', 'title': 'new'}]]
+
+    def test_empty_rows_makes_no_request(self):
+        bodies = []
+        client = self._client(bodies)
+        assert client.upsert_many([]) == []
+        assert bodies == []
+
+    def test_returning_false_asks_for_minimal_response(self):
+        prefers = []
+
+        def handler(request):
+            prefers.append(request.headers['Prefer'])
+            return httpx.Response(201)
+
+        client = _make_supabase_client(handler)
+        assert client.upsert_many([{'notion_page_id': 'n-1'}], returning=False) == []
+        assert prefers == ['resolution=merge-duplicates,return=minimal']
+
+    def test_parallel_chunks_keep_results_in_order(self):
+        bodies = []
+        client = self._client(bodies)
+        rows = [{'notion_page_id': f'n-{i}', 'title': str(i)} for i in range(5)]
+        assert client.upsert_many(rows, chunk=2, max_workers=3) == rows
+        assert sorted(len(b) for b in bodies) == [1, 2, 2]
+
+
+class TestSupabaseClientGetOne:
+    """Test single-row lookups via PostgREST's object media type."""
+
+    def test_get_by_notion_id_returns_object(self):
+        seen = {}
+
+        def handler(request):
+            seen['accept'] = request.headers.get('Accept')
+            seen['params'] = dict(request.url.params)
+            return httpx.Response(200, json={'id': 'sb-1', 'notion_page_id': 'notion-1'})
+
+        client = _make_supabase_client(handler)
+        record = client.get_by_notion_id('notion-1')
+        assert record == {'id': 'sb-1', 'notion_page_id': 'notion-1'}
+        assert seen['accept'] == 'application/vnd.pgrst.object+json'
+        assert seen['params']['limit'] == '1'
+        assert seen['params']['notion_page_id'] == 'eq.notion-1'
+
+    def test_get_by_id_missing_returns_none(self):
+        client = _make_supabase_client(lambda request: httpx.Response(406, json={'code': 'PGRST116'}))
+        assert client.get_by_id('missing') is None
+
+
+class TestSupabaseClientInsertMany:
+    """Test multi-row inserts."""
+
+    def test_posts_rows_as_one_array(self):
+        import json
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(201, json=bodies[-1])
+
+        client = _make_supabase_client(handler, table_name='sync_logs')
+        rows = [{'message': 'a'}, {'message': 'b'}]
+        assert client.insert_many(rows) == rows
+        assert bodies == [rows]
+
+
+class TestSupabaseClientUpdateMany:
+    """Test batched updates filtered by id."""
+
+    def test_patches_ids_in_chunks(self):
+        import json
+        requests_seen = []
+
+        def handler(request):
+            assert request.method == 'PATCH'
+            assert request.headers['Prefer'] == 'return=minimal'
+            requests_seen.append((request.url.params['id'], json.loads(request.content)))
+            return httpx.Response(204)
+
+        client = _make_supabase_client(handler)
+        client.ID_FILTER_CHUNK_SIZE = 2
+        assert client.update_many(['a', 'b', 'a', 'c'], {'deleted_at': 'now'}) == 3
+        assert requests_seen == [
+            ('in.(a,b)', {'deleted_at': 'now'}),
+            ('in.(c)', {'deleted_at': 'now'}),
+        ]
+
+
+class TestSupabaseClientSelectIn:
+    """Test lookups filtered by a list of values."""
+
+    def test_selects_values_in_chunks(self):
+        filters_seen = []
+
+        def handler(request):
+            filters_seen.append(request.url.params['notion_page_id'])
+            return httpx.Response(200, json=[{'notion_page_id': v} for v in
+                                             request.url.params['notion_page_id'][4:-1].split(',')])
+
+        client = _make_supabase_client(handler)
+        client.ID_FILTER_CHUNK_SIZE = 2
+        rows = client.select_in('notion_page_id', ['a', 'b', 'a', 'c'], columns='notion_page_id')
+        assert [r['notion_page_id'] for r in rows] == ['a', 'b', 'c']
+        assert filters_seen == ['in.(a,b)', 'in.(c)']
+        assert client.select_in('notion_page_id', []) == []
+
+
+class TestSupabaseClientHasColumn:
+    """Test column probing via an empty select."""
+
+    def test_probes_once_per_column(self):
+        from lib.sync_base import SupabaseClient
+        probes = []
+
+        def handler(request):
+            column = request.url.params['select']
+            probes.append(column)
+            assert request.url.params['limit'] == '0'
+            if column == 'details':
+                return httpx.Response(200, json=[])
+            return httpx.Response(400, json={'code': '42703'})
+
+        with patch.dict(SupabaseClient._column_cache, clear=True):
+            client = _make_supabase_client(handler, table_name='sync_logs')
+            assert client.has_column('details') is True
+            assert client.has_column('nope') is False
+            assert client.has_column('details') is True
+        assert probes == ['details', 'nope']
+
+
+# ============================================================================
+# SyncLogger Tests
+# ============================================================================
+
+
+def _make_sync_logger(has_details=False):
+    from lib.sync_base import SyncLogger
+    sync_logger = SyncLogger("TestService")
+    sync_logger.supabase = MagicMock()
+    sync_logger.supabase.has_column.return_value = has_details
+    return sync_logger
+
+
+class TestSyncLogger:
+    """Test buffering of sync_logs rows."""
+
+    def test_buffers_until_flush(self):
+        sync_logger = _make_sync_logger()
+        sync_logger.log_success('phase', 'one')
+        sync_logger.log_error('record', 'two')
+        sync_logger.supabase.insert_many.assert_not_called()
+
+        sync_logger.flush()
+        rows = sync_logger.supabase.insert_many.call_args[0][0]
+        assert [r['event_type'] for r in rows] == ['TestService_phase', 'TestService_record']
+        assert [r['status'] for r in rows] == ['success', 'error']
+
+        sync_logger.flush()
+        assert sync_logger.supabase.insert_many.call_count == 1
+
+    def test_flushes_when_buffer_full(self):
+        sync_logger = _make_sync_logger()
+        sync_logger.FLUSH_SIZE = 3
+        for i in range(3):
+            sync_logger.log_success('row', str(i))
+        assert len(sync_logger.supabase.insert_many.call_args[0][0]) == 3
+
+    def test_flushes_after_interval(self):
+        sync_logger = _make_sync_logger()
+        sync_logger._last_flush -= sync_logger.FLUSH_INTERVAL_SECONDS
+        sync_logger.log_start()
+        sync_logger.supabase.insert_many.assert_called_once()
+
+    def test_log_complete_flushes(self):
+        from lib.sync_base import SyncResult
+        sync_logger = _make_sync_logger()
+        sync_logger.log_start()
+        sync_logger.log_complete(SyncResult(success=True, direction="notion_to_supabase"))
+        rows = sync_logger.supabase.insert_many.call_args[0][0]
+        assert [r['event_type'] for r in rows] == ['TestService_start', 'TestService_complete']
+
+    def test_created_at_keeps_microseconds(self):
+        from datetime import datetime, timezone
+        sync_logger = _make_sync_logger()
+        now = datetime(2025, 1, 15, 10, 0, 0, 750001, tzinfo=timezone.utc)
+        with patch('lib.sync_base.datetime') as mock_datetime:
+            mock_datetime.now.return_value = now
+            sync_logger.log_start()
+        assert sync_logger._buffer[0]['created_at'] == '2025-01-15T10:00:00.750001+00:00'
+
+    def test_details_sent_on_every_row_when_column_exists(self):
+        sync_logger = _make_sync_logger(has_details=True)
+        sync_logger.log_start()
+        sync_logger.log_error('record', 'bad', {'id': 'n-1'})
+        sync_logger.flush()
+        rows = sync_logger.supabase.insert_many.call_args[0][0]
+        assert [r['details'] for r in rows] == [None, {'id': 'n-1'}]
+        sync_logger.supabase.has_column.assert_called_once_with('details')
+
+    def test_details_dropped_when_column_missing(self):
+        sync_logger = _make_sync_logger(has_details=False)
+        sync_logger.log_error('record', 'bad', {'id': 'n-1'})
+        sync_logger.flush()
+        assert 'details' not in sync_logger.supabase.insert_many.call_args[0][0][0]
+
+    def test_failed_flush_only_warns(self):
+        sync_logger = _make_sync_logger()
+        sync_logger.supabase.insert_many.side_effect = httpx.ConnectError("down")
+        sync_logger.log_start()
+        sync_logger.flush()
+        assert sync_logger._buffer == []
+
+
+# ============================================================================
+# OneWaySyncService Tests
+# ============================================================================
+
+
+def _make_one_way_service():
+    """Create a OneWaySyncService subclass with mocked clients."""
+    from lib.sync_base import OneWaySyncService, SyncDirection, setup_logger
+
+    class TestOneWay(OneWaySyncService):
+        def __init__(self):
+            self.service_name = "TestOneWay"
+            self.direction = SyncDirection.ONE_WAY
+            self.logger = setup_logger("TestOneWay")
+            self.sync_logger = MagicMock()
+            self.notion = MagicMock()
+            self.supabase = MagicMock()
+            self.notion_database_id = "test-db"
+
+        def convert_from_source(self, source_record):
+            return {'title': source_record['id']}
+
+    return TestOneWay()
+
+
+class TestOneWaySyncStats:
+    """Test created/updated/skipped classification in OneWaySyncService.sync."""
+
+    def test_classifies_new_existing_and_pending(self):
+        from lib.sync_base import NotionPage
+        service = _make_one_way_service()
+        service.notion.query_pages.return_value = [
+            NotionPage.from_api({'id': pid, 'last_edited_time': '2025-01-15T10:00:00Z'})
+            for pid in ('new-1', 'new-2', 'old-1', 'local-1')
+        ]
+        service.supabase.iter_all.return_value = [
+            {'id': 'sb-1', 'notion_page_id': 'old-1', 'last_sync_source': 'notion'},
+            {'id': 'sb-2', 'notion_page_id': 'local-1', 'last_sync_source': 'supabase'},
+            {'id': 'sb-3', 'notion_page_id': 'gone-1', 'last_sync_source': 'notion'},
+        ]
+
+        result = service.sync(full_sync=False)
+
+        assert result.success is True
+        assert result.stats.created == 2
+        assert result.stats.updated == 1
+        assert result.stats.skipped == 1
+        service.supabase.upsert_many.assert_called_once()
+        upserted = [row['notion_page_id'] for row in service.supabase.upsert_many.call_args.args[0]]
+        assert sorted(upserted) == ['new-1', 'new-2', 'old-1']
+        service.supabase.iter_all.assert_called_once_with(columns=service.EXISTING_COLUMNS)
+
+    def test_failed_bulk_upsert_retried_row_by_row(self):
+        from lib.sync_base import NotionPage
+        service = _make_one_way_service()
+        service.notion.query_pages.return_value = [
+            NotionPage.from_api({'id': pid}) for pid in ('new-1', 'new-2', 'old-1', 'old-2')
+        ]
+        service.supabase.iter_all.return_value = [
+            {'notion_page_id': 'old-1', 'last_sync_source': 'notion'},
+            {'notion_page_id': 'old-2', 'last_sync_source': 'notion'},
+        ]
+        service.supabase.upsert_many.side_effect = Exception("400 Bad Request")
+        bad = {'new-2', 'old-2'}
+
+        def upsert(data, conflict_column):
+            if data['notion_page_id'] in bad:
+                raise Exception("bad row")
+        service.supabase.upsert.side_effect = upsert
+
+        result = service.sync(full_sync=False)
+
+        assert result.success is False
+        assert (result.stats.created, result.stats.updated, result.stats.errors) == (1, 1, 2)
+        assert service.supabase.upsert.call_count == 4
+
+    def test_failed_conversion_not_counted_as_write(self):
+        from lib.sync_base import NotionPage
+        service = _make_one_way_service()
+        service.notion.query_pages.return_value = [
+            NotionPage.from_api({'id': pid}) for pid in ('new-1', 'bad-1')
+        ]
+        service.supabase.iter_all.return_value = []
+        convert = service.convert_from_source
+
+        def convert_from_source(record):
+            if record['id'] == 'bad-1':
+                raise ValueError("bad property")
+            return convert(record)
+        service.convert_from_source = convert_from_source
+
+        result = service.sync(full_sync=False)
+
+        assert result.success is False
+        assert (result.stats.created, result.stats.updated, result.stats.errors) == (1, 0, 1)
+
+    def test_full_sync_rebuilds_rows_with_unchanged_hash(self):
+        from lib.sync_base import NotionPage, _content_hash
+        service = _make_one_way_service()
+        service.CONTENT_HASH_COLUMN = 'content_hash'
+        service.supabase.count.return_value = 1
+        props = {'Name': {'title': [{'plain_text': 'Same'}]}}
+        service.notion.query_pages.return_value = [NotionPage.from_api({'id': 'same-1', 'properties': props})]
+        service.supabase.iter_all.return_value = [
+            {'notion_page_id': 'same-1', 'last_sync_source': 'notion', 'content_hash': _content_hash(props)},
+        ]
+
+        result = service.sync(full_sync=True)
+
+        assert (result.stats.updated, result.stats.skipped) == (1, 0)
+        rows = service.supabase.upsert_many.call_args.args[0]
+        assert rows[0]['content_hash'] == _content_hash(props)
+
+    def test_missing_hash_column_syncs_without_hashes(self):
+        from lib.sync_base import NotionPage
+        service = _make_one_way_service()
+        service.CONTENT_HASH_COLUMN = 'content_hash'
+        service.supabase.has_column.return_value = False
+        service.notion.query_pages.return_value = [NotionPage.from_api({'id': 'new-1'})]
+        service.supabase.iter_all.return_value = []
+
+        result = service.sync(full_sync=False)
+
+        assert result.success is True
+        service.supabase.iter_all.assert_called_once_with(columns=service.EXISTING_COLUMNS)
+        assert 'content_hash' not in service.supabase.upsert_many.call_args.args[0][0]
+
+    def test_safety_valve_abort_writes_log_rows(self):
+        from lib.sync_base import NotionPage
+        service = _make_one_way_service()
+        service.sync_logger = _make_sync_logger()
+        service.notion.query_pages.return_value = [NotionPage.from_api({'id': 'only-1'})]
+        service.supabase.count.return_value = 100
+
+        result = service.sync(full_sync=True)
+
+        assert result.success is False
+        rows = service.sync_logger.supabase.insert_many.call_args[0][0]
+        assert [(r['event_type'], r['status']) for r in rows] == [
+            ('TestService_start', 'info'), ('TestService_safety_valve', 'error')
+        ]
+        service.supabase.iter_all.assert_not_called()
+
+    def test_content_hash_skips_unchanged_properties(self):
+        from lib.sync_base import NotionPage, _content_hash
+        service = _make_one_way_service()
+        service.CONTENT_HASH_COLUMN = 'content_hash'
+        props = {'Name': {'title': [{'plain_text': 'Same'}]}}
+        service.notion.query_pages.return_value = [
+            NotionPage.from_api({'id': 'same-1', 'properties': props}),
+            NotionPage.from_api({'id': 'edited-1', 'properties': {'Name': {'title': []}}}),
+        ]
+        service.supabase.iter_all.return_value = [
+            {'notion_page_id': 'same-1', 'last_sync_source': 'notion', 'content_hash': _content_hash(props)},
+            {'notion_page_id': 'edited-1', 'last_sync_source': 'notion', 'content_hash': _content_hash(props)},
+        ]
+
+        result = service.sync(full_sync=False)
+
+        assert result.stats.updated == 1
+        assert result.stats.skipped == 1
+        rows = service.supabase.upsert_many.call_args.args[0]
+        assert [r['notion_page_id'] for r in rows] == ['edited-1']
+        assert rows[0]['content_hash'] == _content_hash({'Name': {'title': []}})
+        assert service.supabase.iter_all.call_args.kwargs['columns'].endswith(',content_hash')
@@ -342,6 +342,35 @@ class TestContactsContentUpdateSafety:
             # Deletes happen BEFORE or interleaved with append
             assert len(delete_calls) >= 1
 
+    def test_contacts_local_edit_detection_uses_buffer(self):
+        """Unmarked contacts sync only when updated_at is more than 5s past notion_updated_at."""
+        from sync_contacts_unified import ContactsSyncService
+
+        service = ContactsSyncService.__new__(ContactsSyncService)
+        service.logger = MagicMock()
+        service.supabase = MagicMock()
+        service.notion = MagicMock()
+        service.notion_database_id = 'test-db'
+
+        records = [
+            {'id': 'sb-edited', 'first_name': 'A', 'notion_page_id': 'notion-1',
+             'notion_updated_at': '2025-01-01T00:00:00Z', 'updated_at': '2025-01-01T01:00:00+00:00',
+             'last_sync_source': None},
+            {'id': 'sb-within', 'first_name': 'B', 'notion_page_id': 'notion-2',
+             'notion_updated_at': '2025-01-01T00:00:00Z', 'updated_at': '2025-01-01T00:00:04.999',
+             'last_sync_source': None},
+            {'id': 'sb-badts', 'first_name': 'C', 'notion_page_id': 'notion-3',
+             'notion_updated_at': 'not a date', 'updated_at': '2025-01-01T00:00:00Z',
+             'last_sync_source': None},
+        ]
+        service.supabase.select_all.return_value = records
+        service.notion.query_database.return_value = []
+        service.convert_to_source = MagicMock(return_value={})
+
+        service._sync_supabase_to_notion(full_sync=True, since_hours=24)
+
+        assert [c[0][0] for c in service.notion.update_page.call_args_list] == ['notion-1']
+
 
 # ============================================================================
 # ISSUE 4: Meetings dedup by title only - no date check
@@ -742,6 +771,7 @@ class TestSafetyValveConsistency:
                  'last_sync_source': 'notion'}
                 for i in range(50)
             ]
+            service.supabase.count.return_value = 50
 
             # Full sync - should abort
             result = service._sync_notion_to_supabase(full_sync=True, since_hours=24)
@@ -796,6 +826,7 @@ class TestSafetyValveConsistency:
             ]
             service.supabase.select_updated_since.return_value = service.supabase.select_all.return_value
             service.notion.query_database.return_value = []  # Empty Notion DB
+            service.notion.count_pages.return_value = 0
             service.notion.create_page.return_value = {
                 'id': 'new-page', 'last_edited_time': '2025-02-01T00:01:00Z'
             }
@@ -922,6 +953,7 @@ class TestPingPongPrevention:
         service.supabase.select_all.return_value = [edited_record]
         service.supabase.select_updated_since.return_value = [edited_record]
         service.notion.query_database.return_value = []
+        service.notion.count_pages.return_value = 0
         service.notion.update_page.return_value = {
             'id': 'notion-1',
             'last_edited_time': datetime.now(timezone.utc).isoformat()
@@ -787,7 +787,7 @@ class TestMeetingsDeletionSync:
         service.notion_database_id = 'test-db'
 
         # Supabase has a linked meeting
-        service.supabase.select_all.return_value = [
+        service.supabase.iter_all.return_value = [
             {
                 'id': 'meeting-1',
                 'notion_page_id': 'notion-1',
@@ -802,6 +802,7 @@ class TestMeetingsDeletionSync:
         deleted_count = service._sync_notion_deletions()
 
         assert deleted_count == 1
+        service.supabase.iter_all.assert_called_once_with(columns='id,notion_page_id,deleted_at,title')
         service.supabase.soft_delete.assert_called_once_with('meeting-1')
         # Should also clear notion_page_id to prevent re-archiving attempts
         service.supabase.update.assert_called_once_with('meeting-1', {
@@ -820,7 +821,7 @@ class TestMeetingsDeletionSync:
         service.notion_database_id = 'test-db'
 
         # Record is already soft-deleted
-        service.supabase.select_all.return_value = [
+        service.supabase.iter_all.return_value = [
             {
                 'id': 'meeting-1',
                 'notion_page_id': 'notion-1',
@@ -847,7 +848,7 @@ class TestMeetingsDeletionSync:
         service.notion = MagicMock()
         service.notion_database_id = 'test-db'
 
-        service.supabase.select_all.return_value = [
+        service.supabase.iter_all.return_value = [
             {
                 'id': 'meeting-1',
                 'notion_page_id': 'notion-1',
@@ -0,0 +1,443 @@
+"""
+Tests for the Google Contacts <-> Supabase sync in lib/sync_service.py
+
+All tests are fully mocked -- NO real API calls.
+
+Tests cover:
+- Per-contact planning (create / update / delete decisions)
+- Sequential Google writes, concurrent Supabase-only writes
+- Group creation before the writes
+"""
+
+import asyncio
+import threading
+from contextlib import ExitStack
+from unittest.mock import patch, MagicMock, AsyncMock
+
+
+def google_contact(resource_name, updated='2025-01-10T00:00:00Z', email=None, my_contacts=True):
+    """A People API contact as returned by get_all_contacts."""
+    return {
+        'resourceName': resource_name,
+        # Distinct per content, like a real etag
+        'etag': f'etag-{resource_name}-{updated}-{email}-{my_contacts}',
+        'metadata': {'sources': [{'type': 'CONTACT', 'updateTime': updated}]},
+        'names': [{'givenName': 'Ann', 'familyName': 'Lee'}],
+        'emailAddresses': [{'value': email}] if email else [],
+        'memberships': [
+            {'contactGroupMembership': {'contactGroupResourceName': 'contactGroups/myContacts'}}
+        ] if my_contacts else [],
+    }
+
+
+def sb_contact(contact_id, resource_name=None, **fields):
+    """A Supabase contacts row in sync with google_contact()."""
+    row = {
+        'id': contact_id,
+        'google_resource_name': resource_name,
+        'first_name': 'Ann',
+        'last_name': 'Lee',
+        'updated_at': '2025-01-10T00:00:00Z',
+        'google_updated_at': '2025-01-10T00:00:00Z',
+        'deleted_at': None,
+        'subscribed': False,
+        'last_etag': None,
+    }
+    row.update(fields)
+    return row
+
+
+def make_supabase(rows):
+    """Mock supabase client whose contacts table holds rows."""
+    supabase = MagicMock()
+    table = supabase.table.return_value
+    table.select.return_value.limit.return_value.execute.return_value.count = len(rows)
+
+    def page(start, end):
+        response = MagicMock()
+        response.execute.return_value.data = rows[start:end + 1]
+        return response
+    table.select.return_value.order.return_value.range.side_effect = page
+    return supabase
+
+
+def run_sync(rows, google_contacts, groups=None, supabase=None, **google_mocks):
+    """Run sync_contacts against mocked Google and Supabase clients."""
+    from lib import sync_service
+
+    supabase = supabase or make_supabase(rows)
+    mocks = {
+        'get_access_token': AsyncMock(return_value='token'),
+        'get_contact_groups': AsyncMock(return_value=dict(groups or {'contactGroups/sub': 'Subscribed'})),
+        'get_all_contacts': AsyncMock(return_value=google_contacts),
+        'create_contact': AsyncMock(return_value={'resourceName': 'people/new'}),
+        'update_contact': AsyncMock(return_value={}),
+        'delete_contact': AsyncMock(return_value=None),
+        'create_contact_group': AsyncMock(return_value={'resourceName': 'contactGroups/created'}),
+        'log_sync_event': AsyncMock(),
+    }
+    mocks.update(google_mocks)
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(sync_service, 'supabase', supabase))
+        for name, mock in mocks.items():
+            stack.enter_context(patch.object(sync_service, name, mock))
+        result = asyncio.run(sync_service.sync_contacts())
+    return result, supabase, mocks
+
+
+class TestPlanContact:
+    """Test the per-contact decision, which does no I/O."""
+
+    def _plan(self, row, google_map, google_count=50, supabase_count=50, processed=None):
+        from lib.sync_service import plan_contact
+        return plan_contact(row, google_map, set() if processed is None else processed, {}, google_count, supabase_count)
+
+    def test_new_supabase_contact_is_created_in_google(self):
+        assert self._plan(sb_contact('sb-1'), {}).action == 'create_google'
+
+    def test_soft_deleted_contact_is_deleted_from_google_and_claimed(self):
+        google_map = {'people/1': google_contact('people/1')}
+        processed = set()
+        op = self._plan(sb_contact('sb-1', 'people/1', deleted_at='2025-01-11T00:00:00Z'), google_map, processed=processed)
+        assert op.action == 'delete_google'
+        assert processed == {'people/1'}
+        assert 'people/1' in google_map
+
+    def test_unchanged_contact_needs_nothing(self):
+        google_map = {'people/1': google_contact('people/1')}
+        processed = set()
+        assert self._plan(sb_contact('sb-1', 'people/1'), google_map, processed=processed) is None
+        assert processed == {'people/1'}
+
+    def test_already_claimed_contact_treated_as_missing(self):
+        google_map = {'people/1': google_contact('people/1')}
+        op = self._plan(sb_contact('sb-2', 'people/1'), google_map, processed={'people/1'})
+        assert op.action == 'delete_supabase'
+
+    def test_newer_google_contact_updates_supabase(self):
+        google_map = {'people/1': google_contact('people/1', updated='2025-01-12T00:00:00Z', email='ann@x.io')}
+        op = self._plan(sb_contact('sb-1', 'people/1'), google_map)
+        assert op.action == 'update_supabase'
+        assert op.data['email'] == 'ann@x.io'
+        assert not any(k.startswith('_') for k in op.data)
+
+    def test_public_fields_match_transform_output(self):
+        from lib.google_contacts import transform_contact
+        from lib.sync_service import PUBLIC_FIELDS
+        keys = transform_contact(google_contact('people/1'), {}).keys()
+        assert set(PUBLIC_FIELDS) == {k for k in keys if not k.startswith('_')}
+
+    def test_changed_supabase_contact_updates_google(self):
+        google_map = {'people/1': google_contact('people/1')}
+        op = self._plan(sb_contact('sb-1', 'people/1', updated_at='2025-01-12T00:00:00Z', company='Acme'), google_map)
+        assert op.action == 'update_google'
+
+    def test_unchanged_etag_skips_comparison(self):
+        from lib import sync_service
+        gc = google_contact('people/1', updated='2025-01-12T00:00:00Z', email='new@x.io')
+        row = sb_contact('sb-1', 'people/1', last_etag=gc['etag'], last_sync_source='google')
+        with patch.object(sync_service, 'transform_contact_cached') as transform:
+            assert self._plan(row, {'people/1': gc}) is None
+        transform.assert_not_called()
+
+    def test_unchanged_etag_still_pushes_supabase_edits(self):
+        gc = google_contact('people/1')
+        row = sb_contact('sb-1', 'people/1', last_etag=gc['etag'], last_sync_source='google',
+                         updated_at='2025-01-12T00:00:00Z', company='Acme')
+        assert self._plan(row, {'people/1': gc}).action == 'update_google'
+
+    def test_pull_from_google_records_etag(self):
+        gc = google_contact('people/1', updated='2025-01-12T00:00:00Z', email='ann@x.io')
+        op = self._plan(sb_contact('sb-1', 'people/1'), {'people/1': gc})
+        assert op.data['last_etag'] == gc['etag']
+
+    def test_content_key_treats_blank_values_as_equal(self):
+        from lib.sync_service import content_key
+        assert content_key({'email': '', 'subscribed': None}) == content_key({'email': None, 'subscribed': False})
+        assert content_key({'email': 'a@x.io'}) != content_key({'email': 'b@x.io'})
+        assert content_key({'subscribed': True}) != content_key({'subscribed': False})
+
+    def test_parse_epoch_us_normalizes_zones(self):
+        from lib.sync_service import parse_epoch_us
+        utc = parse_epoch_us('2025-01-10T00:00:00.000001Z')
+        assert utc == 1736467200000001
+        assert parse_epoch_us('2025-01-10T02:00:00.000001+02:00') == utc
+        assert parse_epoch_us('2025-01-10T00:00:00.000001') == utc
+        assert parse_epoch_us(None) is None
+
+    def test_changes_inside_buffer_are_ignored(self):
+        google_map = {'people/1': google_contact('people/1', updated='2025-01-10T00:00:04Z')}
+        assert self._plan(sb_contact('sb-1', 'people/1'), google_map) is None
+
+    def test_google_wins_only_on_changes_past_the_watermark(self):
+        from lib.sync_service import google_wins, CONFLICT_BUFFER_US as B
+        assert not google_wins(sb_ts=0, google_ts=B, synced_ts=0)
+        assert google_wins(sb_ts=0, google_ts=B + 1, synced_ts=0)
+        # Both changed since the watermark: newer write wins
+        assert google_wins(sb_ts=2 * B, google_ts=3 * B, synced_ts=0)
+        assert not google_wins(sb_ts=3 * B, google_ts=2 * B, synced_ts=0)
+        # No watermark: Google must be newer by more than the buffer
+        assert not google_wins(sb_ts=0, google_ts=B, synced_ts=None)
+        assert google_wins(sb_ts=0, google_ts=B + 1, synced_ts=None)
+        assert not google_wins(sb_ts=0, google_ts=None, synced_ts=None)
+
+    def test_missing_in_google_only_deleted_when_google_looks_complete(self):
+        row = sb_contact('sb-1', 'people/gone')
+        assert self._plan(row, {}).action == 'delete_supabase'
+        assert self._plan(row, {}, google_count=3, supabase_count=50).action == 'delete_skipped'
+
+
+class TestSyncContacts:
+    """Test sync_contacts end to end against mocks."""
+
+    def test_google_writes_run_one_at_a_time(self):
+        """The People API wants mutations for one user sent sequentially."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_update(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        rows = [
+            sb_contact(f'sb-{i}', f'people/{i}', updated_at='2025-01-12T00:00:00Z', company=f'Co {i}')
+            for i in range(20)
+        ]
+        google_contacts = [google_contact(f'people/{i}') for i in range(20)]
+
+        result, supabase, mocks = run_sync(rows, google_contacts, update_contact=AsyncMock(side_effect=slow_update))
+
+        assert result == {'synced': 20, 'errors': 0}
+        assert mocks['update_contact'].await_count == 20
+        assert peak == 1
+
+    def test_supabase_only_writes_run_concurrently(self):
+        """Pulls from Google only write Supabase, so they do not wait on each other."""
+        rows = [sb_contact(f'sb-{i}', f'people/{i}') for i in range(3)]
+        google_contacts = [
+            google_contact(f'people/{i}', updated='2025-01-12T00:00:00Z', email=f'p{i}@x.io') for i in range(3)
+        ]
+        supabase = make_supabase(rows)
+        # Each update waits until every update has been started
+        barrier = threading.Barrier(3, timeout=5)
+        supabase.table.return_value.update.return_value.eq.return_value.execute.side_effect = lambda: barrier.wait()
+
+        result, _, _ = run_sync(rows, google_contacts, supabase=supabase)
+
+        assert result == {'synced': 3, 'errors': 0}
+
+    def test_google_and_supabase_fetched_concurrently(self):
+        """The Google fetch should not wait for the Supabase read to finish."""
+        from lib import sync_service
+        rows = [sb_contact('sb-1', 'people/1')]
+        supabase_started = asyncio.Event()
+        real_fetch = sync_service.fetch_all_contacts
+
+        async def fetch_supabase():
+            supabase_started.set()
+            await asyncio.sleep(0.01)
+            return await real_fetch()
+
+        async def fetch_google(token):
+            await asyncio.wait_for(supabase_started.wait(), timeout=1)
+            return [google_contact('people/1')]
+
+        with patch.object(sync_service, 'fetch_all_contacts', fetch_supabase):
+            result, _, _ = run_sync(rows, [], get_all_contacts=AsyncMock(side_effect=fetch_google))
+
+        assert result == {'synced': 0, 'errors': 0}
+
+    def test_supabase_write_backs_batched_by_payload(self):
+        """Google pushes are stamped, and missing contacts soft-deleted, in one request each."""
+        rows = [
+            sb_contact(f'sb-{i}', f'people/{i}', updated_at='2025-01-12T00:00:00Z', company=f'Co {i}')
+            for i in range(12)
+        ] + [sb_contact('sb-gone-1', 'people/gone-1'), sb_contact('sb-gone-2', 'people/gone-2')]
+        google_contacts = [google_contact(f'people/{i}') for i in range(12)]
+
+        result, supabase, mocks = run_sync(rows, google_contacts)
+
+        assert result == {'synced': 14, 'errors': 0}
+        update = supabase.table.return_value.update
+        payloads = [c[0][0] for c in update.call_args_list]
+        assert [sorted(p) for p in payloads] == [['google_updated_at'], ['deleted_at', 'last_sync_source']]
+        in_calls = [c[0] for c in update.return_value.in_.call_args_list]
+        assert in_calls == [
+            ('id', [f'sb-{i}' for i in range(12)]),
+            ('id', ['sb-gone-1', 'sb-gone-2']),
+        ]
+
+    def test_soft_deleted_contact_deleted_from_google_not_reingested(self):
+        rows = [sb_contact('sb-1', 'people/1', deleted_at='2025-01-11T00:00:00Z')]
+
+        result, supabase, mocks = run_sync(rows, [google_contact('people/1')])
+
+        assert result == {'synced': 1, 'errors': 0}
+        mocks['delete_contact'].assert_awaited_once_with('token', 'people/1')
+        supabase.table.return_value.upsert.assert_not_called()
+        supabase.table.return_value.select.return_value.eq.assert_not_called()
+
+    def test_google_deletes_run_one_at_a_time(self):
+        """Deletes of soft-deleted contacts go through the same sequential write pass."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_delete(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        rows = [sb_contact(f'sb-{i}', f'people/{i}', deleted_at='2025-01-11T00:00:00Z') for i in range(20)]
+        google_contacts = [google_contact(f'people/{i}') for i in range(20)]
+
+        result, _, mocks = run_sync(rows, google_contacts, delete_contact=AsyncMock(side_effect=slow_delete))
+
+        assert result == {'synced': 20, 'errors': 0}
+        assert mocks['delete_contact'].await_count == 20
+        assert peak == 1
+
+    def test_failed_write_counts_one_error(self):
+        rows = [sb_contact('sb-1'), sb_contact('sb-2')]
+        create = AsyncMock(side_effect=[ValueError('bad request'), {'resourceName': 'people/new'}])
+
+        result, supabase, mocks = run_sync(rows, [google_contact('people/x')], create_contact=create)
+
+        # One create, plus ingesting the Google-only contact
+        assert result == {'synced': 2, 'errors': 1}
+
+    def test_new_location_group_created_once(self):
+        """Contacts sharing a new location should not each create its group."""
+        rows = [sb_contact('sb-1', location='Germany'), sb_contact('sb-2', location='Germany')]
+
+        result, supabase, mocks = run_sync(rows, [google_contact('people/x')])
+
+        assert result['synced'] == 3  # two creates, one ingest
+        # "Subscribed" already exists, so only "Germany" is created
+        mocks['create_contact_group'].assert_awaited_once_with('token', 'Germany')
+        # and the new group's resource name is what memberships point at
+        name_to_id_map = mocks['create_contact'].call_args[0][2]
+        assert name_to_id_map['Germany'] == 'contactGroups/created'
+        # and both directions of the group mapping know about it
+        assert mocks['get_contact_groups'].return_value['contactGroups/created'] == 'Germany'
+
+    def test_existing_groups_not_recreated(self):
+        rows = [sb_contact('sb-1', location='Germany')]
+        groups = {'contactGroups/sub': 'Subscribed', 'contactGroups/de': 'Germany'}
+
+        run_result, supabase, mocks = run_sync(rows, [google_contact('people/x')], groups=groups)
+
+        mocks['create_contact_group'].assert_not_awaited()
+
+    def test_google_only_contacts_ingested_in_one_upsert(self):
+        google_contacts = [google_contact(f'people/{i}', email=f'p{i}@x.io') for i in range(3)]
+
+        result, supabase, mocks = run_sync([], google_contacts)
+
+        assert result == {'synced': 3, 'errors': 0}
+        upsert = supabase.table.return_value.upsert
+        upsert.assert_called_once()
+        rows = upsert.call_args[0][0]
+        assert sorted(r['google_resource_name'] for r in rows) == ['people/0', 'people/1', 'people/2']
+        assert all(r['last_sync_source'] == 'google' for r in rows)
+        assert upsert.call_args[1] == {'on_conflict': 'google_resource_name'}
+
+    def test_ingest_chunks_sent_concurrently(self):
+        from lib import sync_service
+        google_contacts = [google_contact(f'people/{i}') for i in range(5)]
+        supabase = make_supabase([])
+        # Each chunk waits until every chunk has been started
+        barrier = threading.Barrier(3, timeout=5)
+        supabase.table.return_value.upsert.return_value.execute.side_effect = lambda: barrier.wait()
+
+        with patch.object(sync_service, 'INGEST_CHUNK_SIZE', 2):
+            result, _, _ = run_sync([], google_contacts, supabase=supabase)
+
+        assert result == {'synced': 5, 'errors': 0}
+        assert [len(c.args[0]) for c in supabase.table.return_value.upsert.call_args_list] == [2, 2, 1]
+
+    def test_missing_etag_column_left_out_of_every_write(self):
+        """Until migration 040 adds last_etag, no Supabase write may include it."""
+        rows = [
+            sb_contact('sb-new'),
+            sb_contact('sb-1', 'people/1'),
+        ]
+        for row in rows:
+            del row['last_etag']
+        google_contacts = [
+            google_contact('people/1', updated='2025-01-12T00:00:00Z', email='ann@x.io'),
+            google_contact('people/2'),
+        ]
+
+        result, supabase, mocks = run_sync(rows, google_contacts)
+
+        assert result == {'synced': 3, 'errors': 0}
+        table = supabase.table.return_value
+        payloads = [c.args[0] for c in table.update.call_args_list] + table.upsert.call_args.args[0]
+        assert len(payloads) == 3
+        assert not any('last_etag' in p for p in payloads)
+
+    def test_rejected_ingest_chunk_retried_row_by_row(self):
+        google_contacts = [google_contact(f'people/{i}') for i in range(3)]
+        supabase = make_supabase([])
+        upsert_results = [Exception('400 bad chunk'), MagicMock(), Exception('bad row'), MagicMock()]
+        supabase.table.return_value.upsert.return_value.execute.side_effect = upsert_results
+
+        result, _, mocks = run_sync([], google_contacts, supabase=supabase)
+
+        assert result == {'synced': 2, 'errors': 1}
+
+
+class TestFetchAllContacts:
+    """Test the paginated Supabase read."""
+
+    def test_requests_counted_pages_at_once_and_reads_past_the_count(self):
+        from lib import sync_service
+        rows = [{'id': i} for i in range(7)]
+        supabase = make_supabase(rows)
+        # Two rows were added after the count was taken
+        supabase.table.return_value.select.return_value.limit.return_value.execute.return_value.count = 5
+
+        with patch.object(sync_service, 'supabase', supabase), \
+                patch.object(sync_service, 'SUPABASE_PAGE_SIZE', 2):
+            contacts = asyncio.run(sync_service.fetch_all_contacts())
+
+        assert contacts == rows
+        ranges = [c[0] for c in supabase.table.return_value.select.return_value.order.return_value.range.call_args_list]
+        assert ranges == [(0, 1), (2, 3), (4, 5), (6, 7)]
+
+
+class TestTransformContactCached:
+    """Test reuse of transform_contact results across syncs."""
+
+    def test_reuses_result_until_etag_or_groups_change(self):
+        from lib import sync_service
+        contact = google_contact('people/1', email='ann@x.io')
+        groups = {'contactGroups/sub': 'Subscribed'}
+
+        with patch.dict(sync_service._transform_cache, clear=True), \
+                patch.object(sync_service, 'transform_contact', wraps=sync_service.transform_contact) as transform:
+            first = sync_service.transform_contact_cached(contact, groups)
+            assert sync_service.transform_contact_cached(dict(contact), dict(groups)) is first
+            assert transform.call_count == 1
+
+            sync_service.transform_contact_cached(dict(contact, etag='etag-2'), groups)
+            sync_service.transform_contact_cached(contact, {'contactGroups/sub': 'Renamed'})
+            assert transform.call_count == 3
+
+    def test_group_key_built_once_per_mapping(self):
+        """A sync snapshots the groups once for planning and again only after creating groups."""
+        from lib import sync_service
+        rows = [sb_contact(f'sb-{i}', f'people/{i}') for i in range(5)] + [sb_contact('sb-new', location='Germany')]
+        google_contacts = [google_contact(f'people/{i}') for i in range(8)]
+
+        with patch.object(sync_service, 'groups_key', wraps=sync_service.groups_key) as key:
+            result, _, _ = run_sync(rows, google_contacts)
+
+        assert result['errors'] == 0
+        assert key.call_count == 2
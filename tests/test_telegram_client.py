@@ -0,0 +1,65 @@
+"""
+Tests for lib/telegram_client.py
+
+All tests are fully mocked -- NO real API calls.
+
+Tests cover:
+- Shared HTTP client reused within an event loop, separate per loop
+- Messages sent through the shared client
+- run_blocking closes its loop's client
+"""
+
+import asyncio
+from unittest.mock import patch, AsyncMock, MagicMock
+
+
+class TestSharedClient:
+    """Test the per-event-loop shared httpx client."""
+
+    def test_client_reused_within_a_loop(self):
+        from lib.telegram_client import _get_client, close_client
+
+        async def run():
+            first, second = _get_client(), _get_client()
+            await close_client()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first is second
+        assert first.is_closed
+
+    def test_each_loop_gets_its_own_client(self):
+        from lib.telegram_client import _get_client, close_client
+
+        async def run():
+            client = _get_client()
+            await close_client()
+            return client
+
+        assert asyncio.run(run()) is not asyncio.run(run())
+
+    def test_messages_sent_through_shared_client(self):
+        from lib import telegram_client
+        client = MagicMock()
+        client.post = AsyncMock(return_value=MagicMock())
+
+        async def run():
+            with patch.object(telegram_client, '_get_client', return_value=client):
+                await telegram_client.send_telegram_message('one')
+                await telegram_client.send_telegram_message('two')
+
+        with patch.multiple(telegram_client, NOTIFICATIONS_ENABLED=True, TELEGRAM_CHAT_ID='42',
+                            TELEGRAM_BOT_SERVICE_URL=None, TELEGRAM_BOT_TOKEN='bot-token'):
+            asyncio.run(run())
+
+        assert [c.kwargs['json']['text'] for c in client.post.call_args_list] == ['one', 'two']
+
+    def test_run_blocking_closes_its_loops_client(self):
+        from lib.telegram_client import _clients, _get_client, run_blocking
+
+        async def send():
+            return _get_client()
+
+        client = run_blocking(send())
+        assert client.is_closed
+        assert client not in _clients.values()
@@ -39,6 +39,25 @@ def make_test_sync_service():
             self.sync_logger = MagicMock()
             self.notion = MagicMock()
             self.supabase = MagicMock()
+            # count(), select_linked_active() and select_in() mirror select_all() so
+            # safety-valve prechecks, deletion checks and lookups see the same table
+            self.supabase.count.side_effect = lambda filters=None: len(
+                [r for r in self.supabase.select_all.return_value if r.get('notion_page_id')]
+            )
+            self.supabase.select_linked_active.side_effect = lambda columns=None, filters=None: [
+                r for r in self.supabase.select_all.return_value
+                if r.get('notion_page_id') and not r.get('deleted_at')
+            ]
+            self.supabase.select_in.side_effect = lambda column, values, columns=None: [
+                r for r in self.supabase.select_all.return_value if r.get(column) in values
+            ]
+            # count_pages() and iter_page_ids() likewise mirror query_database()
+            self.notion.count_pages.side_effect = lambda database_id, filter=None, limit=None: len(
+                self.notion.query_database.return_value[:limit]
+            )
+            self.notion.iter_page_ids.side_effect = lambda database_id, filter=None: iter(
+                [p['id'] for p in self.notion.query_database.return_value]
+            )
             self.notion_database_id = "test-db-id"
 
         def convert_from_source(self, notion_record):
@@ -88,7 +107,10 @@ class TestNotionToSupabase:
         assert result.success is True
         assert result.stats.created == 1
         assert result.stats.updated == 0
-        service.supabase.upsert.assert_called_once()
+        service.supabase.upsert_many.assert_called_once()
+        rows = service.supabase.upsert_many.call_args[0][0]
+        assert [r['notion_page_id'] for r in rows] == ['notion-1']
+        service.supabase.upsert.assert_not_called()
 
     def test_updates_existing_records(self):
         """Existing records should be updated when Notion is newer."""
@@ -187,6 +209,118 @@ class TestNotionToSupabase:
 
         assert result.stats.skipped == 1
         service.supabase.upsert.assert_not_called()
+        service.supabase.upsert_many.assert_not_called()
+
+    def test_timestamp_buffer_and_unknown_timestamps(self):
+        """Pre-parsed timestamps keep the 5s buffer and treat missing values as unchanged."""
+        service = make_test_sync_service()
+
+        def page(pid, edited):
+            return {'id': pid, 'last_edited_time': edited,
+                    'properties': {'Name': {'title': [{'plain_text': pid}]}}}
+
+        service.notion.query_database.return_value = [
+            page('within-buffer', '2025-01-15T10:00:04Z'),
+            page('no-dest-ts', '2025-01-15T10:00:00Z'),
+            page('newer', '2025-01-15T10:00:06Z'),
+        ]
+        service.supabase.select_all.return_value = [
+            {'notion_page_id': 'within-buffer', 'notion_updated_at': '2025-01-15T10:00:00+00:00',
+             'last_sync_source': 'notion'},
+            {'notion_page_id': 'no-dest-ts', 'notion_updated_at': None, 'last_sync_source': 'notion'},
+            {'notion_page_id': 'newer', 'notion_updated_at': '2025-01-15T10:00:00Z',
+             'last_sync_source': 'notion'},
+        ]
+
+        with patch.object(service, 'compare_timestamps', side_effect=AssertionError):
+            result = service._sync_notion_to_supabase(full_sync=True, since_hours=24)
+
+        assert result.stats.skipped == 2
+        assert result.stats.updated == 1
+        rows = service.supabase.upsert_many.call_args[0][0]
+        assert [r['notion_page_id'] for r in rows] == ['newer']
+
+    def test_incremental_looks_up_changed_pages_only(self):
+        """Incremental syncs should fetch only the rows linked to changed pages, keeping pending local edits."""
+        from lib.sync_base import SyncMetrics
+        service = make_test_sync_service()
+
+        service.notion.query_database.return_value = [
+            {
+                'id': 'notion-1',
+                'last_edited_time': '2025-01-15T10:00:00Z',
+                'properties': {'Name': {'title': [{'plain_text': 'Record'}]}}
+            }
+        ]
+        # Old row with local edits still pending, plus an unrelated row
+        service.supabase.select_all.return_value = [
+            {
+                'notion_page_id': 'notion-1',
+                'notion_updated_at': '2024-01-01T00:00:00Z',
+                'last_sync_source': 'supabase',
+            },
+            {'notion_page_id': 'notion-2', 'notion_updated_at': None, 'last_sync_source': 'notion'},
+        ]
+        metrics = SyncMetrics()
+
+        result = service._sync_notion_to_supabase(full_sync=False, since_hours=24, metrics=metrics)
+
+        service.supabase.select_all.assert_not_called()
+        service.supabase.select_in.assert_called_once_with(
+            'notion_page_id', ['notion-1'], columns='notion_page_id,notion_updated_at,last_sync_source'
+        )
+        # The table size still comes from a count, not the looked-up rows
+        assert metrics.destination_total == 2
+        assert metrics.supabase_api_calls == 2
+        assert result.stats.skipped == 1
+        service.supabase.upsert.assert_not_called()
+        service.supabase.upsert_many.assert_not_called()
+
+    def test_api_calls_count_each_key_set_request(self):
+        """upsert_many posts one request per key-set group, and each is counted."""
+        from lib.sync_base import SyncMetrics
+        service = make_test_sync_service()
+        metrics = SyncMetrics()
+        rows = [
+            {'notion_page_id': 'a', 'title': 'A'},
+            {'notion_page_id': 'b', 'title': 'B'},
+            {'notion_page_id': 'c', 'title': 'C', 'due': None},
+        ]
+
+        assert service._upsert_notion_rows(rows, metrics) == []
+
+        service.supabase.upsert_many.assert_called_once()
+        assert metrics.supabase_api_calls == 2
+
+    def test_failed_bulk_upsert_retries_rows_individually(self):
+        """A rejected bulk chunk should fall back to per-record upserts and count only real failures."""
+        from lib.sync_base import SyncMetrics
+        service = make_test_sync_service()
+
+        service.notion.query_database.return_value = [
+            {
+                'id': f'notion-{i}',
+                'last_edited_time': '2025-01-15T10:00:00Z',
+                'properties': {'Name': {'title': [{'plain_text': f'Record {i}'}]}}
+            }
+            for i in range(3)
+        ]
+        service.supabase.select_all.return_value = []
+        service.supabase.upsert_many.side_effect = Exception("400 Bad Request")
+        service.supabase.upsert.side_effect = [{}, Exception("bad row"), {}]
+        metrics = SyncMetrics()
+
+        result = service._sync_notion_to_supabase(full_sync=True, since_hours=24, metrics=metrics)
+
+        assert result.success is True
+        # The row that could not be written is an error, not a create
+        assert result.stats.created == 2
+        assert result.stats.errors == 1
+        assert service.supabase.upsert.call_count == 3
+        # One timestamp for the whole batch
+        assert len({c[0][0]['updated_at'] for c in service.supabase.upsert.call_args_list}) == 1
+        # count + select_all + two successful individual upserts
+        assert metrics.supabase_api_calls == 4
 
 
 # ============================================================================
@@ -257,6 +391,49 @@ class TestSupabaseToNotion:
         assert result.success is True
         assert result.stats.updated == 1
         service.notion.update_page.assert_called_once()
+        ids, stamp = service.supabase.update_many.call_args[0]
+        assert ids == ['sb-1']
+        assert stamp['last_sync_source'] == 'notion'
+        service.supabase.update.assert_not_called()
+
+    def test_notion_writes_run_concurrently(self):
+        """Page updates should be in flight together, with failures counted per record."""
+        import threading
+        service = make_test_sync_service()
+
+        supabase_records = [
+            {'id': f'sb-{i}', 'title': f'Record {i}', 'notion_page_id': f'notion-{i}',
+             'deleted_at': None, 'last_sync_source': 'supabase'}
+            for i in range(3)
+        ]
+        service.supabase.select_all.return_value = supabase_records
+        service.notion.query_database.return_value = []
+        # Only passes if all three writes are waiting at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        def update_page(page_id, props):
+            barrier.wait()
+            if page_id == 'notion-1':
+                raise Exception("409 Conflict")
+            return {'id': page_id}
+
+        service.notion.update_page.side_effect = update_page
+
+        result = service._sync_supabase_to_notion(full_sync=True, since_hours=24)
+
+        assert result.stats.updated == 2
+        assert result.stats.errors == 1
+        assert service.supabase.update_many.call_args[0][0] == ['sb-0', 'sb-2']
+
+    def test_stamp_back_falls_back_to_individual_updates(self):
+        """A rejected batch stamp-back should retry each record and count failures."""
+        service = make_test_sync_service()
+        service.supabase.update_many.side_effect = Exception("502 Bad Gateway")
+        service.supabase.update.side_effect = [{}, Exception("bad row")]
+
+        assert service._stamp_back_synced(['sb-1', 'sb-2']) == 1
+        assert [c[0][0] for c in service.supabase.update.call_args_list] == ['sb-1', 'sb-2']
+        assert service._stamp_back_synced([]) == 0
 
     def test_skips_soft_deleted_records(self):
         """Soft-deleted records should not be synced to Notion."""
@@ -315,7 +492,37 @@ class TestDeletionSync:
         deleted_count = service._sync_notion_deletions()
 
         assert deleted_count == 1
-        service.supabase.soft_delete.assert_called_once_with('sb-1')
+        service.supabase.update_many.assert_called_once()
+        ids, data = service.supabase.update_many.call_args[0]
+        assert ids == ['sb-1']
+        assert data['deleted_at']
+        assert data['notion_page_id'] is None
+        assert data['notion_updated_at'] is None
+        service.supabase.soft_delete.assert_not_called()
+
+    def test_record_name_for_logs(self):
+        """Deletion logs name records by title, name or full name, falling back to the ID."""
+        from lib.sync_base import _record_name
+        assert _record_name({'title': 'Standup', 'name': 'x'}) == 'Standup'
+        assert _record_name({'name': 'Acme'}) == 'Acme'
+        assert _record_name({'first_name': 'Ada', 'last_name': None}) == 'Ada'
+        assert _record_name({'id': 'sb-1', 'first_name': None}) == 'sb-1'
+
+    def test_notion_deletion_falls_back_to_individual_updates(self):
+        """A failed batch soft-delete should retry each orphan and count only successes."""
+        service = make_test_sync_service()
+
+        service.supabase.select_all.return_value = [
+            {'id': 'sb-1', 'notion_page_id': 'notion-1', 'title': 'One'},
+            {'id': 'sb-2', 'notion_page_id': 'notion-2', 'title': 'Two'},
+            {'id': 'sb-3', 'notion_page_id': 'notion-3', 'title': 'Kept'},
+        ]
+        service.notion.query_database.return_value = [{'id': 'notion-3'}]
+        service.supabase.update_many.side_effect = Exception("timeout")
+        service.supabase.update.side_effect = [{}, Exception("bad row")]
+
+        assert service._sync_notion_deletions() == 1
+        assert [c[0][0] for c in service.supabase.update.call_args_list] == ['sb-1', 'sb-2']
 
     def test_supabase_deletion_archives_notion_page(self):
         """When a Supabase record is soft-deleted, the Notion page should be archived."""
@@ -337,7 +544,8 @@ class TestDeletionSync:
 
         assert archived_count == 1
         service.notion.archive_page.assert_called_once_with('notion-1')
-        service.supabase.clear_notion_page_id.assert_called_once_with('sb-1')
+        service.supabase.clear_notion_page_ids.assert_called_once_with(['sb-1'])
+        service.supabase.clear_notion_page_id.assert_not_called()
 
     def test_supabase_deletion_handles_already_archived(self):
         """Should handle gracefully when Notion page is already archived."""
@@ -360,7 +568,31 @@ class TestDeletionSync:
 
         # Should still count as archived since end state is same
         assert archived_count == 1
-        service.supabase.clear_notion_page_id.assert_called_once()
+        service.supabase.clear_notion_page_ids.assert_called_once_with(['sb-1'])
+
+    def test_supabase_deletions_archive_concurrently_and_clear_in_bulk(self):
+        """Archives overlap, real failures keep their link, and a failed bulk clear falls back per record."""
+        import threading
+        service = make_test_sync_service()
+
+        service.supabase.get_deleted_with_notion_id.return_value = [
+            {'id': f'sb-{i}', 'notion_page_id': f'notion-{i}', 'deleted_at': '2025-01-15T10:00:00Z'}
+            for i in range(3)
+        ]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def archive_page(page_id):
+            barrier.wait()
+            if page_id == 'notion-1':
+                raise Exception("500 Internal Server Error")
+            return {'archived': True}
+
+        service.notion.archive_page.side_effect = archive_page
+        service.supabase.clear_notion_page_ids.side_effect = Exception("timeout")
+
+        assert service._sync_supabase_deletions() == 2
+        service.supabase.clear_notion_page_ids.assert_called_once_with(['sb-0', 'sb-2'])
+        assert [c[0][0] for c in service.supabase.clear_notion_page_id.call_args_list] == ['sb-0', 'sb-2']
 
 
 # ============================================================================
@@ -401,7 +633,7 @@ class TestConflictResolution:
         result = service._sync_notion_to_supabase(full_sync=True, since_hours=24)
 
         assert result.stats.updated == 1
-        service.supabase.upsert.assert_called_once()
+        service.supabase.upsert_many.assert_called_once()
 
     def test_supabase_preserved_when_has_local_changes(self):
         """When Supabase has last_sync_source='supabase', Notion should not overwrite."""
@@ -434,6 +666,7 @@ class TestConflictResolution:
 
         assert result.stats.skipped == 1
         service.supabase.upsert.assert_not_called()
+        service.supabase.upsert_many.assert_not_called()
 
 
 # ============================================================================
@@ -475,6 +708,142 @@ class TestBidirectionalSync:
         assert result.metrics.end_time is not None
         assert result.elapsed_seconds >= 0
 
+    def test_noop_full_sync_reads_each_side_once(self):
+        """Phases of one sync() should share the full-table reads when nothing was written."""
+        service = make_test_sync_service()
+
+        service.supabase.select_all.return_value = [
+            {'id': 'sb-1', 'notion_page_id': 'notion-1', 'notion_updated_at': '2025-01-15T10:00:00Z',
+             'last_sync_source': 'notion', 'title': 'Record'}
+        ]
+        service.supabase.get_deleted_with_notion_id.return_value = []
+        service.notion.query_database.return_value = [
+            {'id': 'notion-1', 'last_edited_time': '2025-01-15T10:00:00Z',
+             'properties': {'Name': {'title': [{'plain_text': 'Record'}]}}}
+        ]
+
+        result = service.sync(full_sync=True)
+
+        assert result.success is True
+        assert result.stats.skipped == 1
+        assert service.supabase.select_all.call_count == 1
+        assert service.notion.query_database.call_count == 1
+        assert service._phase_cache is None
+
+    def test_skip_unchanged_returns_before_any_phase(self):
+        """With SKIP_UNCHANGED, an incremental run with nothing pending makes no full reads."""
+        service = make_test_sync_service()
+        service.SKIP_UNCHANGED = True
+        service.notion.count_pages.side_effect = None
+        service.notion.count_pages.return_value = 0
+        service.supabase.count.side_effect = None
+        service.supabase.count.return_value = 0
+
+        result = service.sync(full_sync=False)
+
+        assert result.success is True
+        assert result.stats.created == result.stats.updated == 0
+        assert service.notion.count_pages.call_args.kwargs['limit'] == 1
+        service.supabase.select_all.assert_not_called()
+        service.supabase.select_updated_since.assert_not_called()
+        service.notion.query_database.assert_not_called()
+
+    def test_skip_unchanged_syncs_when_precheck_fails_or_finds_changes(self):
+        """Pending Notion edits, or a failing pre-check, fall through to the normal phases."""
+        service = make_test_sync_service()
+        service.SKIP_UNCHANGED = True
+        service.notion.count_pages.side_effect = None
+        service.notion.count_pages.return_value = 1
+        assert service._has_pending_changes(24) is True
+
+        service.notion.count_pages.return_value = 0
+        service.supabase.count.side_effect = Exception("503")
+        assert service._has_pending_changes(24) is True
+
+    def test_pending_changes_precheck_matches_push_rule(self):
+        """Rows with any other sync source count as pending only if the Supabase → Notion phase would push them."""
+        service = make_test_sync_service()
+        service.notion.count_pages.side_effect = None
+        service.notion.count_pages.return_value = 0
+        service.supabase.count.side_effect = None
+        service.supabase.count.return_value = 0
+        service.supabase.select_linked_active.side_effect = None
+        service.supabase.select_linked_active.return_value = [
+            {'id': 'sb-1', 'notion_page_id': 'n-1', 'last_sync_source': None,
+             'updated_at': '2025-01-01T00:00:00Z', 'notion_updated_at': '2025-01-01T00:00:00Z'},
+        ]
+        assert service._has_pending_changes(24) is False
+
+        # Edited long before the cutoff, but still newer than the Notion copy
+        service.supabase.select_linked_active.return_value.append(
+            {'id': 'sb-2', 'notion_page_id': 'n-2', 'last_sync_source': 'google',
+             'updated_at': '2025-01-02T00:00:00Z', 'notion_updated_at': '2025-01-01T00:00:00Z'}
+        )
+        assert service._has_pending_changes(24) is True
+        filters = service.supabase.select_linked_active.call_args.kwargs['filters']
+        assert filters == {'or': '(last_sync_source.is.null,last_sync_source.not.in.(notion,supabase))'}
+        notion_filter = service.notion.count_pages.call_args.kwargs['filter']
+        assert 'on_or_after' in notion_filter['last_edited_time']
+
+        # Linked but never stamped back from Notion
+        service.supabase.select_linked_active.return_value[1:] = [
+            {'id': 'sb-3', 'notion_page_id': 'n-3', 'last_sync_source': None,
+             'updated_at': '2025-01-01T00:00:00Z', 'notion_updated_at': None}
+        ]
+        assert service._has_pending_changes(24) is True
+
+    def test_incremental_deletion_check_reads_only_linked_ids(self):
+        """Incremental syncs never need the full table, so the deletion check uses a projected query."""
+        service = make_test_sync_service()
+        service.supabase.select_all.return_value = [{'id': 'sb-1', 'notion_page_id': 'notion-1'}]
+        service.supabase.get_deleted_with_notion_id.return_value = []
+        service.supabase.select_updated_since.return_value = []
+        service.notion.query_database.return_value = [{'id': 'notion-1', 'last_edited_time': '2020-01-01T00:00:00Z'}]
+
+        result = service.sync(full_sync=False)
+
+        assert result.success is True
+        service.supabase.select_linked_active.assert_called_once_with()
+        service.supabase.select_all.assert_not_called()
+        service.notion.iter_page_ids.assert_called_once_with('test-db-id')
+
+    def test_notion_id_index_shared_between_phases(self):
+        """Deletion and Notion → Supabase phases should look rows up in the same index."""
+        service = make_test_sync_service()
+        service.supabase.select_all.return_value = [
+            {'id': 'sb-1', 'notion_page_id': 'notion-1'},
+            {'id': 'sb-2', 'notion_page_id': None},
+        ]
+        service._phase_cache = {}
+
+        index = service._supabase_by_notion_id()
+
+        assert index == {'notion-1': {'id': 'sb-1', 'notion_page_id': 'notion-1'}}
+        assert service._supabase_by_notion_id() is index
+        service._invalidate_phase_cache('supabase')
+        assert service._supabase_by_notion_id() is not index
+        assert service.supabase.select_all.call_count == 2
+
+    def test_phase_writes_invalidate_supabase_cache(self):
+        """Rows written by Notion → Supabase must be re-read before Supabase → Notion."""
+        service = make_test_sync_service()
+
+        service.supabase.select_all.return_value = [
+            {'id': 'sb-1', 'notion_page_id': 'notion-1', 'notion_updated_at': '2025-01-14T10:00:00Z',
+             'last_sync_source': 'notion', 'title': 'Old'}
+        ]
+        service.supabase.get_deleted_with_notion_id.return_value = []
+        service.notion.query_database.return_value = [
+            {'id': 'notion-1', 'last_edited_time': '2025-01-15T10:00:00Z',
+             'properties': {'Name': {'title': [{'plain_text': 'New'}]}}}
+        ]
+
+        result = service.sync(full_sync=True)
+
+        assert result.stats.updated == 1
+        assert service.supabase.select_all.call_count == 2
+        assert service.notion.query_database.call_count == 1
+
 
 # ============================================================================
 # Safety Valve in Sync Tests
@@ -519,6 +888,8 @@ class TestSafetyValveInSync:
 
             assert result.success is False
             assert "Safety Valve" in result.error_message
+            # Decided from the count precheck - the table is never downloaded
+            service.supabase.select_all.assert_not_called()
         finally:
             sb.SAFETY_VALVE_MODE = original_mode
 
@@ -618,3 +989,31 @@ class TestFilterRecordsNeedingNotionSync:
         ]
         result = service.filter_records_needing_notion_sync(records)
         assert len(result) == 0
+
+    def test_legacy_records_compared_by_timestamp(self):
+        """Records without last_sync_source fall back to updated_at vs notion_updated_at with a 5s buffer."""
+        service = make_test_sync_service()
+
+        def record(rid, updated_at, notion_updated_at):
+            return {'id': rid, 'title': rid, 'notion_page_id': f'notion-{rid}', 'last_sync_source': None,
+                    'deleted_at': None, 'updated_at': updated_at, 'notion_updated_at': notion_updated_at}
+
+        records = [
+            record('newer', '2025-01-15T10:00:06+00:00', '2025-01-15T10:00:00Z'),
+            record('within-buffer', '2025-01-15T10:00:05Z', '2025-01-15T10:00:00Z'),
+            record('unknown', '2025-01-15T10:00:00Z', None),
+        ]
+        result = service.filter_records_needing_notion_sync(records)
+        assert [r['id'] for r in result] == ['newer']
+
+    def test_push_rule_compares_timestamps_and_pushes_unstamped_rows(self):
+        """The Supabase → Notion phase also pushes linked rows that were never stamped back."""
+        service = make_test_sync_service()
+
+        def record(rid, updated_at, notion_updated_at):
+            return {'id': rid, 'notion_page_id': f'notion-{rid}', 'last_sync_source': 'google',
+                    'updated_at': updated_at, 'notion_updated_at': notion_updated_at}
+
+        assert service._pushes_to_notion(record('newer', '2025-01-15T10:00:06+00:00', '2025-01-15T10:00:00Z'))
+        assert not service._pushes_to_notion(record('buffer', '2025-01-15T10:00:05Z', '2025-01-15T10:00:00Z'))
+        assert service._pushes_to_notion(record('unstamped', '2025-01-15T10:00:00Z', None))